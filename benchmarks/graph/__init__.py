@@ -0,0 +1 @@
+"""Graph traversal benchmark implementation."""
@@ -0,0 +1,140 @@
+"""
+Graph Traversal Benchmark
+
+Measures adjacency memory per edge and k-hop expansion latency of the CSR
+graph on a random graph, and compares with a networkx ``MultiDiGraph`` when
+networkx is installed.
+
+Usage:
+    python -m benchmarks.graph.traversal [--nodes 100000] [--edges 1000000]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from memorable_ai.graph.csr import CSRGraph
+
+logger = logging.getLogger(__name__)
+
+
+class GraphTraversalBenchmark:
+    """Graph traversal benchmark."""
+
+    def __init__(self, nodes: int = 100_000, edges: int = 1_000_000, queries: int = 1000, hops: int = 2):
+        """
+        Initialize benchmark.
+
+        Args:
+            nodes: Number of nodes
+            edges: Number of random edges
+            queries: Number of k-hop queries per graph
+            hops: Hops per query
+        """
+        self.nodes = nodes
+        self.edges = edges
+        self.queries = queries
+        self.hops = hops
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run traversal benchmark.
+
+        Returns:
+            Dictionary with bytes per edge, build time and k-hop latency
+            (microseconds per query) for each graph implementation
+        """
+        rng = np.random.default_rng(0)
+        sources = rng.integers(0, self.nodes, self.edges)
+        targets = rng.integers(0, self.nodes, self.edges)
+        seeds = rng.integers(0, self.nodes, self.queries).tolist()
+
+        results = {"csr": self._csr(sources, targets, seeds)}
+        try:
+            results["networkx"] = self._networkx(sources, targets, seeds)
+        except ImportError:
+            logger.info("networkx not installed, skipping comparison")
+
+        for name, result in results.items():
+            logger.info(
+                f"{name}: {result['bytes_per_edge']:.1f} B/edge, "
+                f"{result['k_hop_us']:.1f}us per {self.hops}-hop query"
+            )
+        return results
+
+    def _csr(self, sources: np.ndarray, targets: np.ndarray, seeds: List[int]) -> Dict[str, Any]:
+        """Build and query a CSRGraph."""
+        graph = CSRGraph(compact_threshold=self.edges + 1)
+        start = time.perf_counter()
+        for node in range(self.nodes):
+            graph.node_id(node)
+        for source, target in zip(sources.tolist(), targets.tolist()):
+            graph.add_edge(source, target, "related_to")
+        graph.compact()
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for seed in seeds:
+            graph.k_hop([seed], self.hops)
+        query = (time.perf_counter() - start) / len(seeds)
+
+        return {
+            "build_s": build,
+            "bytes_per_edge": graph.nbytes / self.edges,
+            "k_hop_us": query * 1e6,
+        }
+
+    def _networkx(self, sources: np.ndarray, targets: np.ndarray, seeds: List[int]) -> Dict[str, Any]:
+        """Build and query a networkx MultiDiGraph (the in-memory backend)."""
+        import networkx as nx
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(range(self.nodes))
+        for source, target in zip(sources.tolist(), targets.tolist()):
+            graph.add_edge(source, target, relationship="related_to")
+        build = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for seed in seeds:
+            seen = {seed}
+            frontier = {seed}
+            for _ in range(self.hops):
+                frontier = {n for node in frontier for n in graph.neighbors(node)} - seen
+                seen |= frontier
+        query = (time.perf_counter() - start) / len(seeds)
+
+        return {
+            "build_s": build,
+            "bytes_per_edge": size / self.edges,
+            "k_hop_us": query * 1e6,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print results as JSON."""
+    parser = argparse.ArgumentParser(description="Memorable graph traversal benchmark")
+    parser.add_argument("--nodes", type=int, default=100_000, help="Number of nodes")
+    parser.add_argument("--edges", type=int, default=1_000_000, help="Number of edges")
+    parser.add_argument("--queries", type=int, default=1000, help="k-hop queries")
+    parser.add_argument("--hops", type=int, default=2, help="Hops per query")
+    args = parser.parse_args(argv)
+
+    results = GraphTraversalBenchmark(
+        nodes=args.nodes, edges=args.edges, queries=args.queries, hops=args.hops
+    ).run()
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
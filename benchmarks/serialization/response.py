@@ -0,0 +1,167 @@
+"""
+Response Serialization Benchmark
+
+Compares the compact response serializer used when storing conversations
+(``serialize_response``) with a full ``model_dump`` plus JSON round-trip of
+the provider response, on synthetic OpenAI- and Anthropic-shaped pydantic
+responses.
+
+Usage:
+    python -m benchmarks.serialization.response [--iterations 2000]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from memorable_ai.utils.helpers import serialize_response
+
+logger = logging.getLogger(__name__)
+
+
+class _Message(BaseModel):
+    role: str = "assistant"
+    content: Optional[str] = None
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+
+
+class _Choice(BaseModel):
+    index: int = 0
+    finish_reason: str = "stop"
+    message: _Message
+    logprobs: Optional[Dict[str, Any]] = None
+
+
+class _ChatCompletion(BaseModel):
+    id: str
+    object: str = "chat.completion"
+    created: int = 0
+    model: str
+    choices: List[_Choice]
+    usage: Dict[str, Any]
+    system_fingerprint: Optional[str] = None
+
+
+class _TextBlock(BaseModel):
+    type: str = "text"
+    text: str
+
+
+class _AnthropicMessage(BaseModel):
+    id: str
+    type: str = "message"
+    role: str = "assistant"
+    model: str
+    content: List[_TextBlock]
+    stop_reason: str = "end_turn"
+    usage: Dict[str, Any]
+
+
+def _legacy(response: Any) -> Dict[str, Any]:
+    """Full dump and JSON round-trip (the previous storage path)."""
+    return json.loads(json.dumps(response.model_dump(), default=str))
+
+
+class ResponseSerializationBenchmark:
+    """
+    Response serialization benchmark.
+
+    Responses carry token logprobs so that the cost of copying fields that
+    are never used shows up in the full-dump baseline.
+    """
+
+    def __init__(self, iterations: int = 2000, tokens: int = 256):
+        """
+        Initialize benchmark.
+
+        Args:
+            iterations: Serializations per response type and serializer
+            tokens: Number of tokens (with logprobs) in each response
+        """
+        self.iterations = iterations
+        self.tokens = tokens
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run serialization benchmark.
+
+        Returns:
+            Dictionary with per-response-type timings (microseconds per call),
+            serialized sizes and speedups
+        """
+        results: Dict[str, Any] = {}
+        for name, response in self._responses().items():
+            legacy = self._time(_legacy, response)
+            compact = self._time(serialize_response, response)
+            results[name] = {
+                "legacy_us": legacy * 1e6,
+                "compact_us": compact * 1e6,
+                "speedup": legacy / compact if compact else float("inf"),
+                "legacy_bytes": len(json.dumps(_legacy(response))),
+                "compact_bytes": len(json.dumps(serialize_response(response))),
+            }
+            logger.info(
+                f"{name}: {legacy * 1e6:.1f}us -> {compact * 1e6:.1f}us "
+                f"({results[name]['speedup']:.1f}x)"
+            )
+        return results
+
+    def _time(self, serializer: Callable[[Any], Any], response: Any) -> float:
+        """Average seconds per call."""
+        start = time.perf_counter()
+        for _ in range(self.iterations):
+            serializer(response)
+        return (time.perf_counter() - start) / self.iterations
+
+    def _responses(self) -> Dict[str, Any]:
+        """Synthetic provider responses."""
+        text = " ".join(f"token{i}" for i in range(self.tokens))
+        logprobs = {
+            "content": [
+                {
+                    "token": f"token{i}",
+                    "logprob": -0.1,
+                    "top_logprobs": [{"token": f"alt{j}", "logprob": -1.0} for j in range(5)],
+                }
+                for i in range(self.tokens)
+            ]
+        }
+        usage = {"prompt_tokens": 1200, "completion_tokens": self.tokens, "total_tokens": 1200 + self.tokens}
+        return {
+            "openai": _ChatCompletion(
+                id="chatcmpl-123",
+                model="gpt-4o-mini",
+                choices=[_Choice(message=_Message(content=text), logprobs=logprobs)],
+                usage=usage,
+                system_fingerprint="fp_123",
+            ),
+            "anthropic": _AnthropicMessage(
+                id="msg_123",
+                model="claude-3-5-sonnet",
+                content=[_TextBlock(text=text)],
+                usage={"input_tokens": 1200, "output_tokens": self.tokens},
+            ),
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print results as JSON."""
+    parser = argparse.ArgumentParser(description="Memorable response serialization benchmark")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per serializer")
+    parser.add_argument("--tokens", type=int, default=256, help="Tokens per response")
+    args = parser.parse_args(argv)
+
+    results = ResponseSerializationBenchmark(
+        iterations=args.iterations, tokens=args.tokens
+    ).run()
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
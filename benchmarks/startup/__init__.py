@@ -0,0 +1 @@
+"""Startup (import time) benchmark implementation."""
@@ -0,0 +1,126 @@
+"""
+Import Time Benchmark
+
+Measures cold-start cost of importing Memorable in a fresh interpreter and
+guards against regressions: the import must stay within a time budget and
+must not pull in heavy optional dependencies.
+
+Usage:
+    python -m benchmarks.startup.import_time [--budget 0.5]
+"""
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Modules that must not be imported by `import memorable_ai` / the CLI parser
+HEAVY_MODULES = [
+    "torch",
+    "sentence_transformers",
+    "sqlalchemy",
+    "networkx",
+    "numpy",
+    "openai",
+    "anthropic",
+    "litellm",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+class ImportTimeBenchmark:
+    """
+    Import-time regression benchmark.
+
+    Each statement is timed in a fresh subprocess, best of ``repeat`` runs.
+    """
+
+    STATEMENTS = {
+        "import memorable_ai": "import memorable_ai",
+        "from memorable_ai import MemoryEngine": "from memorable_ai import MemoryEngine",
+        "cli": "import memorable_ai.cli",
+    }
+
+    def __init__(self, budget: float = 0.5, repeat: int = 3):
+        """
+        Initialize benchmark.
+
+        Args:
+            budget: Maximum allowed import time in seconds per statement
+            repeat: Number of fresh-interpreter runs per statement
+        """
+        self.budget = budget
+        self.repeat = repeat
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run import-time benchmark.
+
+        Returns:
+            Dictionary with per-statement timings, leaked heavy modules and
+            an overall ``passed`` flag
+        """
+        results: Dict[str, Any] = {}
+        passed = True
+
+        for name, statement in self.STATEMENTS.items():
+            timings = []
+            modules: List[str] = []
+            for _ in range(self.repeat):
+                probe = self._probe(statement)
+                timings.append(probe["elapsed"])
+                modules = probe["modules"]
+
+            best = min(timings)
+            heavy = self._heavy_modules(modules)
+            ok = best <= self.budget and not heavy
+            passed = passed and ok
+            results[name] = {"seconds": best, "heavy_modules": heavy, "passed": ok}
+            logger.info(f"{name}: {best * 1000:.1f}ms (heavy: {heavy or 'none'})")
+
+        results["budget"] = self.budget
+        results["passed"] = passed
+        return results
+
+    def _probe(self, statement: str) -> Dict[str, Any]:
+        """Time a statement in a fresh interpreter."""
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    @staticmethod
+    def _heavy_modules(modules: List[str]) -> List[str]:
+        """Return heavy top-level packages present in a module list."""
+        loaded = {m.split(".")[0] for m in modules}
+        return [m for m in HEAVY_MODULES if m in loaded]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and exit non-zero if the budget is exceeded."""
+    parser = argparse.ArgumentParser(description="Memorable import-time benchmark")
+    parser.add_argument("--budget", type=float, default=0.5, help="Budget in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per statement")
+    args = parser.parse_args(argv)
+
+    results = ImportTimeBenchmark(budget=args.budget, repeat=args.repeat).run()
+    print(json.dumps(results, indent=2))
+    return 0 if results["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,9 +12,19 @@ References:
 - Supermemory: https://github.com/supermemoryai/supermemory
 """
 
+from memorable_ai.utils.lazy import lazy_module
+
 __version__ = "0.1.1"
 
-from memorable_ai.core.memory_engine import MemoryEngine
+# Public names are imported on first access (PEP 562) to keep
+# `import memorable_ai` cheap.
+_LAZY_IMPORTS = {
+    "MemoryEngine": "memorable_ai.core.memory_engine",
+    "MemoryEnginePool": "memorable_ai.core.pool",
+    "use_namespace": "memorable_ai.core.pool",
+    "MemorableConfig": "memorable_ai.utils.config",
+}
 
-__all__ = ["MemoryEngine"]
+__all__ = ["MemoryEngine", "MemoryEnginePool", "use_namespace", "MemorableConfig"]
 
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -6,27 +6,70 @@ import argparse
 import asyncio
 import sys
 from typing import Optional
-from memorable_ai import MemoryEngine, MemorableConfig
 
 
-async def cmd_add_memory(args):
-    """Add a memory via CLI."""
+def _open_engine(args):
+    """
+    Create a memory engine for a one-off command.
+    
+    Components are initialized without hooking LLM clients or starting the
+    consolidator, and the engine is imported here so that `--help` and
+    argument errors stay fast.
+    """
+    from memorable_ai.core.memory_engine import MemoryEngine
+
     memory = MemoryEngine(database=args.database, mode=args.mode)
-    memory.enable()
+    memory.initialize()
+    return memory
+
+
+def _connect_daemon(args):
+    """
+    Connect to a running memory daemon serving the same database.
     
-    await memory.add_memory(
-        content=args.content,
-        memory_type=args.type,
-    )
+    Returns:
+        MemoryClient, or None to fall back to an in-process engine
+    """
+    from memorable_ai.utils.config import MemorableConfig
+
+    service = MemorableConfig.from_env().service
+    if args.no_daemon or not service.enabled:
+        return None
+
+    from memorable_ai.service.client import MemoryClient
+    from memorable_ai.utils.helpers import normalize_database_url
+
+    client = MemoryClient.connect(args.socket or service.address, timeout=service.timeout)
+    if client is None:
+        return None
+    if normalize_database_url(client.info.get("database")) != normalize_database_url(args.database):
+        client.close()
+        return None
+    return client
+
+
+async def cmd_add_memory(args):
+    """Add a memory via CLI."""
+    client = _connect_daemon(args)
+    if client:
+        client.add_memory(args.content, memory_type=args.type)
+    else:
+        memory = _open_engine(args)
+        await memory.add_memory(
+            content=args.content,
+            memory_type=args.type,
+        )
     print(f"✓ Added memory: {args.content}")
 
 
 async def cmd_search(args):
     """Search memories via CLI."""
-    memory = MemoryEngine(database=args.database, mode=args.mode)
-    memory.enable()
-    
-    results = await memory.search_memories(args.query, limit=args.limit)
+    client = _connect_daemon(args)
+    if client:
+        results = client.search_memories(args.query, limit=args.limit)
+    else:
+        memory = _open_engine(args)
+        results = await memory.search_memories(args.query, limit=args.limit)
     
     if not results:
         print("No memories found.")
@@ -39,10 +82,11 @@ async def cmd_search(args):
 
 async def cmd_stats(args):
     """Show statistics."""
-    memory = MemoryEngine(database=args.database, mode=args.mode)
-    memory.enable()
-    
-    stats = memory.get_stats()
+    client = _connect_daemon(args)
+    if client:
+        stats = client.get_stats()
+    else:
+        stats = _open_engine(args).get_stats()
     print("\nMemory Engine Statistics:")
     print(f"  Enabled: {stats.get('enabled', False)}")
     print(f"  Mode: {stats.get('mode', 'unknown')}")
@@ -57,6 +101,46 @@ async def cmd_stats(args):
         print(f"  Edges: {graph.get('edges', 0)}")
         print(f"  Entity Nodes: {graph.get('entity_nodes', 0)}")
         print(f"  Memory Nodes: {graph.get('memory_nodes', 0)}")
+        if graph.get("relationships"):
+            print("  Edges by Relationship:")
+            for relationship, count in sorted(graph["relationships"].items()):
+                print(f"    {relationship}: {count}")
+        if "memory_bytes" in graph:
+            print(f"  Memory Usage: ~{graph['memory_bytes'] / 1024 / 1024:.1f} MB")
+
+
+async def cmd_compact(args):
+    """Merge near-identical memories."""
+    memory = _open_engine(args)
+    report = await memory.compact_memories(dry_run=args.dry_run)
+    if report.get("skipped"):
+        print("Another process is consolidating this namespace; try again later.")
+        return
+
+    for merge in report.get("merges", [])[: args.show]:
+        print(f"\n[{merge['id']}] {merge['content']}")
+        for duplicate in merge["duplicates"]:
+            print(f"  <- [{duplicate['id']}] {duplicate['content']}")
+
+    action = "Would merge" if args.dry_run else "Merged"
+    print(
+        f"\n✓ {action} {report.get('duplicates', 0)} memories into "
+        f"{report.get('clusters', 0)} ({report.get('scanned', 0)} scanned)"
+    )
+
+
+async def cmd_serve(args):
+    """Run the memory daemon."""
+    from memorable_ai.core.pool import MemoryEnginePool
+    from memorable_ai.service.server import MemoryServer
+
+    from memorable_ai.utils.config import MemorableConfig
+
+    pool = MemoryEnginePool(database=args.database, mode=args.mode)
+    server = MemoryServer(pool, address=args.socket or MemorableConfig.from_env().service.address)
+    await server.start()
+    print(f"✓ Memory daemon listening on {server.address}")
+    await server.serve_forever()
 
 
 def main():
@@ -72,9 +156,19 @@ def main():
     parser.add_argument(
         "--mode",
         default="auto",
-        choices=["conscious", "auto", "hybrid"],
+        choices=["conscious", "auto", "hybrid", "adaptive"],
         help="Memory mode"
     )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Memory daemon address (unix socket path or tcp://host:port)"
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Do not use a running memory daemon"
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
@@ -101,6 +195,27 @@ def main():
     # Stats command
     stats_parser = subparsers.add_parser("stats", help="Show statistics")
 
+    # Compact command
+    compact_parser = subparsers.add_parser(
+        "compact", help="Merge near-identical memories into canonical ones"
+    )
+    compact_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report the merges that would be made"
+    )
+    compact_parser.add_argument(
+        "--show",
+        type=int,
+        default=20,
+        help="Number of merges to print"
+    )
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a warm memory daemon for the CLI and other processes"
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -114,6 +229,13 @@ def main():
         asyncio.run(cmd_search(args))
     elif args.command == "stats":
         asyncio.run(cmd_stats(args))
+    elif args.command == "compact":
+        asyncio.run(cmd_compact(args))
+    elif args.command == "serve":
+        try:
+            asyncio.run(cmd_serve(args))
+        except KeyboardInterrupt:
+            pass
 
 
 if __name__ == "__main__":
@@ -1,33 +1,32 @@
 """Core memory engine components."""
 
-from memorable_ai.core.memory_engine import MemoryEngine
-from memorable_ai.core.storage import Storage
-from memorable_ai.core.extraction import MemoryExtractor
-from memorable_ai.core.retrieval import HybridRetriever
-from memorable_ai.core.consolidation import MemoryConsolidator
-from memorable_ai.core.temporal import TemporalMemory
-from memorable_ai.core.errors import (
-    MemorableError,
-    StorageError,
-    RetrievalError,
-    ExtractionError,
-    ConfigurationError,
-    InterceptorError,
-    GraphError,
-)
+from memorable_ai.utils.lazy import lazy_module
 
-__all__ = [
-    "MemoryEngine",
-    "Storage",
-    "MemoryExtractor",
-    "HybridRetriever",
-    "MemoryConsolidator",
-    "TemporalMemory",
-    "MemorableError",
-    "StorageError",
-    "RetrievalError",
-    "ExtractionError",
-    "ConfigurationError",
-    "InterceptorError",
-    "GraphError",
-]
+# Components are imported on first access (PEP 562) so that importing one
+# of them does not pull in the dependencies of all the others.
+_LAZY_IMPORTS = {
+    "MemoryEngine": "memorable_ai.core.memory_engine",
+    "MemoryEnginePool": "memorable_ai.core.pool",
+    "use_namespace": "memorable_ai.core.pool",
+    "Storage": "memorable_ai.core.storage",
+    "MemoryExtractor": "memorable_ai.core.extraction",
+    "HybridRetriever": "memorable_ai.core.retrieval",
+    "MemoryConsolidator": "memorable_ai.core.consolidation",
+    "MemoryCompactor": "memorable_ai.core.compaction",
+    "TemporalMemory": "memorable_ai.core.temporal",
+    "LazyEmbeddingModel": "memorable_ai.core.embeddings",
+    "MemorableError": "memorable_ai.core.errors",
+    "StorageError": "memorable_ai.core.errors",
+    "RetrievalError": "memorable_ai.core.errors",
+    "ExtractionError": "memorable_ai.core.errors",
+    "ConfigurationError": "memorable_ai.core.errors",
+    "InterceptorError": "memorable_ai.core.errors",
+    "GraphError": "memorable_ai.core.errors",
+    "ServiceError": "memorable_ai.core.errors",
+    "ServiceUnavailableError": "memorable_ai.core.errors",
+    "ServiceResponseLostError": "memorable_ai.core.errors",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,147 @@
+"""
+Embedding Clustering
+
+Blocking for near-neighbour search over memory embeddings, used by
+consolidation to find duplicate and contradictory memories without
+comparing every pair.
+
+Embeddings are hashed with random-hyperplane LSH: each of ``bands`` bands
+takes the sign bits of ``bits`` random projections, so two vectors land in
+the same bucket of a band with probability ``(1 - angle / pi) ** bits``.
+Memories sharing at least one bucket are candidates; only candidates are
+compared exactly (cosine similarity, batched with numpy) and pairs above a
+threshold are grouped into clusters.
+"""
+
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+
+class EmbeddingLSH:
+    """
+    Random-hyperplane LSH with banding.
+
+    Hyperplanes are drawn from a fixed seed per dimension, so bucket keys
+    are stable across processes and restarts and can be stored.
+    """
+
+    def __init__(self, bands: int = 32, bits: int = 12, seed: int = 0):
+        """
+        Initialize LSH.
+
+        Args:
+            bands: Number of bands (more bands: higher recall, more candidates)
+            bits: Projections per band (more bits: fewer, closer candidates)
+            seed: Random seed of the hyperplanes
+        """
+        if not 1 <= bits <= 24:
+            raise ValueError("bits must be between 1 and 24")
+        self.bands = max(1, bands)
+        self.bits = bits
+        self.seed = seed
+        self._planes: Dict[int, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def _hyperplanes(self, dim: int) -> np.ndarray:
+        """Projection matrix (dim x bands * bits) for a dimension."""
+        planes = self._planes.get(dim)
+        if planes is None:
+            with self._lock:
+                planes = self._planes.get(dim)
+                if planes is None:
+                    rng = np.random.default_rng([self.seed, dim])
+                    planes = rng.standard_normal((dim, self.bands * self.bits)).astype(np.float32)
+                    self._planes[dim] = planes
+        return planes
+
+    def buckets(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Bucket keys of vectors, one per band.
+
+        Keys of different bands never collide (the band index is part of
+        the key), so all keys can share one table column.
+
+        Args:
+            vectors: (n, dim) array
+
+        Returns:
+            (n, bands) int64 array of bucket keys
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        signs = (vectors @ self._hyperplanes(vectors.shape[1])) > 0
+        signs = signs.reshape(len(vectors), self.bands, self.bits)
+        weights = np.left_shift(1, np.arange(self.bits, dtype=np.int64))
+        codes = (signs * weights).sum(axis=2)
+        return codes + (np.arange(self.bands, dtype=np.int64) << self.bits)
+
+
+def normalize(vectors: Any) -> np.ndarray:
+    """Row-normalized float32 matrix (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def similar_pairs(
+    queries: np.ndarray,
+    candidates: np.ndarray,
+    pairs: Sequence[Tuple[int, int]],
+    threshold: float,
+    batch_size: int = 65536,
+) -> List[Tuple[int, int, float]]:
+    """
+    Exact cosine similarity of candidate pairs, keeping those above a threshold.
+
+    Args:
+        queries: Normalized query vectors
+        candidates: Normalized candidate vectors
+        pairs: (query index, candidate index) pairs to compare
+        threshold: Minimum cosine similarity
+        batch_size: Pairs compared per vectorized batch
+
+    Returns:
+        (query index, candidate index, similarity) for similar pairs
+    """
+    result = []
+    for start in range(0, len(pairs), batch_size):
+        batch = np.asarray(pairs[start:start + batch_size], dtype=np.int64)
+        similarity = np.einsum(
+            "ij,ij->i", queries[batch[:, 0]], candidates[batch[:, 1]]
+        )
+        for index in np.flatnonzero(similarity >= threshold).tolist():
+            result.append((int(batch[index, 0]), int(batch[index, 1]), float(similarity[index])))
+    return result
+
+
+def clusters(pairs: Iterable[Tuple[Hashable, Hashable]]) -> List[List[Hashable]]:
+    """
+    Connected components of a set of pairs (union-find).
+
+    Args:
+        pairs: Linked item pairs
+
+    Returns:
+        Clusters of two or more items
+    """
+    parent: Dict[Hashable, Hashable] = {}
+
+    def find(item: Hashable) -> Hashable:
+        root = parent.setdefault(item, item)
+        while root != parent[root]:
+            root = parent[root]
+        while item != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    groups: Dict[Hashable, List[Hashable]] = {}
+    for item in parent:
+        groups.setdefault(find(item), []).append(item)
+    return [group for group in groups.values() if len(group) > 1]
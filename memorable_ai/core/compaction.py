@@ -0,0 +1,264 @@
+"""
+Memory Compaction
+
+Offline job that shrinks a namespace's memory corpus by merging clusters of
+equivalent memories ("lives in Seattle", "Sparsh lives in Seattle", "he
+lives in Seattle now") into one canonical memory.
+
+Candidates are found with the embedding LSH of consolidation
+(``core/clustering.py``) over the whole namespace and verified by exact
+cosine similarity; memories without embeddings are only merged when their
+normalized text is identical. Pairs of different types or of opposite
+polarity (one negated) are never merged.
+"""
+
+import logging
+import os
+import re
+import socket
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from memorable_ai.core.clustering import EmbeddingLSH, clusters, normalize, similar_pairs
+from memorable_ai.core.consolidation import is_negated
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+
+def _text_key(memory: Dict[str, Any]) -> str:
+    """Memory content with case, punctuation and spacing normalized."""
+    content = _NON_WORD.sub(" ", memory.get("content", "").lower())
+    return " ".join(content.split())
+
+
+def _negated(memory: Dict[str, Any]) -> bool:
+    return is_negated(memory.get("content", ""))
+
+
+class MemoryCompactor:
+    """
+    Merges clusters of near-identical memories of one storage namespace.
+
+    The canonical memory of a cluster is the most important one (then the
+    most accessed, then the longest); it gets the summed access count, the
+    highest importance and the union of all metadata, graph links of the
+    other members are redirected to it, and the other members are deleted.
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        graph: Optional[Any] = None,
+        threshold: float = 0.95,
+        lsh: Optional[EmbeddingLSH] = None,
+        max_bucket: int = 256,
+        batch_size: int = 500,
+        scan_size: int = 5000,
+        lease_ttl: float = 300.0,
+    ):
+        """
+        Initialize memory compactor.
+
+        Args:
+            storage: Storage instance (bound to the namespace to compact)
+            graph: Optional graph whose memory links are redirected
+            threshold: Minimum cosine similarity of memories to merge
+            lsh: LSH used for blocking (default: 32 bands of 12 bits)
+            max_bucket: LSH buckets larger than this are compared against
+                their first member only, instead of pairwise
+            batch_size: Clusters merged per transaction
+            scan_size: Memories read per storage page
+            lease_ttl: Seconds the namespace's consolidation lease is held
+                without renewal
+        """
+        self.storage = storage
+        self.graph = graph
+        self.threshold = threshold
+        self.lsh = lsh or EmbeddingLSH()
+        self.max_bucket = max(2, max_bucket)
+        self.batch_size = batch_size
+        self.scan_size = scan_size
+        self.lease_ttl = lease_ttl
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:compaction:{uuid.uuid4().hex[:8]}"
+
+    async def compact(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Find and merge clusters of equivalent memories.
+
+        The namespace's consolidation lease is held for the whole run, so
+        compaction never races a consolidation pass.
+
+        Args:
+            dry_run: Only report the merges that would be made
+
+        Returns:
+            Report with the number of memories scanned, clusters found and
+            memories removed, and each planned merge (canonical memory and
+            duplicates)
+        """
+        report: Dict[str, Any] = {
+            "namespace": self.storage.namespace,
+            "dry_run": dry_run,
+            "scanned": 0,
+            "clusters": 0,
+            "duplicates": 0,
+            "removed": 0,
+            "merges": [],
+        }
+        if not self.storage.acquire_lease(self.owner, self.lease_ttl):
+            logger.info("Consolidation lease held by another process, skipping compaction")
+            report["skipped"] = True
+            return report
+
+        try:
+            memories = await self._scan()
+            report["scanned"] = len(memories)
+            plans = [self._plan(cluster) for cluster in self._clusters(memories)]
+            report["clusters"] = len(plans)
+            report["duplicates"] = sum(len(plan["duplicates"]) for plan in plans)
+            report["merges"] = [
+                {
+                    "id": plan["id"],
+                    "content": plan["content"],
+                    "duplicates": [
+                        {"id": member["id"], "content": member["content"]}
+                        for member in plan["members"]
+                    ],
+                }
+                for plan in plans
+            ]
+            if dry_run:
+                return report
+
+            for start in range(0, len(plans), self.batch_size):
+                batch = plans[start:start + self.batch_size]
+                report["removed"] += await self.storage.merge_memories(batch)
+                if self.graph is not None:
+                    await self.graph.merge_memories(
+                        {
+                            duplicate: plan["id"]
+                            for plan in batch
+                            for duplicate in plan["duplicates"]
+                        },
+                        {plan["id"]: plan for plan in batch},
+                    )
+                self.storage.acquire_lease(self.owner, self.lease_ttl)
+
+            logger.info(
+                f"Compaction merged {report['removed']} memories into {len(plans)} canonical ones"
+            )
+            return report
+        finally:
+            self.storage.release_lease(self.owner)
+
+    async def _scan(self) -> List[Dict[str, Any]]:
+        """All memories of the namespace, in ID order."""
+        memories: List[Dict[str, Any]] = []
+        after_id = 0
+        while True:
+            page = await self.storage.scan_memories(after_id=after_id, limit=self.scan_size)
+            memories.extend(page)
+            if len(page) < self.scan_size:
+                return memories
+            after_id = page[-1]["id"]
+
+    def _clusters(self, memories: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Clusters of equivalent memories."""
+        pairs: List[Tuple[int, int]] = []
+
+        # Identical normalized text
+        by_text: Dict[Tuple[str, str], int] = {}
+        for index, memory in enumerate(memories):
+            key = (memory.get("type", "fact"), _text_key(memory))
+            if key[1]:
+                first = by_text.setdefault(key, index)
+                if first != index:
+                    pairs.append((first, index))
+
+        # Similar embeddings, blocked per dimension
+        by_dimension: Dict[int, List[int]] = {}
+        for index, memory in enumerate(memories):
+            if memory.get("embedding"):
+                by_dimension.setdefault(len(memory["embedding"]), []).append(index)
+        for indices in by_dimension.values():
+            if len(indices) < 2:
+                continue
+            vectors = normalize([memories[index]["embedding"] for index in indices])
+            candidates = self._candidate_pairs(self.lsh.buckets(vectors))
+            for i, j, _ in similar_pairs(vectors, vectors, candidates, self.threshold):
+                pairs.append((indices[i], indices[j]))
+
+        pairs = [
+            (i, j)
+            for i, j in pairs
+            if memories[i].get("type") == memories[j].get("type")
+            and _negated(memories[i]) == _negated(memories[j])
+        ]
+        return [[memories[index] for index in sorted(group)] for group in clusters(pairs)]
+
+    def _candidate_pairs(self, buckets: np.ndarray) -> List[Tuple[int, int]]:
+        """Index pairs sharing an LSH bucket (deduplicated)."""
+        n = len(buckets)
+        keys = []
+        for band in range(buckets.shape[1]):
+            order = np.argsort(buckets[:, band], kind="stable")
+            codes = buckets[order, band]
+            starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+            ends = np.r_[starts[1:], n]
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                if end - start < 2:
+                    continue
+                members = order[start:end]
+                if end - start > self.max_bucket:
+                    # Star around the first member instead of all pairs
+                    a, b = np.full(len(members) - 1, members[0]), members[1:]
+                else:
+                    a, b = np.triu_indices(len(members), k=1)
+                    a, b = members[a], members[b]
+                keys.append(np.minimum(a, b) * n + np.maximum(a, b))
+        if not keys:
+            return []
+        unique = np.unique(np.concatenate(keys))
+        return list(zip((unique // n).tolist(), (unique % n).tolist()))
+
+    @staticmethod
+    def _plan(cluster: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge of a cluster into its canonical memory."""
+        canonical = max(
+            cluster,
+            key=lambda m: (
+                m.get("importance_score") or 0.0,
+                m.get("access_count") or 0,
+                len(m.get("content", "")),
+                -m["id"],
+            ),
+        )
+        members = [m for m in cluster if m["id"] != canonical["id"]]
+
+        metadata: Dict[str, Any] = {}
+        for memory in members + [canonical]:
+            for key, value in (memory.get("metadata") or {}).items():
+                previous = metadata.get(key)
+                if isinstance(previous, list) and isinstance(value, list):
+                    metadata[key] = previous + [item for item in value if item not in previous]
+                else:
+                    # The canonical memory's values win
+                    metadata[key] = value
+        merged = set(metadata.get("merged_ids") or [])
+        merged.update(m["id"] for m in members)
+        metadata["merged_ids"] = sorted(merged)
+
+        return {
+            "id": canonical["id"],
+            "content": canonical["content"],
+            "type": canonical.get("type", "fact"),
+            "duplicates": [m["id"] for m in members],
+            "members": members,
+            "access_count": sum(m.get("access_count") or 0 for m in cluster),
+            "importance_score": max(m.get("importance_score") or 0.0 for m in cluster),
+            "metadata": metadata,
+        }
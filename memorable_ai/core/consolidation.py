@@ -10,11 +10,40 @@ arXiv:2504.19413 (April 2025)
 
 import logging
 import asyncio
+import os
+import re
+import socket
+import uuid
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from memorable_ai.core.clustering import EmbeddingLSH, clusters, normalize, similar_pairs
+from memorable_ai.core.storage import TYPE_WEIGHTS
 
 logger = logging.getLogger(__name__)
 
+# Words marking a negative and a positive statement. Negation is matched on
+# whole words, together with "n't" contractions (isn't, can't, won't, ...)
+# and "no longer"
+NEGATION_WORDS = {
+    "not", "never", "cannot", "neither", "nor",
+    "dont", "doesnt", "didnt", "isnt", "wasnt", "arent", "werent",
+    "hate", "hates", "hated", "dislike", "dislikes", "disliked",
+}
+NEGATION_PHRASES = [("no", "longer")]
+POSITIVE_WORDS = ["like", "love", "prefer", "enjoy"]
+
+_WORD = re.compile(r"[a-z]+(?:'[a-z]+)*")
+
+
+def is_negated(content: str) -> bool:
+    """Whether a memory's content is a negative statement."""
+    words = _WORD.findall(content.lower().replace("\u2019", "'"))
+    if any(word in NEGATION_WORDS or word.endswith("n't") for word in words):
+        return True
+    return any(phrase in zip(words, words[1:]) for phrase in NEGATION_PHRASES)
+
 
 class MemoryConsolidator:
     """
@@ -22,12 +51,48 @@ class MemoryConsolidator:
     
     Analyzes memory patterns and promotes important memories from
     short-term to long-term storage.
+    
+    Each pass only processes memories created or updated since the previous
+    one: a per-namespace (updated_at, id) watermark is kept in storage, so
+    the work per cycle follows the write rate rather than the corpus size.
+    Time decay is not written back; storage applies it when reading.
+    
+    Contradictions and duplicates are searched among embedding neighbours:
+    LSH bucket keys of each changed memory are stored alongside it, memories
+    sharing buckets are compared exactly, and only pairs above the
+    similarity threshold are checked for negation. Memories without
+    embeddings fall back to grouping by their first words.
+    
+    Several processes may run a consolidator against one database: a pass
+    over a namespace first takes that namespace's lease in storage and
+    renews it before every batch, and other processes skip the namespace
+    while the lease is held. A holder that dies stops renewing, so its lease
+    expires after ``lease_ttl`` and the next pass elsewhere resumes from the
+    persisted watermark.
+    
+    After the changed memories, a pass archives the namespace's cold
+    memories (low stored importance and idle for ``archive_after_days``,
+    then the least important beyond its hot tier size), so retrieval only
+    scans the working set. Archived memories are promoted back when they
+    are mentioned again or found by an explicit search.
     """
 
     def __init__(
         self,
         storage: Any,
         interval: int = 21600,  # 6 hours default
+        namespaces: Optional[Callable[[], List[Optional[str]]]] = None,
+        batch_size: int = 1000,
+        settle: float = 60.0,
+        similarity_threshold: float = 0.8,
+        duplicate_threshold: float = 0.95,
+        max_candidates: int = 64,
+        lsh: Optional[EmbeddingLSH] = None,
+        lease_ttl: float = 300.0,
+        archive_importance: float = 0.1,
+        archive_after_days: float = 0.0,
+        hot_tier_size: int = 0,
+        hot_tier_sizes: Optional[Dict[str, int]] = None,
     ):
         """
         Initialize memory consolidator.
@@ -35,9 +100,51 @@ class MemoryConsolidator:
         Args:
             storage: Storage instance
             interval: Consolidation interval in seconds (default: 6 hours)
+            namespaces: Optional callable listing namespaces to consolidate,
+                each through its own storage view (used by engine pools)
+            batch_size: Changed memories processed per batch
+            settle: Seconds a change must be old before it is processed, so
+                that writes committed late are not skipped by the watermark
+            similarity_threshold: Minimum cosine similarity of two memories
+                to be checked for contradiction
+            duplicate_threshold: Minimum cosine similarity of two memories
+                to be treated as duplicates
+            max_candidates: Most LSH neighbours compared per memory
+            lsh: LSH used for blocking (default: 32 bands of 12 bits)
+            lease_ttl: Seconds a namespace lease stays valid without renewal
+                (must exceed the time to process one batch)
+            archive_importance: Stored importance below which idle memories
+                are archived
+            archive_after_days: Days without access after which a memory of
+                low importance is archived (0 disables)
+            hot_tier_size: Maximum memories kept hot per namespace (0 = unlimited)
+            hot_tier_sizes: Per-namespace overrides of ``hot_tier_size``
         """
         self.storage = storage
         self.interval = interval
+        self.namespaces = namespaces
+        self.batch_size = batch_size
+        self.settle = settle
+        self.similarity_threshold = similarity_threshold
+        self.duplicate_threshold = duplicate_threshold
+        self.max_candidates = max_candidates
+        self.lsh = lsh or EmbeddingLSH()
+        self.lease_ttl = lease_ttl
+        self.archive_importance = archive_importance
+        self.archive_after_days = archive_after_days
+        self.hot_tier_size = hot_tier_size
+        self.hot_tier_sizes = hot_tier_sizes or {}
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.duplicate_clusters: List[List[int]] = []
+        self.stats = {
+            "runs": 0,
+            "processed": 0,
+            "compared_pairs": 0,
+            "contradictions": 0,
+            "duplicate_clusters": 0,
+            "skipped_leased": 0,
+            "archived": 0,
+        }
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -84,34 +191,104 @@ class MemoryConsolidator:
         - Removes outdated memories
         """
         logger.debug("Starting memory consolidation...")
+        self.stats["runs"] += 1
 
-        try:
-            # Get all memories
-            memories = await self.storage.get_memories(limit=10000)
-
-            # 1. Update importance scores based on access patterns
-            await self._update_importance_scores(memories)
+        if self.namespaces is None:
+            await self._consolidate_storage(self.storage)
+            return
 
-            # 2. Detect and resolve contradictions
-            await self._resolve_contradictions(memories)
+        for namespace in self.namespaces():
+            await self._consolidate_storage(self.storage.for_namespace(namespace))
 
-            # 3. Remove outdated memories (optional - can be configured)
-            # await self._remove_outdated(memories)
+    async def _consolidate_storage(self, storage: Any):
+        """Consolidate the memories of a single storage namespace changed since the last pass."""
+        if not storage.acquire_lease(self.owner, self.lease_ttl):
+            logger.debug("Consolidation lease held by another process, skipping namespace")
+            self.stats["skipped_leased"] += 1
+            return
 
-            logger.debug(f"Consolidation complete: {len(memories)} memories processed")
+        try:
+            watermark = storage.get_consolidation_watermark()
+            until = datetime.utcnow() - timedelta(seconds=self.settle)
+            processed = 0
+            duplicates: List[Tuple[int, int]] = []
+            while True:
+                # Memories created or touched since the watermark
+                memories = await storage.get_changed_memories(
+                    since=watermark, until=until, limit=self.batch_size
+                )
+                if not memories:
+                    break
+
+                # 1. Update importance scores based on access patterns
+                scores = self._importance_scores(memories)
+
+                # 2. Detect and resolve contradictions (demoting the new scores);
+                # all scores are then written with one bulk update
+                duplicates.extend(await self._resolve_contradictions(memories, storage, scores))
+                if scores:
+                    await storage.bulk_update_importance(scores.items())
+
+                # 3. Remove outdated memories (optional - can be configured)
+                # await self._remove_outdated(memories, storage)
+
+                # Importance updates leave updated_at alone, so they are not
+                # picked up again by the next pass
+                last = memories[-1]
+                watermark = (last["updated_at"], last["id"])
+                storage.set_consolidation_watermark(*watermark)
+                processed += len(memories)
+                if len(memories) < self.batch_size:
+                    break
+
+                # Heartbeat: renew before the next batch, stop if the lease was lost
+                if not storage.acquire_lease(self.owner, self.lease_ttl):
+                    logger.warning("Consolidation lease lost, stopping pass")
+                    break
+
+            # 4. Move cold memories out of the hot tier
+            await self._archive(storage)
+
+            self.duplicate_clusters = clusters(duplicates)
+            self.stats["processed"] += processed
+            self.stats["duplicate_clusters"] += len(self.duplicate_clusters)
+            logger.debug(f"Consolidation complete: {processed} changed memories processed")
         except Exception as e:
             logger.error(f"Consolidation failed: {e}")
+        finally:
+            storage.release_lease(self.owner)
 
-    async def _update_importance_scores(self, memories: List[Dict[str, Any]]):
+    async def _archive(self, storage: Any):
+        """Archive the cold memories of a storage namespace."""
+        hot_size = self.hot_tier_sizes.get(storage.namespace or "", self.hot_tier_size)
+        if self.archive_after_days <= 0 and hot_size <= 0:
+            return
+
+        idle_before = None
+        if self.archive_after_days > 0:
+            idle_before = datetime.utcnow() - timedelta(days=self.archive_after_days)
+        self.stats["archived"] += await storage.archive_memories(
+            max_importance=self.archive_importance,
+            idle_before=idle_before,
+            hot_size=hot_size,
+        )
+
+    def _importance_scores(self, memories: List[Dict[str, Any]]) -> Dict[Any, float]:
         """
-        Update importance scores based on access patterns.
+        New importance scores based on access patterns.
         
         Factors:
         - Access frequency
-        - Recency
         - Memory type
         - Relationships (if graph enabled)
+        
+        Recency is not part of the stored score; storage adds it when
+        memories are read (``effective_importance``).
+        
+        Returns:
+            Memory ID -> importance score
         """
+        scores: Dict[Any, float] = {}
         for memory in memories:
             memory_id = memory.get("id")
             if not memory_id:
@@ -122,81 +299,180 @@ class MemoryConsolidator:
             base_score = memory.get("importance_score", 0.0)
 
             # Factor in access count (if available)
-            access_count = memory.get("metadata", {}).get("access_count", 0)
+            access_count = max(
+                memory.get("access_count", 0),
+                memory.get("metadata", {}).get("access_count", 0),
+            )
             access_bonus = min(access_count * 0.1, 1.0)  # Cap at 1.0
 
-            # Factor in recency
-            created_at = memory.get("created_at")
-            if created_at:
-                try:
-                    created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    age_days = (datetime.now(created.tzinfo) - created).days
-                    recency_factor = max(1.0 - (age_days / 365.0), 0.0)  # Decay over 1 year
-                except Exception:
-                    recency_factor = 0.5
-            else:
-                recency_factor = 0.5
-
             # Memory type weights
-            type_weights = {
-                "preference": 1.2,
-                "skill": 1.1,
-                "fact": 1.0,
-                "rule": 1.3,
-                "context": 0.8,
-            }
             memory_type = memory.get("type", "fact")
-            type_weight = type_weights.get(memory_type, 1.0)
+            type_weight = TYPE_WEIGHTS.get(memory_type, 1.0)
 
-            # Calculate new importance score
-            new_score = (base_score * 0.5) + (access_bonus * 0.3) + (recency_factor * 0.2)
+            # Calculate new importance score (the 0.2 recency share is added at read time)
+            new_score = (base_score * 0.5) + (access_bonus * 0.3)
             new_score *= type_weight
 
-            # Update in storage
-            await self.storage.update_memory_importance(memory_id, new_score)
+            scores[memory_id] = new_score
+
+        return scores
 
-    async def _resolve_contradictions(self, memories: List[Dict[str, Any]]):
+    async def _resolve_contradictions(
+        self, memories: List[Dict[str, Any]], storage: Any, scores: Dict[Any, float]
+    ) -> List[Tuple[int, int]]:
         """
         Detect and resolve contradictory memories.
         
+        The given (changed) memories are compared with their neighbours:
+        memories with embeddings with similar stored memories found through
+        LSH buckets, the others with stored memories sharing their first
+        words. Pairs of two unchanged memories were already checked by an
+        earlier pass.
+        
         Strategies:
         - Keep more recent memory
         - Keep memory with higher importance
         - Flag for user confirmation (future enhancement)
+        
+        Demotions are added to ``scores`` (the caller writes them): half of
+        the memory's new score, or of its stored score if it has none.
+        
+        Returns:
+            ID pairs of near-duplicate memories (not contradictory)
         """
-        # Group memories by content similarity
-        memory_groups: Dict[str, List[Dict[str, Any]]] = {}
-
+        embedded = [m for m in memories if m.get("id") and m.get("embedding")]
+        plain = [m for m in memories if m.get("id") and not m.get("embedding")]
+
+        pairs = await self._similar_pairs(embedded, storage) if embedded else []
+        if plain:
+            pairs.extend(await self._prefix_pairs(plain, storage))
+        self.stats["compared_pairs"] += len(pairs)
+
+        demotions: Dict[Any, float] = {}
+        duplicates = []
+        for mem1, mem2, similarity in pairs:
+            if self._are_contradictory(mem1, mem2):
+                # Resolve: keep more recent or more important
+                resolved = self._resolve_contradiction(mem1, mem2)
+                if resolved:
+                    # Demote the other instead of deleting it (safer)
+                    other = mem2 if resolved == mem1 else mem1
+                    score = scores.get(other["id"], other.get("importance_score", 0.0))
+                    demotions.setdefault(other["id"], score * 0.5)
+            elif similarity is not None and similarity >= self.duplicate_threshold:
+                duplicates.append((mem1["id"], mem2["id"]))
+
+        self.stats["contradictions"] += len(demotions)
+        scores.update(demotions)
+        return duplicates
+
+    async def _similar_pairs(
+        self, memories: List[Dict[str, Any]], storage: Any
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+        """
+        Pairs of a changed memory and a stored memory with similar embeddings.
+        
+        The changed memories' LSH buckets are stored first, so each memory
+        enters the index once, when it passes the watermark. Candidates are
+        the memories sharing the most buckets with a changed memory (up to
+        ``max_candidates``); they are compared exactly in one vectorized batch.
+        """
+        # Vectors of different dimensions (model changes) are blocked separately
+        by_dimension: Dict[int, List[Dict[str, Any]]] = {}
         for memory in memories:
+            by_dimension.setdefault(len(memory["embedding"]), []).append(memory)
+
+        pairs = []
+        for dimension, group in by_dimension.items():
+            vectors = normalize([memory["embedding"] for memory in group])
+            buckets = self.lsh.buckets(vectors).tolist()
+            storage.store_signatures(
+                {memory["id"]: row for memory, row in zip(group, buckets)}
+            )
+
+            members: Dict[int, List[int]] = {}
+            for bucket, memory_id in storage.find_signature_matches(
+                bucket for row in buckets for bucket in row
+            ):
+                members.setdefault(bucket, []).append(memory_id)
+
+            # Rank neighbours by number of shared buckets
+            neighbours = []
+            for memory, row in zip(group, buckets):
+                shared = Counter(
+                    other
+                    for bucket in row
+                    for other in members.get(bucket, ())
+                    if other != memory["id"]
+                )
+                neighbours.append([other for other, _ in shared.most_common(self.max_candidates)])
+
+            changed = {memory["id"]: index for index, memory in enumerate(group)}
+            missing = {other for ids in neighbours for other in ids if other not in changed}
+            stored = [
+                memory
+                for memory in await storage.get_memories_by_ids(missing)
+                if memory.get("embedding") and len(memory["embedding"]) == dimension
+            ]
+            candidates = group + stored
+            index = {memory["id"]: i for i, memory in enumerate(candidates)}
+            matrix = (
+                normalize([memory["embedding"] for memory in candidates])
+                if stored else vectors
+            )
+
+            candidate_pairs = []
+            compared = set()
+            for query, ids in enumerate(neighbours):
+                memory_id = group[query]["id"]
+                for other in ids:
+                    # A pair of two changed memories is compared once
+                    key = (min(memory_id, other), max(memory_id, other))
+                    if other in index and key not in compared:
+                        compared.add(key)
+                        candidate_pairs.append((query, index[other]))
+
+            for query, candidate, similarity in similar_pairs(
+                vectors, matrix, candidate_pairs, self.similarity_threshold
+            ):
+                pairs.append((group[query], candidates[candidate], similarity))
+        return pairs
+
+    async def _prefix_pairs(
+        self, memories: List[Dict[str, Any]], storage: Any
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any], None]]:
+        """Pairs of a changed memory without embedding and a memory sharing its first words."""
+        changed = {memory.get("id") for memory in memories}
+
+        def group_key(memory: Dict[str, Any]) -> str:
             content = memory.get("content", "").lower().strip()
-            # Simple grouping by first few words (can be enhanced with semantic similarity)
-            key = " ".join(content.split()[:3]) if content else ""
-            if key:
-                if key not in memory_groups:
-                    memory_groups[key] = []
-                memory_groups[key].append(memory)
-
-        # Check for contradictions in each group
-        for key, group in memory_groups.items():
-            if len(group) < 2:
+            return " ".join(content.split()[:3]) if content else ""
+
+        keys = {group_key(memory) for memory in memories} - {""}
+        candidates = await storage.get_memories_by_prefix(keys) if keys else []
+
+        # Group memories by content similarity
+        memory_groups: Dict[str, List[Dict[str, Any]]] = {}
+        seen = set()
+        for memory in list(memories) + candidates:
+            if memory.get("id") in seen:
                 continue
+            seen.add(memory.get("id"))
+            key = group_key(memory)
+            if key in keys:
+                memory_groups.setdefault(key, []).append(memory)
 
-            # Look for contradictory statements
-            # Simple heuristic: check for negation patterns
+        pairs = []
+        for group in memory_groups.values():
             for i, mem1 in enumerate(group):
                 for mem2 in group[i + 1:]:
-                    if self._are_contradictory(mem1, mem2):
-                        # Resolve: keep more recent or more important
-                        resolved = self._resolve_contradiction(mem1, mem2)
-                        if resolved:
-                            # Mark the other for deletion or demotion
-                            other = mem2 if resolved == mem1 else mem1
-                            other_id = other.get("id")
-                            if other_id:
-                                # Demote instead of delete (safer)
-                                await self.storage.update_memory_importance(
-                                    other_id, other.get("importance_score", 0.0) * 0.5
-                                )
+                    if mem1.get("id") in changed or mem2.get("id") in changed:
+                        pairs.append((mem1, mem2, None))
+        return pairs
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Consolidation counters (cumulative since start)."""
+        return dict(self.stats)
 
     def _are_contradictory(
         self, mem1: Dict[str, Any], mem2: Dict[str, Any]
@@ -211,13 +487,10 @@ class MemoryConsolidator:
         content2 = mem2.get("content", "").lower()
 
         # Check for explicit contradictions
-        negation_words = ["don't", "do not", "never", "not", "hate", "dislike"]
-        positive_words = ["like", "love", "prefer", "enjoy"]
-
-        has_negation1 = any(word in content1 for word in negation_words)
-        has_negation2 = any(word in content2 for word in negation_words)
-        has_positive1 = any(word in content1 for word in positive_words)
-        has_positive2 = any(word in content2 for word in positive_words)
+        has_negation1 = is_negated(content1)
+        has_negation2 = is_negated(content2)
+        has_positive1 = any(word in content1 for word in POSITIVE_WORDS)
+        has_positive2 = any(word in content2 for word in POSITIVE_WORDS)
 
         # If one has negation and other has positive, might be contradictory
         if (has_negation1 and has_positive2) or (has_negation2 and has_positive1):
@@ -265,7 +538,9 @@ class MemoryConsolidator:
         # Can't decide
         return None
 
-    async def _remove_outdated(self, memories: List[Dict[str, Any]]):
+    async def _remove_outdated(
+        self, memories: List[Dict[str, Any]], storage: Optional[Any] = None
+    ):
         """
         Remove outdated memories (optional).
         
@@ -286,7 +561,7 @@ class MemoryConsolidator:
                     # Very old and low importance - can be removed
                     memory_id = memory.get("id")
                     if memory_id:
-                        await self.storage.delete_memory(memory_id)
+                        await (storage or self.storage).delete_memory(memory_id)
                         logger.debug(f"Removed outdated memory: {memory_id}")
             except Exception:
                 pass
@@ -0,0 +1,79 @@
+"""
+Lazy Embedding Model
+
+Defers importing sentence-transformers (and torch) until an embedding is
+first needed, so importing Memorable and enabling an engine stay cheap.
+"""
+
+import logging
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyEmbeddingModel:
+    """
+    Proxy for a SentenceTransformer model that loads on first use.
+
+    Truthiness reports whether the model could be loaded, so callers can keep
+    using ``if embedding_model:`` checks before encoding.
+    """
+
+    def __init__(self, model_name: str):
+        """
+        Initialize lazy embedding model.
+
+        Args:
+            model_name: sentence-transformers model name or path
+        """
+        self.name_or_path = model_name
+        self._model: Optional[Any] = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the underlying model has been loaded."""
+        return self._model is not None
+
+    def load(self) -> Optional[Any]:
+        """
+        Load the underlying model (once).
+
+        Returns:
+            SentenceTransformer instance, or None if it could not be loaded
+        """
+        if self._model is not None or self._failed:
+            return self._model
+
+        with self._lock:
+            if self._model is None and not self._failed:
+                try:
+                    from sentence_transformers import SentenceTransformer
+
+                    self._model = SentenceTransformer(self.name_or_path)
+                    logger.info(f"Loaded embedding model: {self.name_or_path}")
+                except Exception as e:
+                    logger.warning(f"Failed to load embedding model: {e}")
+                    self._failed = True
+        return self._model
+
+    def encode(self, sentences: Any, **kwargs) -> Any:
+        """
+        Encode text with the underlying model.
+
+        Args:
+            sentences: Text or list of texts
+            **kwargs: Passed to SentenceTransformer.encode
+
+        Returns:
+            Embedding array
+        """
+        model = self.load()
+        if model is None:
+            raise RuntimeError(f"Embedding model not available: {self.name_or_path}")
+        return model.encode(sentences, **kwargs)
+
+    def __bool__(self) -> bool:
+        return self.load() is not None
@@ -44,3 +44,21 @@ class GraphError(MemorableError):
 
     pass
 
+
+
+class ServiceError(MemorableError):
+    """Memory service (daemon/client) errors."""
+
+    pass
+
+
+class ServiceUnavailableError(ServiceError):
+    """Memory daemon unreachable or connection lost (as opposed to a failed request)."""
+
+    pass
+
+
+class ServiceResponseLostError(ServiceUnavailableError):
+    """Request sent to the memory daemon but no response received (it may have run)."""
+
+    pass
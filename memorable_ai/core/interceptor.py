@@ -68,7 +68,9 @@ class LLMInterceptor:
 
                 @functools.wraps(original_create)
                 def sync_wrapper(*args, **kwargs):
-                    return self._intercept_call_sync(original_create, *args, **kwargs)
+                    return self._intercept_call_sync(
+                        original_create, *args, provider="openai", **kwargs
+                    )
 
                 # Replace with wrapper
                 OpenAI.chat.completions.create = sync_wrapper
@@ -87,7 +89,9 @@ class LLMInterceptor:
 
                 @functools.wraps(original_create)
                 def sync_wrapper(*args, **kwargs):
-                    return self._intercept_call_sync(original_create, *args, **kwargs)
+                    return self._intercept_call_sync(
+                        original_create, *args, provider="anthropic", **kwargs
+                    )
 
                 Anthropic.messages.create = sync_wrapper
                 self._original_methods["anthropic.messages.create"] = original_create
@@ -105,7 +109,9 @@ class LLMInterceptor:
 
             @functools.wraps(original_completion)
             def sync_wrapper(*args, **kwargs):
-                return self._intercept_call_sync(original_completion, *args, **kwargs)
+                return self._intercept_call_sync(
+                    original_completion, *args, provider="litellm", **kwargs
+                )
 
             litellm.completion = sync_wrapper
             self._original_methods["litellm.completion"] = original_completion
@@ -143,13 +149,16 @@ class LLMInterceptor:
             except ImportError:
                 pass
 
-    def _intercept_call_sync(self, original_func: Callable, *args, **kwargs):
+    def _intercept_call_sync(
+        self, original_func: Callable, *args, provider: Optional[str] = None, **kwargs
+    ):
         """
         Intercept sync LLM call: inject context, call LLM, store response.
         
         Args:
             original_func: Original LLM function to call
             *args: Positional arguments
+            provider: Hooked provider ('openai', 'anthropic' or 'litellm')
             **kwargs: Keyword arguments (messages, etc.)
             
         Returns:
@@ -164,13 +173,24 @@ class LLMInterceptor:
         # Pre-call: Retrieve relevant memories and inject context
         if messages and self.memory_engine:
             try:
-                enhanced_messages = self.memory_engine._inject_context_sync(messages)
+                # LiteLLM passes cache_control blocks through to Anthropic models
+                context_provider = provider
+                if provider == "litellm" and self._is_anthropic_model(kwargs.get("model")):
+                    context_provider = "anthropic"
+
+                enhanced_messages = self.memory_engine._inject_context_sync(
+                    messages, provider=context_provider
+                )
                 if enhanced_messages and len(enhanced_messages) > len(messages):
                     logger.info(f"Context injected: {len(enhanced_messages)} messages (original: {len(messages)})")
                     if enhanced_messages[0].get("role") == "system":
-                        context_preview = enhanced_messages[0].get("content", "")[:200]
+                        context_preview = str(enhanced_messages[0].get("content", ""))[:200]
                         logger.debug(f"Injected context preview: {context_preview}...")
-                    kwargs["messages"] = enhanced_messages
+                    if provider == "anthropic":
+                        # The Messages API takes system prompts as a parameter
+                        self._apply_anthropic_system(kwargs, enhanced_messages)
+                    else:
+                        kwargs["messages"] = enhanced_messages
                 elif enhanced_messages:
                     logger.debug(f"No context injected, returning original messages")
             except Exception as e:
@@ -193,3 +213,49 @@ class LLMInterceptor:
                 logger.warning(f"Failed to store conversation: {e}")
 
         return response
+
+    @staticmethod
+    def _is_anthropic_model(model: Any) -> bool:
+        """Whether a LiteLLM model name routes to Anthropic."""
+        name = str(model or "").lower()
+        return name.startswith("anthropic/") or name.startswith("claude")
+
+    @staticmethod
+    def _text_blocks(content: Any) -> List[Dict[str, Any]]:
+        """Anthropic content blocks for a string or block list."""
+        if isinstance(content, list):
+            return list(content)
+        return [{"type": "text", "text": str(content or "")}]
+
+    def _apply_anthropic_system(
+        self, kwargs: Dict[str, Any], messages: List[Dict[str, Any]]
+    ):
+        """
+        Move injected system messages into Anthropic request parameters.
+        
+        Leading system messages are appended to the ``system`` parameter
+        (after the caller's own system prompt, keeping cache breakpoints);
+        later ones are prepended to the next user message.
+        """
+        system = kwargs.get("system")
+        system_blocks = self._text_blocks(system) if system else []
+        converted: List[Dict[str, Any]] = []
+        pending: List[Dict[str, Any]] = []
+
+        for message in messages:
+            if message.get("role") == "system":
+                if converted:
+                    pending.extend(self._text_blocks(message.get("content")))
+                else:
+                    system_blocks.extend(self._text_blocks(message.get("content")))
+                continue
+            if pending and message.get("role") == "user":
+                message = dict(
+                    message, content=pending + self._text_blocks(message.get("content"))
+                )
+                pending = []
+            converted.append(message)
+
+        if system_blocks:
+            kwargs["system"] = system_blocks
+        kwargs["messages"] = converted
@@ -12,19 +12,23 @@ References:
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from memorable_ai.core.errors import (
+    ServiceError,
+    ServiceResponseLostError,
+    ServiceUnavailableError,
+)
 from memorable_ai.core.interceptor import LLMInterceptor
-from memorable_ai.core.storage import Storage
-from memorable_ai.core.extraction import MemoryExtractor
-from memorable_ai.core.retrieval import HybridRetriever
-from memorable_ai.core.consolidation import MemoryConsolidator
-from memorable_ai.core.temporal import TemporalMemory
-from memorable_ai.graph.builder import GraphBuilder
 from memorable_ai.utils.config import MemorableConfig
+from memorable_ai.utils.helpers import serialize_response
 
 logger = logging.getLogger(__name__)
 
+# Daemon operations that write; never repeated in-process once sent
+_REMOTE_WRITES = frozenset({"add", "store"})
+
 
 class MemoryEngine:
     """
@@ -80,6 +84,11 @@ class MemoryEngine:
         self._consolidator = None
         self._temporal = None
         self._mode_handler = None  # Will be set based on mode
+        self._layout = None  # ContextLayout for the 'stable' context layout
+        self._compressor = None  # ContextCompressor when compress_context is set
+        self._remote = None  # MemoryClient when forwarding to a memory daemon
+        self._connect_failures = 0  # Consecutive failed connections to the daemon
+        self._components_lock = threading.Lock()
         
         # Initialize interceptor
         self._interceptor = LLMInterceptor(self)
@@ -96,12 +105,165 @@ class MemoryEngine:
             return
 
         # Initialize storage and other components
-        self._initialize_components()
+        self.initialize()
         
         # Enable interceptor
         self._interceptor.enable()
         
         # Start consolidation background task
+        self._start_consolidator()
+        
+        self._enabled = True
+        logger.info("Memory engine enabled")
+
+    def initialize(self):
+        """
+        Initialize storage, retrieval and extraction without intercepting
+        LLM calls or starting the consolidator.
+        
+        Useful for one-off operations (CLI commands, scripts) that only
+        read or write memories. Embedding models are loaded on first use.
+        
+        With ``config.service.remote`` set, operations are forwarded to a
+        running memory daemon instead; if none answers, the engine falls
+        back to in-process components.
+        """
+        if self._storage is not None or self._remote is not None:
+            return
+        if self.config.service.remote:
+            self._remote = self._connect_remote()
+        if self._remote is None:
+            self._ensure_components()
+
+    def _ensure_components(self):
+        """Initialize in-process components once, also from concurrent daemon fallbacks."""
+        with self._components_lock:
+            if self._storage is None:
+                self._initialize_components()
+
+    def _connect_remote(self):
+        """Connect to the configured memory daemon, or return None."""
+        from memorable_ai.service.client import MemoryClient
+        from memorable_ai.utils.helpers import normalize_database_url
+
+        service = self.config.service
+        client = MemoryClient.connect(
+            service.address, timeout=service.timeout, pool_size=service.pool_size
+        )
+        if client is None:
+            logger.warning("No memory daemon available, running in-process")
+            return None
+
+        database = normalize_database_url(self.config.database.connection_string)
+        if database and normalize_database_url(client.info.get("database")) != database:
+            logger.warning(
+                f"Memory daemon serves {client.info.get('database')}, not {database}; "
+                "running in-process"
+            )
+            client.close()
+            return None
+
+        logger.info(f"Forwarding memory operations to daemon (pid {client.info.get('pid')})")
+        return client
+
+    def _forward(self, op: str, on_error: Any = None, **args) -> Tuple[bool, Any]:
+        """
+        Forward an operation to the memory daemon.
+        
+        When the daemon cannot be reached the operation runs in-process
+        instead; remote mode is left only after
+        ``service.max_connect_failures`` consecutive failed connections.
+        When the request was sent but its response was lost (timeout,
+        connection dropped) the daemon may have run it, so writes are not
+        repeated in-process but logged and answered with ``on_error``; reads
+        run in-process. An operation that fails in the daemon (bad request,
+        storage error) is logged and answered with ``on_error``, like a
+        failed in-process operation.
+        
+        Args:
+            op: Operation name
+            on_error: Result returned when the daemon reports an error
+            **args: Operation arguments
+            
+        Returns:
+            (handled, result) - handled is False when not in remote mode or
+            the daemon did not answer, in which case the caller should run
+            the operation in-process
+        """
+        remote = self._remote
+        if remote is None:
+            return False, None
+
+        try:
+            result = remote.call(op, namespace=self.config.memory.namespace, **args)
+        except ServiceResponseLostError as e:
+            if op in _REMOTE_WRITES:
+                logger.error(f"No response from memory daemon to {op} ({e}), not retrying")
+                return True, on_error
+            logger.warning(f"No response from memory daemon to {op} ({e}), running in-process")
+            self._ensure_components()
+            return False, None
+        except ServiceUnavailableError as e:
+            self._connect_failures += 1
+            if self._connect_failures >= self.config.service.max_connect_failures:
+                logger.warning(f"Memory daemon unavailable ({e}), falling back to in-process")
+                self._remote = None
+                remote.close()
+            else:
+                logger.warning(f"Memory daemon unavailable ({e}), running {op} in-process")
+            self._ensure_components()
+            return False, None
+        except ServiceError as e:
+            logger.error(f"Memory daemon failed to {op}: {e}")
+            return True, on_error
+
+        self._connect_failures = 0
+        return True, result
+
+    async def _forward_async(self, op: str, **args) -> Tuple[bool, Any]:
+        """Forward an operation to the memory daemon without blocking the event loop."""
+        if self._remote is None:
+            return False, None
+
+        import asyncio
+        import functools
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(self._forward, op, **args))
+
+    def disable(self):
+        """Disable memory engine - stops intercepting LLM calls."""
+        if not self._enabled:
+            return
+
+        # Stop consolidator
+        self._stop_consolidator()
+        self.save_graph_snapshots()
+
+        self._interceptor.disable()
+        self._enabled = False
+        logger.info("Memory engine disabled")
+
+    def save_graph_snapshots(self) -> int:
+        """
+        Snapshot in-process graph partitions with unsaved changes.
+        
+        Called on disable; only graphs with a snapshot directory configured
+        write anything.
+        
+        Returns:
+            Number of snapshots written
+        """
+        if not hasattr(self._graph, "save_snapshots"):
+            return 0
+        try:
+            return self._graph.save_snapshots()
+        except Exception as e:
+            logger.error(f"Failed to write graph snapshots: {e}")
+            return 0
+
+    def _start_consolidator(self):
+        """Start the consolidation background task, if any."""
         if self._consolidator:
             import asyncio
             try:
@@ -114,16 +276,9 @@ class MemoryEngine:
             except RuntimeError:
                 # No event loop, will start when one is available
                 pass
-        
-        self._enabled = True
-        logger.info("Memory engine enabled")
-
-    def disable(self):
-        """Disable memory engine - stops intercepting LLM calls."""
-        if not self._enabled:
-            return
 
-        # Stop consolidator
+    def _stop_consolidator(self):
+        """Stop the consolidation background task, if any."""
         if self._consolidator:
             import asyncio
             try:
@@ -135,12 +290,61 @@ class MemoryEngine:
             except RuntimeError:
                 pass
 
-        self._interceptor.disable()
-        self._enabled = False
-        logger.info("Memory engine disabled")
+    def for_namespace(self, namespace: Optional[str]) -> "MemoryEngine":
+        """
+        Get a lightweight engine view bound to another namespace.
+        
+        The view shares this engine's database pool, embedding model, graph
+        and extractor; only the storage scope, retriever and mode handler
+        (session caches) are per-namespace. Views do not run their own
+        consolidator and should not be enabled themselves - LLM calls are
+        intercepted by the parent engine or pool.
+        
+        Args:
+            namespace: Namespace for the view
+            
+        Returns:
+            MemoryEngine scoped to the namespace
+        """
+        from memorable_ai.core.retrieval import HybridRetriever
+        from memorable_ai.core.temporal import TemporalMemory
+
+        self.initialize()
+
+        config = self.config.model_copy(deep=True)
+        config.memory.namespace = namespace
+
+        view = MemoryEngine(config=config)
+        if self._remote is not None:
+            # The daemon resolves the namespace; share its connection pool
+            view._remote = self._remote
+            return view
+
+        view._storage = self._storage.for_namespace(namespace)
+        view._extraction = self._extraction
+        view._graph = self._graph
+        if hasattr(self._graph, "for_namespace"):
+            view._graph = self._graph.for_namespace(namespace)
+        view._retrieval = HybridRetriever(
+            storage=view._storage,
+            embedding_model=self._retrieval.embedding_model,
+            graph=view._graph if self._retrieval.graph is not None else None,
+        )
+        view._temporal = TemporalMemory(view._storage)
+        view._compressor = self._compressor
+        view._initialize_mode_handler()
+        return view
 
     def _initialize_components(self):
         """Initialize storage, retrieval, extraction, and graph components."""
+        # Imported here so that importing the engine stays cheap
+        from memorable_ai.core.storage import Storage
+        from memorable_ai.core.embeddings import LazyEmbeddingModel
+        from memorable_ai.core.extraction import MemoryExtractor
+        from memorable_ai.core.retrieval import HybridRetriever
+        from memorable_ai.core.consolidation import MemoryConsolidator
+        from memorable_ai.core.temporal import TemporalMemory
+
         logger.debug("Initializing components...")
         
         # Initialize storage
@@ -156,25 +360,19 @@ class MemoryEngine:
                 namespace=self.config.memory.namespace,
             )
         
-        # Initialize extraction with embedding model if available
-        try:
-            from sentence_transformers import SentenceTransformer
-            embedding_model = SentenceTransformer(self.config.llm.embedding_model)
-            self._extraction = MemoryExtractor(embedding_model=embedding_model)
-        except Exception:
-            logger.warning("Embedding model not available, extraction will work without embeddings")
-            self._extraction = MemoryExtractor()
+        # Initialize extraction with embedding model (loaded on first use,
+        # extraction works without embeddings if it is not available)
+        embedding_model = LazyEmbeddingModel(self.config.llm.embedding_model)
+        self._extraction = MemoryExtractor(embedding_model=embedding_model)
         
         # Initialize graph if enabled
         if self.config.graph.enabled:
-            self._graph = GraphBuilder(
-                connection_string=self.config.graph.connection_string
-            )
+            self._graph = self._create_graph()
         
         # Initialize retrieval
         self._retrieval = HybridRetriever(
             storage=self._storage,
-            embedding_model=self.config.llm.embedding_model,
+            embedding_model=embedding_model,
             graph=self._graph if self.config.graph.enabled else None,
         )
         
@@ -188,27 +386,158 @@ class MemoryEngine:
         self._consolidator = MemoryConsolidator(
             storage=self._storage,
             interval=self.config.memory.consolidation_interval,
+            similarity_threshold=self.config.memory.contradiction_threshold,
+            duplicate_threshold=self.config.memory.duplicate_threshold,
+            lease_ttl=self.config.memory.consolidation_lease_ttl,
+            archive_importance=self.config.memory.archive_importance,
+            archive_after_days=self.config.memory.archive_after_days,
+            hot_tier_size=self.config.memory.hot_tier_size,
+            hot_tier_sizes=self.config.memory.hot_tier_sizes,
         )
         
         logger.info("Components initialized")
 
+    def _create_graph(self) -> Any:
+        """Create the graph builder for the configured backend."""
+        graph_config = self.config.graph
+        if graph_config.backend in ("memory", "csr"):
+            from memorable_ai.graph.partitions import PartitionedGraph
+
+            if graph_config.backend == "csr":
+                from memorable_ai.graph.csr import CSRGraphBuilder as builder_class
+            else:
+                from memorable_ai.graph.builder import GraphBuilder as builder_class
+
+            snapshots = None
+            if graph_config.backend == "csr" and graph_config.snapshot_dir:
+                from memorable_ai.graph.snapshot import GraphSnapshotStore
+
+                snapshots = GraphSnapshotStore(
+                    graph_config.snapshot_dir, interval=graph_config.snapshot_interval
+                )
+
+            # One in-process graph per namespace, loaded or rebuilt on demand
+            return PartitionedGraph(
+                lambda: builder_class(
+                    connection_string=graph_config.connection_string,
+                    ranking=graph_config.ranking,
+                    max_nodes=graph_config.max_nodes,
+                    max_edges=graph_config.max_edges,
+                ),
+                storage=self._storage,
+                namespace=self.config.memory.namespace,
+                max_partitions=graph_config.max_partitions,
+                snapshots=snapshots,
+            )
+
+        from memorable_ai.graph.sql_builder import SQLGraphBuilder
+
+        # Without a separate connection string the graph lives next to the memories
+        return SQLGraphBuilder(
+            connection_string=graph_config.connection_string,
+            engine=None if graph_config.connection_string else self._storage.engine,
+            namespace=self.config.memory.namespace,
+            adjacency_cache_size=graph_config.adjacency_cache_size,
+            ranking=graph_config.ranking,
+            max_nodes=graph_config.max_nodes,
+            max_edges=graph_config.max_edges,
+        )
+
     def _initialize_mode_handler(self):
         """Initialize memory mode handler based on configured mode."""
         from memorable_ai.modes.conscious import ConsciousMode
         from memorable_ai.modes.auto import AutoMode
         from memorable_ai.modes.hybrid import HybridMode
+        from memorable_ai.modes.adaptive import AdaptiveMode
+        from memorable_ai.modes.compression import ContextCompressor
+        from memorable_ai.modes.layout import ContextLayout
+        from memorable_ai.modes.session_cache import SessionCache
+
+        memory_config = self.config.memory
+        session_cache = SessionCache(
+            max_entries=memory_config.session_cache_size,
+            ttl=memory_config.session_cache_ttl,
+            max_bytes=memory_config.session_cache_max_bytes,
+            spill_storage=self._storage if memory_config.session_cache_spill else None,
+        )
+        if memory_config.compress_context and self._compressor is None:
+            self._compressor = ContextCompressor(
+                embedding_model=self._retrieval.embedding_model,
+                threshold=memory_config.compression_threshold,
+                cache_size=memory_config.session_cache_size,
+            )
+        compressor = self._compressor
 
         if self.config.memory.mode == "conscious":
-            self._mode_handler = ConsciousMode(self._retrieval)
+            self._mode_handler = ConsciousMode(
+                self._retrieval, session_cache=session_cache, compressor=compressor
+            )
         elif self.config.memory.mode == "auto":
-            self._mode_handler = AutoMode(self._retrieval)
+            self._mode_handler = AutoMode(self._retrieval, compressor=compressor)
         elif self.config.memory.mode == "hybrid":
-            self._mode_handler = HybridMode(self._retrieval)
+            self._mode_handler = HybridMode(
+                self._retrieval, session_cache=session_cache, compressor=compressor
+            )
+        elif self.config.memory.mode == "adaptive":
+            self._mode_handler = AdaptiveMode(
+                self._retrieval,
+                drift_threshold=memory_config.drift_threshold,
+                max_sessions=memory_config.session_cache_size,
+                compressor=compressor,
+            )
         else:
             logger.warning(f"Unknown mode {self.config.memory.mode}, defaulting to auto")
-            self._mode_handler = AutoMode(self._retrieval)
+            self._mode_handler = AutoMode(self._retrieval, compressor=compressor)
+
+        if memory_config.context_layout == "stable":
+            self._layout = ContextLayout(max_sessions=memory_config.session_cache_size)
 
-    async def _inject_context(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _get_mode_context(self, messages: List[Dict[str, Any]]) -> str:
+        """Get context text from the configured mode handler."""
+        if self.config.memory.mode == "auto":
+            return await self._mode_handler.get_context(messages)
+        if self.config.memory.mode in ("conscious", "hybrid", "adaptive"):
+            session_id = self._get_session_id(messages)
+            return await self._mode_handler.get_context(session_id, messages)
+        return ""
+
+    async def _get_mode_blocks(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get (session-level, per-query) memories from the configured mode handler."""
+        mode = self.config.memory.mode
+        if mode == "conscious":
+            return await self._mode_handler.get_memories(session_id, messages), []
+        if mode == "hybrid":
+            return await self._mode_handler.get_blocks(session_id, messages)
+        if mode == "adaptive":
+            return [], await self._mode_handler.get_memories(session_id, messages)
+        return [], await self._mode_handler.get_memories(messages)
+
+    async def _build_context(
+        self, messages: List[Dict[str, Any]], provider: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get messages with memory context injected using the configured layout."""
+        if self._layout is not None:
+            session_id = self._get_session_id(messages)
+            stable, volatile = await self._get_mode_blocks(session_id, messages)
+            if self._compressor is not None:
+                stable = await self._compressor.compress(stable)
+                volatile = await self._compressor.compress(volatile)
+            return self._layout.apply(
+                messages, stable, volatile, session_id=session_id, provider=provider
+            )
+
+        context_text = await self._get_mode_context(messages)
+        if not context_text:
+            return messages
+
+        # Inject as system message or prepend
+        return [{"role": "system", "content": context_text}] + messages
+
+    async def _inject_context(
+        self, messages: List[Dict[str, Any]], provider: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Inject relevant memories into conversation context.
         
@@ -216,37 +545,37 @@ class MemoryEngine:
         
         Args:
             messages: Original conversation messages
+            provider: LLM provider ('openai', 'anthropic', 'litellm'), used
+                by the stable layout to emit cache breakpoints
             
         Returns:
             Enhanced messages with memory context
         """
+        handled, enhanced = await self._forward_async(
+            "inject", on_error=messages, messages=messages, provider=provider
+        )
+        if handled:
+            return enhanced
+
         if not self._mode_handler:
             return messages
 
         try:
-            # Use mode handler to get context
-            session_id = self._get_session_id(messages)
-            if self.config.memory.mode == "auto":
-                context_text = await self._mode_handler.get_context(messages)
-            elif self.config.memory.mode == "conscious":
-                context_text = await self._mode_handler.get_context(session_id, messages)
-            elif self.config.memory.mode == "hybrid":
-                context_text = await self._mode_handler.get_context(session_id, messages)
-            else:
-                context_text = ""
-
-            if not context_text:
-                return messages
-
-            # Inject as system message or prepend
-            enhanced = [{"role": "system", "content": context_text}] + messages
-            return enhanced
+            return await self._build_context(messages, provider)
         except Exception as e:
             logger.error(f"Failed to inject context: {e}")
             return messages
 
-    def _inject_context_sync(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _inject_context_sync(
+        self, messages: List[Dict[str, Any]], provider: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """Synchronous version of context injection."""
+        handled, enhanced = self._forward(
+            "inject", on_error=messages, messages=messages, provider=provider
+        )
+        if handled:
+            return enhanced
+
         if not self._mode_handler:
             return messages
 
@@ -260,22 +589,7 @@ class MemoryEngine:
                 new_loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(new_loop)
                 try:
-                    session_id = self._get_session_id(messages)
-                    if self.config.memory.mode == "auto":
-                        context_text = new_loop.run_until_complete(
-                            self._mode_handler.get_context(messages)
-                        )
-                    elif self.config.memory.mode == "conscious":
-                        context_text = new_loop.run_until_complete(
-                            self._mode_handler.get_context(session_id, messages)
-                        )
-                    elif self.config.memory.mode == "hybrid":
-                        context_text = new_loop.run_until_complete(
-                            self._mode_handler.get_context(session_id, messages)
-                        )
-                    else:
-                        context_text = ""
-                    return context_text
+                    return new_loop.run_until_complete(self._build_context(messages, provider))
                 finally:
                     new_loop.close()
             
@@ -286,52 +600,21 @@ class MemoryEngine:
                     # If loop is running, use thread pool to run async code
                     with concurrent.futures.ThreadPoolExecutor() as executor:
                         future = executor.submit(run_in_thread)
-                        context_text = future.result(timeout=5.0)
+                        enhanced = future.result(timeout=5.0)
                 else:
                     # No loop running, can use run_until_complete directly
-                    session_id = self._get_session_id(messages)
-                    if self.config.memory.mode == "auto":
-                        context_text = loop.run_until_complete(
-                            self._mode_handler.get_context(messages)
-                        )
-                    elif self.config.memory.mode == "conscious":
-                        context_text = loop.run_until_complete(
-                            self._mode_handler.get_context(session_id, messages)
-                        )
-                    elif self.config.memory.mode == "hybrid":
-                        context_text = loop.run_until_complete(
-                            self._mode_handler.get_context(session_id, messages)
-                        )
-                    else:
-                        context_text = ""
+                    enhanced = loop.run_until_complete(self._build_context(messages, provider))
             except RuntimeError:
                 # No event loop exists, create one
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
                 try:
-                    session_id = self._get_session_id(messages)
-                    if self.config.memory.mode == "auto":
-                        context_text = loop.run_until_complete(
-                            self._mode_handler.get_context(messages)
-                        )
-                    elif self.config.memory.mode == "conscious":
-                        context_text = loop.run_until_complete(
-                            self._mode_handler.get_context(session_id, messages)
-                        )
-                    elif self.config.memory.mode == "hybrid":
-                        context_text = loop.run_until_complete(
-                            self._mode_handler.get_context(session_id, messages)
-                        )
-                    else:
-                        context_text = ""
+                    enhanced = loop.run_until_complete(self._build_context(messages, provider))
                 finally:
                     loop.close()
 
-            if not context_text:
-                return messages
-
-            enhanced = [{"role": "system", "content": context_text}] + messages
-            logger.debug(f"Injected context: {len(context_text)} chars")
+            if len(enhanced) > len(messages):
+                logger.debug(f"Injected context: {len(enhanced) - len(messages)} messages")
             return enhanced
         except Exception as e:
             logger.error(f"Failed to inject context (sync): {e}")
@@ -381,17 +664,30 @@ class MemoryEngine:
             messages: Conversation messages
             response: LLM response
         """
+        response_dict = serialize_response(response)
+
+        if self._remote is not None:
+            handled, _ = await self._forward_async(
+                "store", messages=messages, response=response_dict
+            )
+            if handled:
+                return
+
         if not self._extraction or not self._storage:
             return
 
         try:
             # Extract memories from conversation
-            memories = await self._extraction.extract(messages, response)
+            memories = await self._extraction.extract(messages, response_dict)
             
             # Store in database
             if memories:
+                before = self._own_write_start()
                 await self._storage.store_memories(memories)
-                await self._storage.store_conversation(messages, response, memories)
+                await self._storage.store_conversation(
+                    messages, self._persisted_response(response_dict), memories
+                )
+                self._own_write_done([messages], before)
             
             # Update graph if enabled
             if self._graph and self.config.graph.enabled:
@@ -399,10 +695,79 @@ class MemoryEngine:
         except Exception as e:
             logger.error(f"Failed to store conversation: {e}")
 
+    async def _store_conversation_batch(
+        self, conversations: List[Tuple[List[Dict[str, Any]], Any]]
+    ):
+        """
+        Store several conversations at once.
+        
+        Used by the memory daemon to coalesce stores from many workers:
+        memories from all conversations are written in one transaction.
+        Extraction and storage errors are raised, so that the daemon can
+        retry the batch.
+        
+        Args:
+            conversations: List of (messages, response) tuples
+        """
+        if not self._extraction or not self._storage:
+            return
+
+        conversations = [
+            (messages, serialize_response(response)) for messages, response in conversations
+        ]
+        extracted = [
+            await self._extraction.extract(messages, response)
+            for messages, response in conversations
+        ]
+        memories = [memory for batch in extracted for memory in batch]
+        if not memories:
+            return
+
+        before = self._own_write_start()
+        await self._storage.store_memories(memories)
+        await self._storage.store_conversations(
+            [
+                (messages, self._persisted_response(response), batch)
+                for (messages, response), batch in zip(conversations, extracted)
+                if batch
+            ]
+        )
+        self._own_write_done(
+            [messages for (messages, _), batch in zip(conversations, extracted) if batch], before
+        )
+
+        # Update graph if enabled (memories are stored: not worth a retry)
+        if self._graph and self.config.graph.enabled:
+            try:
+                await self._graph.update_graph(memories)
+            except Exception as e:
+                logger.error(f"Failed to update graph for conversation batch: {e}")
+
+    def _own_write_start(self) -> Optional[int]:
+        """Write version before storing a conversation (adaptive mode only)."""
+        if self.config.memory.mode != "adaptive" or self._mode_handler is None:
+            return None
+        return self._storage.get_write_version()
+
+    def _own_write_done(self, conversations: List[List[Dict[str, Any]]], before: Optional[int]):
+        """Let adaptive mode absorb the stores of its sessions' own conversations."""
+        if before is None:
+            return
+        after = self._storage.get_write_version()
+        for messages in conversations:
+            self._mode_handler.absorb_write(self._get_session_id(messages), before, after)
+
     def _store_conversation_sync(
         self, messages: List[Dict[str, Any]], response: Any
     ):
         """Synchronous version of conversation storage."""
+        response_dict = serialize_response(response)
+
+        if self._remote is not None:
+            handled, _ = self._forward("store", messages=messages, response=response_dict)
+            if handled:
+                return
+
         if not self._extraction or not self._storage:
             return
 
@@ -417,7 +782,7 @@ class MemoryEngine:
                     # If loop is running, run in a thread with new event loop
                     # This ensures storage completes synchronously
                     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                        future = executor.submit(self._store_in_new_loop, messages, response)
+                        future = executor.submit(self._store_in_new_loop, messages, response_dict)
                         future.result()  # Wait for completion
                     return
             except RuntimeError:
@@ -432,19 +797,20 @@ class MemoryEngine:
             
             # Extract and store
             memories = loop.run_until_complete(
-                self._extraction.extract(messages, response)
+                self._extraction.extract(messages, response_dict)
             )
             
             if memories:
-                # Convert response to dict if needed
-                response_dict = self._response_to_dict(response)
-                
+                before = self._own_write_start()
                 loop.run_until_complete(
                     self._storage.store_memories(memories)
                 )
                 loop.run_until_complete(
-                    self._storage.store_conversation(messages, response_dict, memories)
+                    self._storage.store_conversation(
+                        messages, self._persisted_response(response_dict), memories
+                    )
                 )
+                self._own_write_done([messages], before)
         except Exception as e:
             logger.error(f"Failed to store conversation (sync): {e}")
             import traceback
@@ -460,25 +826,11 @@ class MemoryEngine:
         finally:
             loop.close()
     
-    def _response_to_dict(self, response: Any) -> Dict[str, Any]:
-        """Convert response object to dictionary."""
-        response_dict = response
-        if hasattr(response, 'model_dump'):
-            response_dict = response.model_dump()
-        elif hasattr(response, 'dict'):
-            response_dict = response.dict()
-        elif hasattr(response, '__dict__'):
-            try:
-                import json
-                response_dict = json.loads(json.dumps(response.__dict__, default=str))
-            except:
-                response_dict = {
-                    "id": getattr(response, 'id', None),
-                    "model": getattr(response, 'model', None),
-                    "choices": [choice.__dict__ if hasattr(choice, '__dict__') else str(choice) 
-                               for choice in getattr(response, 'choices', [])] if hasattr(response, 'choices') else []
-                }
-        return response_dict
+    def _persisted_response(
+        self, response_dict: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Response to persist with a conversation (None if disabled by config)."""
+        return response_dict if self.config.memory.store_responses else None
 
     async def _store_conversation_async(
         self, messages: List[Dict[str, Any]], response: Any
@@ -488,54 +840,15 @@ class MemoryEngine:
             return
 
         try:
-            # Convert response to dict if it's a ModelResponse object (from litellm)
-            response_dict = response
-            if response is not None:
-                if hasattr(response, 'model_dump'):
-                    # Pydantic v2 model
-                    response_dict = response.model_dump()
-                elif hasattr(response, 'dict'):
-                    # Pydantic v1 model
-                    response_dict = response.dict()
-                elif hasattr(response, '__dict__'):
-                    # Regular object - try to serialize
-                    try:
-                        import json
-                        # Try to serialize, converting non-serializable items
-                        response_dict = json.loads(json.dumps(
-                            {
-                                k: v if isinstance(v, (str, int, float, bool, type(None))) 
-                                else str(v) if not isinstance(v, (list, dict)) 
-                                else [item.__dict__ if hasattr(item, '__dict__') else str(item) for item in v] if isinstance(v, list)
-                                else v
-                                for k, v in response.__dict__.items()
-                            },
-                            default=str
-                        ))
-                    except Exception as e:
-                        logger.warning(f"Could not fully serialize response: {e}")
-                        # Fallback: create a simple dict with key attributes
-                        response_dict = {
-                            "id": str(getattr(response, 'id', None)),
-                            "model": str(getattr(response, 'model', None)),
-                            "object": getattr(response, 'object', 'chat.completion'),
-                        }
-                        # Try to get choices if available
-                        if hasattr(response, 'choices'):
-                            response_dict["choices"] = [
-                                {
-                                    "message": {
-                                        "role": getattr(choice.message, 'role', 'assistant') if hasattr(choice, 'message') else 'assistant',
-                                        "content": str(getattr(choice.message, 'content', '')) if hasattr(choice, 'message') else str(choice)
-                                    }
-                                } if hasattr(choice, 'message') else {"message": {"content": str(choice)}}
-                                for choice in response.choices
-                            ]
-            
-            memories = await self._extraction.extract(messages, response)
+            response_dict = serialize_response(response)
+            memories = await self._extraction.extract(messages, response_dict)
             if memories:
+                before = self._own_write_start()
                 await self._storage.store_memories(memories)
-                await self._storage.store_conversation(messages, response_dict, memories)
+                await self._storage.store_conversation(
+                    messages, self._persisted_response(response_dict), memories
+                )
+                self._own_write_done([messages], before)
                 
                 # Update graph if enabled
                 if self._graph and self.config.graph.enabled:
@@ -544,6 +857,23 @@ class MemoryEngine:
             logger.error(f"Failed to store conversation (async): {e}")
 
     # Public API methods
+    def set_context_summarizer(self, summarizer: Optional[Any]):
+        """
+        Set the hook that merges clusters of near-duplicate memories.
+        
+        Requires ``memory.compress_context``. Without a summarizer, clusters
+        are merged extractively.
+        
+        Args:
+            summarizer: Callable (sync or async) taking a list of memory
+                contents and returning one line, or None to merge extractively
+        """
+        self.initialize()
+        if self._compressor is None:
+            logger.warning("Context compression is disabled (memory.compress_context)")
+            return
+        self._compressor.summarizer = summarizer
+
     async def add_memory(self, content: str, memory_type: str = "fact", **metadata):
         """
         Manually add a memory.
@@ -553,6 +883,12 @@ class MemoryEngine:
             memory_type: Type of memory (fact, preference, skill, etc.)
             **metadata: Additional metadata
         """
+        handled, _ = await self._forward_async(
+            "add", content=content, memory_type=memory_type, metadata=metadata
+        )
+        if handled:
+            return
+
         if not self._storage:
             logger.warning("Storage not initialized")
             return
@@ -564,6 +900,8 @@ class MemoryEngine:
                 "metadata": metadata,
             }
             await self._storage.store_memories([memory])
+            if self._graph and self.config.graph.enabled:
+                await self._graph.update_graph([memory])
             logger.debug(f"Added memory: {content}")
         except Exception as e:
             logger.error(f"Failed to add memory: {e}")
@@ -582,6 +920,12 @@ class MemoryEngine:
         Returns:
             List of matching memories
         """
+        handled, results = await self._forward_async(
+            "search", on_error=[], query=query, limit=limit, memory_type=memory_type
+        )
+        if handled:
+            return results
+
         if not self._retrieval:
             return []
 
@@ -591,8 +935,43 @@ class MemoryEngine:
             logger.error(f"Failed to search memories: {e}")
             return []
 
+    async def compact_memories(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Merge clusters of near-identical memories of this engine's namespace.
+        
+        Memories with embeddings at least ``memory.duplicate_threshold``
+        similar (or with identical normalized text) are merged into one
+        canonical memory; graph links are redirected to it.
+        
+        Args:
+            dry_run: Only report the merges that would be made
+            
+        Returns:
+            Compaction report (see ``MemoryCompactor.compact``)
+        """
+        if not self._storage:
+            logger.warning("Storage not initialized")
+            return {}
+
+        from memorable_ai.core.compaction import MemoryCompactor
+
+        compactor = MemoryCompactor(
+            storage=self._storage,
+            graph=self._graph if self.config.graph.enabled else None,
+            threshold=self.config.memory.duplicate_threshold,
+            lease_ttl=self.config.memory.consolidation_lease_ttl,
+        )
+        return await compactor.compact(dry_run=dry_run)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get memory engine statistics."""
+        handled, stats = self._forward(
+            "stats", on_error={"enabled": self._enabled, "mode": self.config.memory.mode}
+        )
+        if handled:
+            stats["remote"] = True
+            return stats
+
         stats = {
             "enabled": self._enabled,
             "mode": self.config.memory.mode,
@@ -613,4 +992,20 @@ class MemoryEngine:
             except Exception:
                 pass
         
+        session_cache = getattr(self._mode_handler, "sessions", None)
+        if session_cache is not None:
+            stats["session_cache"] = session_cache.get_stats()
+        
+        if self.config.memory.mode == "adaptive" and self._mode_handler:
+            stats["adaptive"] = self._mode_handler.get_stats()
+        
+        if self._layout is not None:
+            stats["context_layout"] = self._layout.get_stats()
+        
+        if self._compressor is not None:
+            stats["compression"] = self._compressor.get_stats()
+        
+        if self._consolidator is not None:
+            stats["consolidation"] = self._consolidator.get_stats()
+        
         return stats
@@ -0,0 +1,258 @@
+"""
+Memory Engine Pool
+
+Serves many namespaces (tenants) from one process-wide set of heavy
+components: one database connection pool, one embedding model, one graph,
+one consolidator and one LLM interceptor. Each namespace gets a lightweight
+MemoryEngine view, and the namespace is resolved per call from message
+metadata or from a context variable.
+"""
+
+import contextlib
+import contextvars
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from memorable_ai.core.interceptor import LLMInterceptor
+from memorable_ai.core.memory_engine import MemoryEngine
+from memorable_ai.utils.config import MemorableConfig
+
+logger = logging.getLogger(__name__)
+
+# Namespace for the current task/thread, used when messages carry none
+current_namespace: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "memorable_namespace", default=None
+)
+
+
+@contextlib.contextmanager
+def use_namespace(namespace: Optional[str]) -> Iterator[None]:
+    """
+    Route memory operations in this context to a namespace.
+
+    Example:
+        with use_namespace("tenant-42"):
+            client.chat.completions.create(...)
+
+    Args:
+        namespace: Namespace to use
+    """
+    token = current_namespace.set(namespace)
+    try:
+        yield
+    finally:
+        current_namespace.reset(token)
+
+
+class MemoryEnginePool:
+    """
+    Multi-tenant memory engine.
+
+    Shares heavy components across namespaces and hands out per-namespace
+    MemoryEngine views, kept in an LRU of at most ``max_namespaces``.
+    """
+
+    def __init__(
+        self,
+        database: Optional[str] = None,
+        graph_enabled: bool = False,
+        graph_database: Optional[str] = None,
+        mode: str = "auto",
+        config: Optional[MemorableConfig] = None,
+        max_namespaces: int = 1024,
+    ):
+        """
+        Initialize engine pool.
+
+        Args:
+            database: Database connection string (SQLite, PostgreSQL, MySQL)
+            graph_enabled: Enable graph-based memory (optional)
+            graph_database: Graph database connection string
+            mode: Memory mode ('conscious', 'auto', 'hybrid', or 'adaptive')
+            config: Optional configuration object
+            max_namespaces: Maximum number of namespace views kept in memory
+        """
+        self._root = MemoryEngine(
+            database=database,
+            graph_enabled=graph_enabled,
+            graph_database=graph_database,
+            mode=mode,
+            config=config,
+        )
+        self.config = self._root.config
+        self.max_namespaces = max(1, max_namespaces)
+        self._views: "OrderedDict[Optional[str], MemoryEngine]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._interceptor = LLMInterceptor(self)
+        self._enabled = False
+
+    def enable(self):
+        """Initialize shared components and start intercepting LLM calls."""
+        if self._enabled:
+            logger.warning("Memory engine pool already enabled")
+            return
+
+        self.initialize()
+        self._interceptor.enable()
+        self._start_consolidator()
+        self._enabled = True
+        logger.info("Memory engine pool enabled")
+
+    def disable(self):
+        """Stop intercepting LLM calls and stop the shared consolidator."""
+        if not self._enabled:
+            return
+
+        self._stop_consolidator()
+        self._root.save_graph_snapshots()
+        self._interceptor.disable()
+        self._enabled = False
+        logger.info("Memory engine pool disabled")
+
+    def initialize(self):
+        """Initialize shared components without intercepting LLM calls."""
+        self._initialize_components()
+
+    def _start_consolidator(self):
+        """Start the shared consolidation background task."""
+        self._root._start_consolidator()
+
+    def _stop_consolidator(self):
+        """Stop the shared consolidation background task."""
+        self._root._stop_consolidator()
+
+    def _initialize_components(self):
+        """Initialize the shared heavy components once."""
+        if self._root._storage is not None:
+            return
+
+        self._root._initialize_components()
+        # One consolidator walks every namespace through storage views
+        self._root._consolidator.namespaces = self._root._storage.list_namespaces
+
+    def namespace(self, namespace: Optional[str] = None) -> MemoryEngine:
+        """
+        Get the engine view for a namespace.
+
+        Args:
+            namespace: Namespace (default: current context namespace)
+
+        Returns:
+            MemoryEngine view sharing the pool's components
+        """
+        if namespace is None:
+            namespace = current_namespace.get() or self.config.memory.namespace
+
+        with self._lock:
+            view = self._views.get(namespace)
+            if view is not None:
+                self._views.move_to_end(namespace)
+                return view
+
+        self._initialize_components()
+        view = self._root.for_namespace(namespace)
+
+        with self._lock:
+            existing = self._views.get(namespace)
+            if existing is not None:
+                return existing
+            self._views[namespace] = view
+            while len(self._views) > self.max_namespaces:
+                self._views.popitem(last=False)
+        return view
+
+    def _resolve_namespace(self, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """Resolve namespace from message metadata, then the context variable."""
+        for msg in messages:
+            if isinstance(msg, dict) and "metadata" in msg:
+                metadata = msg.get("metadata") or {}
+                if metadata.get("namespace"):
+                    return metadata["namespace"]
+        return current_namespace.get() or self.config.memory.namespace
+
+    # Interceptor hooks
+    async def _inject_context(
+        self, messages: List[Dict[str, Any]], provider: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Inject context using the namespace resolved for these messages."""
+        view = self.namespace(self._resolve_namespace(messages))
+        return await view._inject_context(messages, provider)
+
+    def _inject_context_sync(
+        self, messages: List[Dict[str, Any]], provider: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of context injection."""
+        view = self.namespace(self._resolve_namespace(messages))
+        return view._inject_context_sync(messages, provider)
+
+    async def _store_conversation(self, messages: List[Dict[str, Any]], response: Any):
+        """Store conversation in the namespace resolved for these messages."""
+        view = self.namespace(self._resolve_namespace(messages))
+        await view._store_conversation(messages, response)
+
+    def _store_conversation_sync(self, messages: List[Dict[str, Any]], response: Any):
+        """Synchronous version of conversation storage."""
+        view = self.namespace(self._resolve_namespace(messages))
+        view._store_conversation_sync(messages, response)
+
+    # Public API methods
+    async def add_memory(
+        self,
+        content: str,
+        memory_type: str = "fact",
+        namespace: Optional[str] = None,
+        **metadata,
+    ):
+        """
+        Manually add a memory to a namespace.
+
+        Args:
+            content: Memory content
+            memory_type: Type of memory (fact, preference, skill, etc.)
+            namespace: Namespace (default: current context namespace)
+            **metadata: Additional metadata
+        """
+        await self.namespace(namespace).add_memory(content, memory_type, **metadata)
+
+    async def search_memories(
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search memories in a namespace.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            memory_type: Filter by memory type (optional)
+            namespace: Namespace (default: current context namespace)
+
+        Returns:
+            List of matching memories
+        """
+        return await self.namespace(namespace).search_memories(
+            query, limit=limit, memory_type=memory_type
+        )
+
+    def get_stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get statistics for a namespace plus pool-level counters.
+
+        Args:
+            namespace: Namespace (default: current context namespace)
+
+        Returns:
+            Statistics dictionary
+        """
+        stats = self.namespace(namespace).get_stats()
+        stats["enabled"] = self._enabled
+        stats["pool"] = {
+            "loaded_namespaces": len(self._views),
+            "max_namespaces": self.max_namespaces,
+        }
+        return stats
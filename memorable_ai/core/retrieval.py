@@ -9,9 +9,9 @@ arXiv:2504.19413 (April 2025)
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-import numpy as np
-from sentence_transformers import SentenceTransformer
+from typing import Any, Dict, List, Optional, Union
+
+from memorable_ai.core.embeddings import LazyEmbeddingModel
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class HybridRetriever:
     def __init__(
         self,
         storage: Any,
-        embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+        embedding_model: Union[str, Any] = "sentence-transformers/all-MiniLM-L6-v2",
         graph: Optional[Any] = None,
     ):
         """
@@ -35,23 +35,28 @@ class HybridRetriever:
         
         Args:
             storage: Storage instance
-            embedding_model: Model for generating embeddings
+            embedding_model: Model name, or an already loaded embedding model to share
             graph: Optional graph instance for graph-based retrieval
         """
         self.storage = storage
         self.graph = graph
+
+        if not isinstance(embedding_model, str):
+            # Shared model instance (e.g. across namespaces of an engine pool)
+            self.embedding_model = embedding_model
+            self.embedding_model_name = getattr(embedding_model, "name_or_path", None)
+            return
+
         self.embedding_model_name = embedding_model
         
-        # Load embedding model
-        try:
-            self.embedding_model = SentenceTransformer(embedding_model)
-            logger.info(f"Loaded embedding model: {embedding_model}")
-        except Exception as e:
-            logger.warning(f"Failed to load embedding model: {e}")
-            self.embedding_model = None
+        # Embedding model is loaded on first use
+        self.embedding_model = LazyEmbeddingModel(embedding_model)
 
     async def retrieve(
-        self, messages: List[Dict[str, Any]], limit: int = 10
+        self,
+        messages: List[Dict[str, Any]],
+        limit: int = 10,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve relevant memories for conversation.
@@ -59,6 +64,7 @@ class HybridRetriever:
         Args:
             messages: Conversation messages
             limit: Maximum number of memories to retrieve
+            query_embedding: Precomputed embedding of the query (optional)
             
         Returns:
             List of relevant memories
@@ -76,7 +82,9 @@ class HybridRetriever:
 
         # 1. Semantic search (if embeddings available)
         if self.embedding_model:
-            semantic_results = await self._semantic_search(query, limit=limit)
+            semantic_results = await self._semantic_search(
+                query, limit=limit, query_embedding=query_embedding
+            )
 
         # 2. Keyword search
         keyword_results = await self.storage.search_memories_text(
@@ -139,6 +147,13 @@ class HybridRetriever:
         # Deduplicate and rank
         results = self._deduplicate_and_rank(results, limit=limit)
 
+        # Explicit searches also reach archived memories (promoting them)
+        if len(results) < limit:
+            archived = await self.storage.search_archive(
+                query, limit=limit - len(results), memory_type=memory_type
+            )
+            results.extend(archived)
+
         return results
 
     def _extract_query(self, messages: List[Dict[str, Any]]) -> str:
@@ -160,7 +175,11 @@ class HybridRetriever:
         return ""
 
     async def _semantic_search(
-        self, query: str, limit: int = 10, memory_type: Optional[str] = None
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Semantic search using vector embeddings.
@@ -169,6 +188,7 @@ class HybridRetriever:
             query: Search query
             limit: Maximum results
             memory_type: Filter by type
+            query_embedding: Precomputed query embedding (optional)
             
         Returns:
             List of similar memories
@@ -178,7 +198,8 @@ class HybridRetriever:
 
         try:
             # Generate query embedding
-            query_embedding = self.embedding_model.encode(query).tolist()
+            if query_embedding is None:
+                query_embedding = self.embedding_model.encode(query).tolist()
 
             # Get all memories with embeddings
             memories = await self.storage.get_memories(memory_type=memory_type, limit=1000)
@@ -267,7 +288,10 @@ class HybridRetriever:
             mem_id = mem.get("id", i)
             if mem_id not in memory_scores:
                 memory_scores[mem_id] = {"memory": mem, "score": 0.0}
-            graph_score = (len(graph_results) - i) / len(graph_results) if graph_results else 0.0
+            # PageRank-ranked results carry their own score; otherwise use position
+            graph_score = mem.get("graph_score")
+            if graph_score is None:
+                graph_score = (len(graph_results) - i) / len(graph_results)
             memory_scores[mem_id]["score"] += graph_score * 0.3
 
         # Sort by combined score
@@ -294,6 +318,8 @@ class HybridRetriever:
 
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
+        import numpy as np
+
         try:
             v1 = np.array(vec1)
             v2 = np.array(vec2)
@@ -9,9 +9,10 @@ References:
 - Supermemory: https://github.com/supermemoryai/supermemory (graph architecture)
 """
 
+import copy
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from memorable_ai.core.errors import StorageError
 from sqlalchemy import (
     create_engine,
@@ -23,7 +24,17 @@ from sqlalchemy import (
     Float,
     JSON,
     Index,
+    and_,
+    bindparam,
+    case,
+    func,
+    inspect,
+    literal,
+    or_,
+    select,
+    text,
 )
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -33,6 +44,122 @@ logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# Importance weight of each memory type
+TYPE_WEIGHTS = {
+    "preference": 1.2,
+    "skill": 1.1,
+    "fact": 1.0,
+    "rule": 1.3,
+    "context": 0.8,
+}
+
+# Recency share of the effective importance, decaying linearly to zero over
+# RECENCY_DAYS. It is applied when memories are read rather than stored, so
+# that scores do not have to be rewritten as memories age.
+RECENCY_WEIGHT = 0.2
+RECENCY_DAYS = 365.0
+# Age buckets used to approximate the decay in SQL ORDER BY clauses
+_RECENCY_BUCKETS = 12
+
+
+def effective_importance(
+    importance_score: Optional[float],
+    memory_type: Optional[str],
+    created_at: Optional[datetime],
+    now: Optional[datetime] = None,
+) -> float:
+    """
+    Stored (time-independent) importance plus the current recency bonus.
+    
+    Args:
+        importance_score: Stored importance score
+        memory_type: Memory type (selects the type weight)
+        created_at: Creation time (naive UTC); unknown ages count as half-recent
+        now: Reference time (default: now)
+        
+    Returns:
+        Importance as of ``now``
+    """
+    if created_at is None:
+        recency = 0.5
+    else:
+        age_days = ((now or datetime.utcnow()) - created_at).days
+        recency = max(1.0 - age_days / RECENCY_DAYS, 0.0)
+    weight = TYPE_WEIGHTS.get(memory_type, 1.0)
+    return (importance_score or 0.0) + RECENCY_WEIGHT * weight * recency
+
+
+def _effective_importance_expr(now: datetime):
+    """SQL expression approximating effective_importance (recency in monthly steps)."""
+    step = RECENCY_DAYS / _RECENCY_BUCKETS
+    recency = case(
+        (Memory.created_at.is_(None), 0.5),
+        *[
+            (
+                Memory.created_at >= now - timedelta(days=step * (bucket + 1)),
+                1.0 - (bucket + 0.5) / _RECENCY_BUCKETS,
+            )
+            for bucket in range(_RECENCY_BUCKETS)
+        ],
+        else_=0.0,
+    )
+    weight = case(TYPE_WEIGHTS, value=Memory.memory_type, else_=1.0)
+    return func.coalesce(Memory.importance_score, 0.0) + RECENCY_WEIGHT * weight * recency
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Timezone-aware datetimes as naive UTC (naive ones are kept as they are)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def event_time(memory: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Event time of a memory: its ``event_at`` or its metadata ``timestamp``.
+    
+    Args:
+        memory: Memory dictionary
+        
+    Returns:
+        Naive UTC datetime, or None if the memory has no (valid) event time
+    """
+    value = memory.get("event_at") or (memory.get("metadata") or {}).get("timestamp")
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return _naive_utc(value) if isinstance(value, datetime) else None
+
+
+def temporal_links(
+    memory_id: int,
+    before: Optional[Iterable[Any]] = None,
+    after: Optional[Iterable[Any]] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Temporal edges (earlier, later) of a memory.
+    
+    Args:
+        memory_id: Memory ID
+        before: IDs of memories that happened before it
+        after: IDs of memories that happened after it
+        
+    Returns:
+        (source_id, target_id) pairs; invalid IDs and self-links are skipped
+    """
+    edges = []
+    for ids, forward in ((before, False), (after, True)):
+        for other in ids or []:
+            try:
+                other = int(other)
+            except (TypeError, ValueError):
+                continue
+            if other != memory_id:
+                edges.append((memory_id, other) if forward else (other, memory_id))
+    return edges
+
 
 class Memory(Base):
     """Memory table schema."""
@@ -49,14 +176,53 @@ class Memory(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     access_count = Column(Integer, default=0)
     importance_score = Column(Float, default=0.0, index=True)
+    # When the remembered event happened (metadata "timestamp"), naive UTC
+    event_at = Column(DateTime, nullable=True, index=True)
 
     # Indexes for performance
     __table_args__ = (
         Index("idx_memory_type_namespace", "memory_type", "namespace"),
         Index("idx_created_at", "created_at"),
+        Index("idx_memory_namespace_updated", "namespace", "updated_at", "id"),
+        Index("idx_memory_namespace_event", "namespace", "event_at"),
+        # Never reuse IDs of deleted rows: archived memories keep theirs
+        {"sqlite_autoincrement": True},
+    )
+
+
+class MemoryArchive(Base):
+    """
+    Archived (cold) memories.
+    
+    Same columns as ``memories``, and the same IDs, so that graph links and
+    references stay valid while a memory is archived and after it is
+    promoted back. Archived memories are not scanned by semantic or keyword
+    retrieval.
+    """
+
+    __tablename__ = "memories_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    content = Column(Text, nullable=False)
+    memory_type = Column(String(50), nullable=False)
+    namespace = Column(String(255))
+    extra_metadata = Column(JSON)
+    embedding = Column(JSON)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    access_count = Column(Integer, default=0)
+    importance_score = Column(Float, default=0.0)
+    event_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_memory_archive_namespace_type", "namespace", "memory_type"),
     )
 
 
+_MEMORY_COLUMNS = [column.name for column in Memory.__table__.columns]
+
+
 class Conversation(Base):
     """Conversation history table."""
 
@@ -72,6 +238,87 @@ class Conversation(Base):
     __table_args__ = (Index("idx_namespace_created", "namespace", "created_at"),)
 
 
+class SessionCacheEntry(Base):
+    """Session memories spilled from the in-process session cache."""
+
+    __tablename__ = "session_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255))
+    session_id = Column(String(255), nullable=False)
+    memories = Column(JSON, nullable=False)
+    expires_at = Column(DateTime, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (Index("idx_session_cache_key", "namespace", "session_id", unique=True),)
+
+
+class MemorySignature(Base):
+    """LSH bucket keys of memory embeddings (one row per band), for similarity blocking."""
+
+    __tablename__ = "memory_signatures"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, default="")  # "" for no namespace
+    memory_id = Column(Integer, nullable=False, index=True)
+    bucket = Column(Integer, nullable=False)
+
+    __table_args__ = (Index("idx_memory_signature_bucket", "namespace", "bucket"),)
+
+
+class TemporalEdge(Base):
+    """Temporal adjacency between memories: ``source_id`` happened before ``target_id``."""
+
+    __tablename__ = "temporal_edges"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, default="")  # "" for no namespace
+    source_id = Column(Integer, nullable=False)
+    target_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_temporal_edge_forward", "namespace", "source_id", "target_id", unique=True),
+        Index("idx_temporal_edge_backward", "namespace", "target_id", "source_id"),
+    )
+
+
+class ConsolidationState(Base):
+    """Per-namespace consolidation progress."""
+
+    __tablename__ = "consolidation_state"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, unique=True)  # "" for no namespace
+    # (updated_at, id) of the last memory consolidated
+    watermark_at = Column(DateTime)
+    watermark_id = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ConsolidationLease(Base):
+    """Per-namespace consolidation lease (which process may consolidate, until when)."""
+
+    __tablename__ = "consolidation_leases"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, unique=True)  # "" for no namespace
+    owner = Column(String(255), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    acquired_at = Column(DateTime, default=datetime.utcnow)
+
+
+class WriteVersion(Base):
+    """Per-namespace count of writes that can change retrieval results (from any process)."""
+
+    __tablename__ = "write_versions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, unique=True)  # "" for no namespace
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class Storage:
     """
     SQL-first storage layer for memories.
@@ -105,7 +352,16 @@ class Storage:
         self.SessionLocal = sessionmaker(bind=self.engine)
 
         # Create tables
+        existing_tables = set(inspect(self.engine).get_table_names())
         Base.metadata.create_all(self.engine)
+        added = self._add_missing_columns()
+        self._enable_sqlite_autoincrement()
+        for table in (Memory.__table__, MemoryArchive.__table__):
+            if (table.name, "event_at") in added:
+                self._backfill_event_at(table)
+            if table.name in existing_tables and TemporalEdge.__tablename__ not in existing_tables:
+                self._backfill_temporal_edges(table)
+        self._create_missing_indexes()
 
         logger.info(f"Storage initialized: {connection_string}")
 
@@ -113,11 +369,222 @@ class Storage:
         """Get database session."""
         return self.SessionLocal()
 
+    def _add_missing_columns(self) -> Set[Tuple[str, str]]:
+        """
+        Add nullable columns introduced after a table was created (create_all skips them).
+        
+        Returns:
+            (table, column) names added by this call
+        """
+        added = set()
+        inspector = inspect(self.engine)
+        quote = self.engine.dialect.identifier_preparer.quote
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                try:
+                    with self.engine.begin() as connection:
+                        connection.execute(
+                            text(
+                                f"ALTER TABLE {quote(table.name)} "
+                                f"ADD COLUMN {quote(column.name)} {column_type}"
+                            )
+                        )
+                    added.add((table.name, column.name))
+                    logger.info(f"Added column {table.name}.{column.name}")
+                except Exception as e:
+                    # e.g. added concurrently by another worker
+                    logger.warning(f"Failed to add column {table.name}.{column.name}: {e}")
+        return added
+
+    def _enable_sqlite_autoincrement(self):
+        """
+        Rebuild a SQLite memories table created without AUTOINCREMENT.
+        
+        Without it SQLite hands the largest row ID out again once that row
+        is deleted, which can give an archived memory's ID to a new memory.
+        The sequence is started above every ID in the hot and archive tables.
+        """
+        if self.engine.dialect.name != "sqlite":
+            return
+        name = Memory.__tablename__
+        legacy = f"{name}_legacy"
+        columns = ", ".join(_MEMORY_COLUMNS)
+        with self.engine.begin() as connection:
+            schema = connection.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": name},
+            ).scalar()
+            if schema is None or "AUTOINCREMENT" in schema.upper():
+                return
+            connection.execute(text(f"ALTER TABLE {name} RENAME TO {legacy}"))
+            # Index names stay taken by the renamed table
+            indexes = connection.execute(
+                text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = :name AND sql IS NOT NULL"
+                ),
+                {"name": legacy},
+            ).scalars().all()
+            for index in indexes:
+                connection.execute(text(f'DROP INDEX "{index}"'))
+            Memory.__table__.create(connection)
+            connection.execute(
+                text(f"INSERT INTO {name} ({columns}) SELECT {columns} FROM {legacy}")
+            )
+            connection.execute(text(f"DROP TABLE {legacy}"))
+            top = max(
+                connection.execute(select(func.max(Memory.id))).scalar() or 0,
+                connection.execute(select(func.max(MemoryArchive.id))).scalar() or 0,
+            )
+            connection.execute(text("DELETE FROM sqlite_sequence WHERE name = :name"), {"name": name})
+            connection.execute(
+                text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+                {"name": name, "seq": top},
+            )
+        logger.info(f"Rebuilt {name} with AUTOINCREMENT (next ID above {top})")
+
+    def _backfill_event_at(self, table: Any, batch_size: int = 1000):
+        """Fill a new event_at column from the metadata timestamps of existing rows."""
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("row_id"))
+            .values(event_at=bindparam("event_at"), updated_at=table.c.updated_at)
+        )
+        after_id, filled = 0, 0
+        with self.engine.begin() as connection:
+            while True:
+                rows = connection.execute(
+                    select(table.c.id, table.c.extra_metadata)
+                    .where(table.c.id > after_id)
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                params = []
+                for row in rows:
+                    event_at = event_time({"metadata": row.extra_metadata})
+                    if event_at is not None:
+                        params.append({"row_id": row.id, "event_at": event_at})
+                if params:
+                    connection.execute(statement, params)
+                    filled += len(params)
+                after_id = rows[-1].id
+        logger.info(f"Backfilled event_at of {filled} rows in {table.name}")
+
+    def _backfill_temporal_edges(self, table: Any, batch_size: int = 1000):
+        """Fill the new temporal_edges table from the metadata before/after lists of existing rows."""
+        after_id, filled = 0, 0
+        with self.engine.begin() as connection:
+            while True:
+                rows = connection.execute(
+                    select(table.c.id, table.c.namespace, table.c.extra_metadata)
+                    .where(table.c.id > after_id)
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                edges = []
+                for row in rows:
+                    metadata = row.extra_metadata or {}
+                    if not isinstance(metadata, dict):
+                        continue
+                    for source_id, target_id in temporal_links(
+                        row.id, metadata.get("before"), metadata.get("after")
+                    ):
+                        edges.append((row.namespace or "", source_id, target_id))
+                filled += self._insert_temporal_edges(connection, edges)
+                after_id = rows[-1].id
+        logger.info(f"Backfilled {filled} temporal edges from {table.name}")
+
+    @staticmethod
+    def _insert_temporal_edges(connection: Any, edges: Iterable[Tuple[str, int, int]]) -> int:
+        """
+        Insert (namespace, source_id, target_id) edges that do not exist yet (no commit).
+        
+        Args:
+            connection: Connection or session
+            edges: Temporal edges
+        
+        Returns:
+            Number of edges inserted
+        """
+        by_namespace: Dict[str, Set[Tuple[int, int]]] = {}
+        for namespace, source_id, target_id in edges:
+            by_namespace.setdefault(namespace, set()).add((source_id, target_id))
+
+        inserted = 0
+        for namespace, pairs in by_namespace.items():
+            sources = sorted({source_id for source_id, _ in pairs})
+            for start in range(0, len(sources), 500):
+                pairs -= set(
+                    connection.execute(
+                        select(TemporalEdge.source_id, TemporalEdge.target_id)
+                        .where(TemporalEdge.namespace == namespace)
+                        .where(TemporalEdge.source_id.in_(sources[start:start + 500]))
+                    ).all()
+                )
+            if pairs:
+                connection.execute(
+                    TemporalEdge.__table__.insert(),
+                    [
+                        {"namespace": namespace, "source_id": source_id, "target_id": target_id}
+                        for source_id, target_id in sorted(pairs)
+                    ],
+                )
+                inserted += len(pairs)
+        return inserted
+
+    def _create_missing_indexes(self):
+        """Add indexes introduced after a table was created (create_all skips them)."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(self.engine, checkfirst=True)
+                except Exception as e:
+                    logger.warning(f"Failed to create index {index.name}: {e}")
+
+    def for_namespace(self, namespace: Optional[str]) -> "Storage":
+        """
+        Get a storage view bound to another namespace.
+        
+        The view shares this instance's SQLAlchemy engine and connection pool,
+        so creating one is cheap.
+        
+        Args:
+            namespace: Namespace for the view
+            
+        Returns:
+            Storage instance scoped to the namespace
+        """
+        view = copy.copy(self)
+        view.namespace = namespace
+        return view
+
+    def list_namespaces(self) -> List[Optional[str]]:
+        """List namespaces that have stored memories."""
+        session = self.get_session()
+        try:
+            rows = session.query(Memory.namespace).distinct().all()
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to list namespaces: {e}")
+            return []
+        finally:
+            session.close()
+
     async def store_memories(self, memories: List[Dict[str, Any]]):
         """
         Store memories in database.
         
         Checks for duplicates before storing to avoid storing the same memory multiple times.
+        The ``id`` of each stored (or matching existing) memory is set on its
+        dictionary, so that callers such as the graph builder can link to it.
         
         Args:
             memories: List of memory dictionaries
@@ -129,6 +596,9 @@ class Storage:
         try:
             stored_count = 0
             skipped_count = 0
+            promoted_count = 0
+            new_rows = []
+            written_namespaces = set()
             
             for memory_data in memories:
                 content = memory_data.get("content", "").strip()
@@ -155,6 +625,26 @@ class Storage:
                     # Update timestamp and access count to show it was referenced again
                     existing.updated_at = datetime.utcnow()
                     existing.access_count = (existing.access_count or 0) + 1
+                    memory_data["id"] = existing.id
+                    continue
+                
+                # A mention of an archived memory promotes it back
+                archived = (
+                    session.query(MemoryArchive.id)
+                    .filter(MemoryArchive.content.ilike(content))
+                    .filter(MemoryArchive.memory_type == memory_type)
+                    .filter(
+                        MemoryArchive.namespace == namespace
+                        if namespace else MemoryArchive.namespace.is_(None)
+                    )
+                    .first()
+                )
+                if archived:
+                    logger.debug(f"Memory was archived (promoting): {content[:50]}...")
+                    skipped_count += 1
+                    promoted_count += self._move_to_hot(session, [archived.id])
+                    memory_data["id"] = archived.id
+                    written_namespaces.add(namespace)
                     continue
                 
                 # Check for similar content (fuzzy match for near-duplicates)
@@ -188,6 +678,7 @@ class Storage:
                                 # Update existing memory
                                 existing_mem.updated_at = datetime.utcnow()
                                 existing_mem.access_count = (existing_mem.access_count or 0) + 1
+                                memory_data["id"] = existing_mem.id
                                 break
                 
                 if is_duplicate:
@@ -201,11 +692,20 @@ class Storage:
                     extra_metadata=memory_data.get("metadata", {}),
                     embedding=memory_data.get("embedding"),
                     importance_score=memory_data.get("importance_score", 0.0),
+                    event_at=event_time(memory_data),
                 )
                 session.add(memory)
+                new_rows.append((memory_data, memory))
+                written_namespaces.add(namespace)
                 stored_count += 1
 
+            if new_rows:
+                session.flush()
+                for memory_data, memory in new_rows:
+                    memory_data["id"] = memory.id
             session.commit()
+            if written_namespaces:
+                self._bump_write_version(written_namespaces)
             logger.debug(f"Stored {stored_count} new memories, skipped {skipped_count} duplicates")
         except Exception as e:
             session.rollback()
@@ -246,6 +746,43 @@ class Storage:
         finally:
             session.close()
 
+    async def store_conversations(
+        self,
+        conversations: List[
+            Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], Optional[List[Dict[str, Any]]]]
+        ],
+    ):
+        """
+        Store several conversations in one transaction.
+        
+        Args:
+            conversations: List of (messages, response, extracted_memories) tuples
+        """
+        if not conversations:
+            return
+
+        session = self.get_session()
+        try:
+            session.add_all(
+                [
+                    Conversation(
+                        namespace=self.namespace,
+                        messages=messages,
+                        response=response,
+                        extracted_memories=extracted_memories,
+                    )
+                    for messages, response, extracted_memories in conversations
+                ]
+            )
+            session.commit()
+            logger.debug(f"Stored {len(conversations)} conversations")
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to store conversations: {e}")
+            raise
+        finally:
+            session.close()
+
     async def get_memories(
         self,
         memory_type: Optional[str] = None,
@@ -253,7 +790,10 @@ class Storage:
         offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """
-        Get memories from database.
+        Get memories from database, most important first.
+        
+        Importance includes the recency bonus as of now (see
+        ``effective_importance``).
         
         Args:
             memory_type: Filter by memory type
@@ -273,7 +813,13 @@ class Storage:
             if memory_type:
                 query = query.filter(Memory.memory_type == memory_type)
             
-            memories = query.order_by(Memory.importance_score.desc()).limit(limit).offset(offset).all()
+            now = datetime.utcnow()
+            memories = (
+                query.order_by(_effective_importance_expr(now).desc(), Memory.id.desc())
+                .limit(limit)
+                .offset(offset)
+                .all()
+            )
             
             return [
                 {
@@ -282,7 +828,9 @@ class Storage:
                     "type": m.memory_type,
                     "metadata": m.extra_metadata or {},
                     "embedding": m.embedding,
-                    "importance_score": m.importance_score,
+                    "importance_score": effective_importance(
+                        m.importance_score, m.memory_type, m.created_at, now
+                    ),
                     "created_at": m.created_at.isoformat() if m.created_at else None,
                 }
                 for m in memories
@@ -319,7 +867,12 @@ class Storage:
             if memory_type:
                 db_query = db_query.filter(Memory.memory_type == memory_type)
             
-            memories = db_query.order_by(Memory.importance_score.desc()).limit(limit).all()
+            now = datetime.utcnow()
+            memories = (
+                db_query.order_by(_effective_importance_expr(now).desc(), Memory.id.desc())
+                .limit(limit)
+                .all()
+            )
             
             return [
                 {
@@ -327,7 +880,9 @@ class Storage:
                     "content": m.content,
                     "type": m.memory_type,
                     "metadata": m.extra_metadata or {},
-                    "importance_score": m.importance_score,
+                    "importance_score": effective_importance(
+                        m.importance_score, m.memory_type, m.created_at, now
+                    ),
                 }
                 for m in memories
             ]
@@ -337,43 +892,1125 @@ class Storage:
         finally:
             session.close()
 
-    async def update_memory_importance(self, memory_id: int, importance_score: float):
+    async def get_memories_by_event_time(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        memory_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
-        Update memory importance score.
+        Get memories whose event time falls in a range, ordered by event time.
+        
+        Filtering and ordering run in SQL on the (namespace, event_at) index.
+        Memories without an event time are never returned.
         
         Args:
-            memory_id: Memory ID
-            importance_score: New importance score
+            start: Earliest event time (inclusive, optional)
+            end: Latest event time (inclusive, optional)
+            memory_type: Filter by memory type
+            limit: Maximum number of results (None for all)
+            descending: Latest first (default) or earliest first
+            
+        Returns:
+            List of memory dictionaries (with ``event_at``)
         """
         session = self.get_session()
         try:
-            memory = session.query(Memory).filter(Memory.id == memory_id).first()
-            if memory:
-                memory.importance_score = importance_score
-                memory.updated_at = datetime.utcnow()
-                session.commit()
+            query = session.query(Memory).filter(Memory.event_at.isnot(None))
+            if self.namespace:
+                query = query.filter(Memory.namespace == self.namespace)
+            if start is not None:
+                query = query.filter(Memory.event_at >= _naive_utc(start))
+            if end is not None:
+                query = query.filter(Memory.event_at <= _naive_utc(end))
+            if memory_type:
+                query = query.filter(Memory.memory_type == memory_type)
+
+            if descending:
+                query = query.order_by(Memory.event_at.desc(), Memory.id.desc())
+            else:
+                query = query.order_by(Memory.event_at, Memory.id)
+            if limit is not None:
+                query = query.limit(limit)
+
+            now = datetime.utcnow()
+            return [
+                {
+                    "id": m.id,
+                    "content": m.content,
+                    "type": m.memory_type,
+                    "metadata": m.extra_metadata or {},
+                    "importance_score": effective_importance(
+                        m.importance_score, m.memory_type, m.created_at, now
+                    ),
+                    "created_at": m.created_at.isoformat() if m.created_at else None,
+                    "event_at": m.event_at.isoformat(),
+                }
+                for m in query
+            ]
         except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to update memory importance: {e}")
+            logger.error(f"Failed to get memories by event time: {e}")
+            return []
         finally:
             session.close()
 
-    async def delete_memory(self, memory_id: int):
+    async def get_changed_memories(
+        self,
+        since: Optional[Tuple[datetime, int]] = None,
+        until: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
         """
-        Delete a memory.
+        Get memories created or updated after a watermark, oldest change first.
+        
+        Importance scores are returned as stored (without recency bonus).
         
         Args:
-            memory_id: Memory ID to delete
+            since: (updated_at, id) watermark; None starts from the beginning
+            until: Ignore changes at or after this time (lets in-flight writes settle)
+            limit: Maximum number of results
+            
+        Returns:
+            List of memory dictionaries (with ``updated_at`` and ``access_count``)
         """
         session = self.get_session()
         try:
-            memory = session.query(Memory).filter(Memory.id == memory_id).first()
-            if memory:
-                session.delete(memory)
-                session.commit()
+            query = session.query(Memory)
+            if self.namespace:
+                query = query.filter(Memory.namespace == self.namespace)
+            if since is not None:
+                since_at, since_id = since
+                query = query.filter(
+                    or_(
+                        Memory.updated_at > since_at,
+                        and_(Memory.updated_at == since_at, Memory.id > since_id),
+                    )
+                )
+            if until is not None:
+                query = query.filter(Memory.updated_at < until)
+
+            memories = query.order_by(Memory.updated_at, Memory.id).limit(limit).all()
+            return [self._raw_dict(m) for m in memories]
         except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to delete memory: {e}")
+            logger.error(f"Failed to get changed memories: {e}")
+            raise StorageError(f"Failed to get changed memories: {e}") from e
+        finally:
+            session.close()
+
+    async def get_memories_by_prefix(
+        self, prefixes: Iterable[str], limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Get memories whose content starts with any of the given prefixes.
+        
+        Matching is case-insensitive. Prefixes are grouped by length and
+        looked up with one ``lower(substr(content, 1, n)) IN (...)`` query per
+        length, instead of one LIKE pattern per prefix. Importance scores are
+        returned as stored.
+        
+        Args:
+            prefixes: Content prefixes
+            limit: Maximum number of results per query
+            
+        Returns:
+            List of memory dictionaries
+        """
+        by_length: Dict[int, List[str]] = {}
+        for prefix in set(p.lower() for p in prefixes if p):
+            by_length.setdefault(len(prefix), []).append(prefix)
+        if not by_length:
+            return []
+
+        session = self.get_session()
+        try:
+            results: Dict[int, Dict[str, Any]] = {}
+            for length, group in sorted(by_length.items()):
+                head = func.lower(func.substr(Memory.content, 1, length))
+                for start in range(0, len(group), 500):
+                    query = session.query(Memory).filter(head.in_(group[start:start + 500]))
+                    if self.namespace:
+                        query = query.filter(Memory.namespace == self.namespace)
+                    for m in query.limit(limit):
+                        results[m.id] = self._raw_dict(m)
+            return list(results.values())
+        except Exception as e:
+            logger.error(f"Failed to get memories by prefix: {e}")
+            raise StorageError(f"Failed to get memories by prefix: {e}") from e
+        finally:
+            session.close()
+
+    async def get_memories_by_ids(self, memory_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Get memories by ID (importance scores as stored).
+        
+        Args:
+            memory_ids: Memory IDs
+            
+        Returns:
+            List of memory dictionaries (missing IDs are skipped)
+        """
+        memory_ids = list(set(memory_ids))
+        if not memory_ids:
+            return []
+
+        session = self.get_session()
+        try:
+            results = []
+            for start in range(0, len(memory_ids), 500):
+                query = session.query(Memory).filter(Memory.id.in_(memory_ids[start:start + 500]))
+                if self.namespace:
+                    query = query.filter(Memory.namespace == self.namespace)
+                results.extend(self._raw_dict(m) for m in query)
+            return results
+        except Exception as e:
+            logger.error(f"Failed to get memories by ID: {e}")
+            raise StorageError(f"Failed to get memories by ID: {e}") from e
+        finally:
+            session.close()
+
+    async def scan_memories(self, after_id: int = 0, limit: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Page through the memories of this namespace in ID order (keyset pagination).
+        
+        Args:
+            after_id: Return memories with a larger ID
+            limit: Maximum number of results
+            
+        Returns:
+            List of memory dictionaries (importance scores as stored)
+        """
+        session = self.get_session()
+        try:
+            query = session.query(Memory).filter(Memory.id > after_id)
+            if self.namespace:
+                query = query.filter(Memory.namespace == self.namespace)
+            return [self._raw_dict(m) for m in query.order_by(Memory.id).limit(limit)]
+        except Exception as e:
+            logger.error(f"Failed to scan memories: {e}")
+            raise StorageError(f"Failed to scan memories: {e}") from e
+        finally:
+            session.close()
+
+    def store_signatures(self, signatures: Dict[int, Iterable[int]]):
+        """
+        Replace the LSH bucket keys of memories, in one transaction.
+        
+        Args:
+            signatures: memory_id -> bucket keys
+        """
+        if not signatures:
+            return
+
+        namespace = self.namespace or ""
+        rows = [
+            {"namespace": namespace, "memory_id": memory_id, "bucket": int(bucket)}
+            for memory_id, buckets in signatures.items()
+            for bucket in buckets
+        ]
+        memory_ids = list(signatures)
+        session = self.get_session()
+        try:
+            for start in range(0, len(memory_ids), 500):
+                session.query(MemorySignature).filter(
+                    MemorySignature.memory_id.in_(memory_ids[start:start + 500])
+                ).delete(synchronize_session=False)
+            if rows:
+                session.execute(MemorySignature.__table__.insert(), rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to store memory signatures: {e}")
+            raise StorageError(f"Failed to store memory signatures: {e}") from e
+        finally:
+            session.close()
+
+    def find_signature_matches(self, buckets: Iterable[int]) -> List[Tuple[int, int]]:
+        """
+        Memories sharing LSH buckets in this namespace.
+        
+        Args:
+            buckets: Bucket keys
+            
+        Returns:
+            (bucket, memory_id) rows
+        """
+        buckets = sorted(set(int(bucket) for bucket in buckets))
+        if not buckets:
+            return []
+
+        session = self.get_session()
+        try:
+            matches = []
+            for start in range(0, len(buckets), 500):
+                matches.extend(
+                    session.query(MemorySignature.bucket, MemorySignature.memory_id)
+                    .filter(MemorySignature.namespace == (self.namespace or ""))
+                    .filter(MemorySignature.bucket.in_(buckets[start:start + 500]))
+                    .all()
+                )
+            return [(bucket, memory_id) for bucket, memory_id in matches]
+        except Exception as e:
+            logger.error(f"Failed to find signature matches: {e}")
+            return []
+        finally:
+            session.close()
+
+    async def store_temporal_edges(self, edges: Iterable[Tuple[int, int]]) -> int:
+        """
+        Record that memories happened before others (existing edges are kept once).
+        
+        Args:
+            edges: (source_id, target_id) pairs, source happening first
+        
+        Returns:
+            Number of new edges
+        """
+        namespace = self.namespace or ""
+        rows = [
+            (namespace, int(source_id), int(target_id))
+            for source_id, target_id in edges
+            if source_id != target_id
+        ]
+        if not rows:
+            return 0
+
+        session = self.get_session()
+        try:
+            inserted = self._insert_temporal_edges(session, rows)
+            session.commit()
+            return inserted
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to store temporal edges: {e}")
+            raise StorageError(f"Failed to store temporal edges: {e}") from e
+        finally:
+            session.close()
+
+    async def get_temporal_sequence(
+        self,
+        memory_id: int,
+        direction: str = "forward",
+        max_depth: int = 10,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Memories reachable from a memory along temporal edges, in temporal order.
+        
+        The traversal is a recursive CTE over the indexed ``temporal_edges``
+        table, bounded by ``max_depth`` steps (which also bounds cycles), so
+        its cost depends on the sequence length, not on the number of stored
+        memories. An archived starting memory is promoted back to the hot
+        table (asking for its sequence counts as an access); other archived
+        memories are traversed but not returned.
+        
+        Args:
+            memory_id: Starting memory ID
+            direction: "forward" (later memories) or "backward" (earlier ones)
+            max_depth: Maximum number of steps from the starting memory
+            limit: Maximum number of memories besides the starting one
+        
+        Returns:
+            Memory dictionaries (with ``depth``, 0 for the starting memory),
+            earliest first; empty if the starting memory does not exist
+        """
+        forward = direction == "forward"
+        near, far = (
+            (TemporalEdge.source_id, TemporalEdge.target_id)
+            if forward else (TemporalEdge.target_id, TemporalEdge.source_id)
+        )
+        reach = (
+            select(Memory.id.label("memory_id"), literal(0).label("depth"))
+            .where(Memory.id == memory_id)
+            .cte("reach", recursive=True)
+        )
+        reach = reach.union(
+            select(far, reach.c.depth + 1)
+            .where(near == reach.c.memory_id)
+            .where(TemporalEdge.namespace == (self.namespace or ""))
+            .where(reach.c.depth < max_depth)
+        )
+        steps = (
+            select(reach.c.memory_id, func.min(reach.c.depth).label("depth"))
+            .group_by(reach.c.memory_id)
+            .subquery()
+        )
+
+        session = self.get_session()
+        try:
+            archived = session.query(MemoryArchive.namespace).filter(MemoryArchive.id == memory_id)
+            if self.namespace:
+                archived = archived.filter(MemoryArchive.namespace == self.namespace)
+            archived = archived.first()
+            if archived is not None:
+                self._move_to_hot(session, [memory_id])
+                session.commit()
+                self._bump_write_version([archived.namespace])
+
+            query = session.query(Memory, steps.c.depth).join(steps, Memory.id == steps.c.memory_id)
+            if self.namespace:
+                query = query.filter(Memory.namespace == self.namespace)
+            # Nearest first; within a step, backward sequences are reversed below
+            event_order = Memory.event_at if forward else Memory.event_at.desc()
+            id_order = Memory.id if forward else Memory.id.desc()
+            query = query.order_by(
+                steps.c.depth, Memory.event_at.is_(None), event_order, id_order
+            )
+            if limit is not None:
+                query = query.limit(limit + 1)
+
+            now = datetime.utcnow()
+            sequence = [
+                {
+                    "id": m.id,
+                    "content": m.content,
+                    "type": m.memory_type,
+                    "metadata": m.extra_metadata or {},
+                    "importance_score": effective_importance(
+                        m.importance_score, m.memory_type, m.created_at, now
+                    ),
+                    "created_at": m.created_at.isoformat() if m.created_at else None,
+                    "event_at": m.event_at.isoformat() if m.event_at else None,
+                    "depth": depth,
+                }
+                for m, depth in query
+            ]
+            if not sequence or sequence[0]["id"] != memory_id:
+                return []
+            return sequence if forward else sequence[::-1]
+        except Exception as e:
+            logger.error(f"Failed to get temporal sequence: {e}")
+            return []
+        finally:
+            session.close()
+
+    def _redirect_temporal_edges(self, session: Session, mapping: Dict[int, int]):
+        """Point temporal edges of merged memories at their canonical memory (no commit)."""
+        merged = list(mapping)
+        rows = []
+        for start in range(0, len(merged), 500):
+            chunk = merged[start:start + 500]
+            rows.extend(
+                session.execute(
+                    select(
+                        TemporalEdge.id,
+                        TemporalEdge.namespace,
+                        TemporalEdge.source_id,
+                        TemporalEdge.target_id,
+                    ).where(
+                        or_(TemporalEdge.source_id.in_(chunk), TemporalEdge.target_id.in_(chunk))
+                    )
+                ).all()
+            )
+        if not rows:
+            return
+        edge_ids = sorted({row.id for row in rows})
+        for start in range(0, len(edge_ids), 500):
+            session.execute(
+                TemporalEdge.__table__.delete().where(
+                    TemporalEdge.id.in_(edge_ids[start:start + 500])
+                )
+            )
+        edges = []
+        for row in rows:
+            source_id = mapping.get(row.source_id, row.source_id)
+            target_id = mapping.get(row.target_id, row.target_id)
+            if source_id != target_id:
+                edges.append((row.namespace, source_id, target_id))
+        self._insert_temporal_edges(session, edges)
+
+    @staticmethod
+    def _raw_dict(m: Memory) -> Dict[str, Any]:
+        """Memory row as a dictionary with the stored importance score."""
+        return {
+            "id": m.id,
+            "content": m.content,
+            "type": m.memory_type,
+            "metadata": m.extra_metadata or {},
+            "embedding": m.embedding,
+            "importance_score": m.importance_score or 0.0,
+            "access_count": m.access_count or 0,
+            "created_at": m.created_at.isoformat() if m.created_at else None,
+            "updated_at": m.updated_at,
+        }
+
+    def get_write_version(self) -> int:
+        """
+        Write version of this namespace (of all namespaces for unscoped storage).
+        
+        The version changes whenever memories are stored, promoted, archived,
+        merged, deleted or rescored by any process sharing the database, so
+        callers can tell whether cached retrieval results may be stale.
+        
+        Returns:
+            Write version (-1 if it could not be read)
+        """
+        session = self.get_session()
+        try:
+            query = session.query(func.coalesce(func.sum(WriteVersion.version), 0))
+            if self.namespace:
+                query = query.filter(WriteVersion.namespace == self.namespace)
+            return int(query.scalar())
+        except Exception as e:
+            logger.warning(f"Failed to read write version: {e}")
+            return -1
+        finally:
+            session.close()
+
+    def _bump_write_version(self, namespaces: Optional[Iterable[Optional[str]]] = None):
+        """Count a committed write in namespaces (default: this storage's namespace)."""
+        keys = sorted({namespace or "" for namespace in (namespaces or [self.namespace])})
+        session = self.get_session()
+        try:
+            for key in keys:
+                for attempt in range(2):
+                    bumped = (
+                        session.query(WriteVersion)
+                        .filter(WriteVersion.namespace == key)
+                        .update(
+                            {
+                                WriteVersion.version: WriteVersion.version + 1,
+                                WriteVersion.updated_at: datetime.utcnow(),
+                            },
+                            synchronize_session=False,
+                        )
+                    )
+                    if not bumped:
+                        session.add(WriteVersion(namespace=key, version=1))
+                    try:
+                        session.commit()
+                        break
+                    except IntegrityError:
+                        # Row created concurrently by another process: bump it instead
+                        session.rollback()
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Failed to bump write version: {e}")
+        finally:
+            session.close()
+
+    def get_consolidation_watermark(self) -> Optional[Tuple[datetime, int]]:
+        """
+        Get the (updated_at, id) of the last memory consolidated in this namespace.
+        
+        Returns:
+            Watermark, or None if the namespace was never consolidated
+        """
+        session = self.get_session()
+        try:
+            state = (
+                session.query(ConsolidationState)
+                .filter(ConsolidationState.namespace == (self.namespace or ""))
+                .first()
+            )
+            if state is None or state.watermark_at is None:
+                return None
+            return state.watermark_at, state.watermark_id or 0
+        finally:
+            session.close()
+
+    def set_consolidation_watermark(self, watermark_at: datetime, watermark_id: int):
+        """
+        Record the (updated_at, id) of the last memory consolidated in this namespace.
+        
+        Args:
+            watermark_at: updated_at of the memory
+            watermark_id: ID of the memory
+        """
+        session = self.get_session()
+        try:
+            namespace = self.namespace or ""
+            state = (
+                session.query(ConsolidationState)
+                .filter(ConsolidationState.namespace == namespace)
+                .first()
+            )
+            if state is None:
+                state = ConsolidationState(namespace=namespace)
+                session.add(state)
+            state.watermark_at = watermark_at
+            state.watermark_id = watermark_id
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to save consolidation watermark: {e}")
+            raise StorageError(f"Failed to save consolidation watermark: {e}") from e
+        finally:
+            session.close()
+
+    def acquire_lease(self, owner: str, ttl: float) -> bool:
+        """
+        Acquire or renew the consolidation lease of this namespace.
+        
+        The lease is taken with a single conditional UPDATE (held by ``owner``
+        or expired), or an INSERT when the namespace never had one, so two
+        processes racing for it cannot both win. Expiry uses the callers'
+        clocks; ``ttl`` should be well above the clock skew between hosts.
+        
+        Args:
+            owner: Unique ID of the calling process
+            ttl: Seconds the lease is valid without renewal
+            
+        Returns:
+            True if ``owner`` holds the lease until now + ttl
+        """
+        namespace = self.namespace or ""
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl)
+        table = ConsolidationLease.__table__
+        session = self.get_session()
+        try:
+            result = session.execute(
+                table.update()
+                .where(table.c.namespace == namespace)
+                .where(or_(table.c.owner == owner, table.c.expires_at < now))
+                .values(
+                    owner=owner,
+                    expires_at=expires_at,
+                    acquired_at=case((table.c.owner == owner, table.c.acquired_at), else_=now),
+                )
+            )
+            if result.rowcount == 1:
+                session.commit()
+                return True
+
+            session.add(
+                ConsolidationLease(
+                    namespace=namespace, owner=owner, expires_at=expires_at, acquired_at=now
+                )
+            )
+            session.commit()
+            return True
+        except IntegrityError:
+            # The lease row exists and is held by another owner
+            session.rollback()
+            return False
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to acquire consolidation lease: {e}")
+            return False
+        finally:
+            session.close()
+
+    def release_lease(self, owner: str):
+        """
+        Release the consolidation lease of this namespace if ``owner`` holds it.
+        
+        Args:
+            owner: Unique ID of the calling process
+        """
+        table = ConsolidationLease.__table__
+        session = self.get_session()
+        try:
+            session.execute(
+                table.update()
+                .where(table.c.namespace == (self.namespace or ""))
+                .where(table.c.owner == owner)
+                .values(expires_at=datetime.utcnow())
+            )
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to release consolidation lease: {e}")
+        finally:
+            session.close()
+
+    def get_lease(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the consolidation lease of this namespace.
+        
+        Returns:
+            Dictionary with owner, expires_at, acquired_at and active, or None
+        """
+        session = self.get_session()
+        try:
+            lease = (
+                session.query(ConsolidationLease)
+                .filter(ConsolidationLease.namespace == (self.namespace or ""))
+                .first()
+            )
+            if lease is None:
+                return None
+            return {
+                "owner": lease.owner,
+                "expires_at": lease.expires_at.isoformat(),
+                "acquired_at": lease.acquired_at.isoformat() if lease.acquired_at else None,
+                "active": lease.expires_at > datetime.utcnow(),
+            }
+        finally:
+            session.close()
+
+    async def update_memory_importance(self, memory_id: int, importance_score: float):
+        """
+        Update memory importance score.
+        
+        Args:
+            memory_id: Memory ID
+            importance_score: New importance score
+        """
+        session = self.get_session()
+        try:
+            memory = session.query(Memory).filter(Memory.id == memory_id).first()
+            if memory:
+                memory.importance_score = importance_score
+                memory.updated_at = datetime.utcnow()
+                session.commit()
+                self._bump_write_version()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to update memory importance: {e}")
+        finally:
+            session.close()
+
+    async def bulk_update_importance(
+        self, scores: Iterable[Tuple[int, float]], chunk_size: int = 1000
+    ) -> int:
+        """
+        Update the importance scores of many memories in one transaction.
+        
+        Each chunk is a single executemany UPDATE keyed by primary key, so
+        the write lock is taken once instead of once per memory.
+        ``updated_at`` is left alone: importance is derived from access
+        patterns and is not a change to the memory itself.
+        
+        Args:
+            scores: (memory_id, importance_score) pairs
+            chunk_size: Rows per executemany batch
+            
+        Returns:
+            Number of memories updated
+        """
+        params = [{"memory_id": memory_id, "score": score} for memory_id, score in scores]
+        if not params:
+            return 0
+
+        table = Memory.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("memory_id"))
+            # Explicitly keep updated_at (it would otherwise get its onupdate default)
+            .values(importance_score=bindparam("score"), updated_at=table.c.updated_at)
+        )
+        session = self.get_session()
+        try:
+            updated = 0
+            for start in range(0, len(params), chunk_size):
+                result = session.execute(statement, params[start:start + chunk_size])
+                updated += max(result.rowcount, 0)
+            session.commit()
+            if updated:
+                self._bump_write_version()
+            logger.debug(f"Updated importance of {updated} memories")
+            return updated
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to bulk update memory importance: {e}")
+            raise StorageError(f"Failed to bulk update memory importance: {e}") from e
+        finally:
+            session.close()
+
+    async def merge_memories(self, merges: List[Dict[str, Any]]) -> int:
+        """
+        Merge duplicate memories into canonical ones, in one transaction.
+        
+        Each canonical memory gets the given access count, importance score
+        and metadata (one executemany UPDATE); its duplicates and their
+        signatures are deleted in batches, and temporal edges of the
+        duplicates are redirected to it.
+        
+        Args:
+            merges: Dictionaries with ``id`` (canonical memory), ``duplicates``
+                (IDs to delete), ``access_count``, ``importance_score`` and
+                ``metadata``
+            
+        Returns:
+            Number of duplicate memories deleted
+        """
+        if not merges:
+            return 0
+
+        table = Memory.__table__
+        now = datetime.utcnow()
+        duplicates = [memory_id for merge in merges for memory_id in merge["duplicates"]]
+        session = self.get_session()
+        try:
+            session.execute(
+                table.update()
+                .where(table.c.id == bindparam("memory_id"))
+                .values(
+                    access_count=bindparam("access"),
+                    importance_score=bindparam("score"),
+                    extra_metadata=bindparam("metadata", type_=JSON),
+                    updated_at=now,
+                ),
+                [
+                    {
+                        "memory_id": merge["id"],
+                        "access": merge["access_count"],
+                        "score": merge["importance_score"],
+                        "metadata": merge["metadata"],
+                    }
+                    for merge in merges
+                ],
+            )
+            deleted = 0
+            for start in range(0, len(duplicates), 500):
+                chunk = duplicates[start:start + 500]
+                session.execute(
+                    MemorySignature.__table__.delete().where(MemorySignature.memory_id.in_(chunk))
+                )
+                deleted += session.execute(table.delete().where(table.c.id.in_(chunk))).rowcount
+            self._redirect_temporal_edges(
+                session,
+                {duplicate: merge["id"] for merge in merges for duplicate in merge["duplicates"]},
+            )
+            session.commit()
+            self._bump_write_version()
+            return deleted
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to merge memories: {e}")
+            raise StorageError(f"Failed to merge memories: {e}") from e
+        finally:
+            session.close()
+
+    async def delete_memory(self, memory_id: int):
+        """
+        Delete a memory.
+        
+        Args:
+            memory_id: Memory ID to delete
+        """
+        session = self.get_session()
+        try:
+            memory = session.query(Memory).filter(Memory.id == memory_id).first()
+            if memory is None:
+                memory = session.query(MemoryArchive).filter(MemoryArchive.id == memory_id).first()
+            if memory is not None:
+                namespace = memory.namespace
+                session.delete(memory)
+                session.query(MemorySignature).filter(
+                    MemorySignature.memory_id == memory_id
+                ).delete(synchronize_session=False)
+                self._unlink_temporal_edges(session, memory_id)
+                session.commit()
+                self._bump_write_version([namespace])
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to delete memory: {e}")
+        finally:
+            session.close()
+
+    def _unlink_temporal_edges(self, session: Session, memory_id: int):
+        """Remove a memory from its temporal sequences, linking its neighbours directly (no commit)."""
+        rows = session.execute(
+            select(TemporalEdge.namespace, TemporalEdge.source_id, TemporalEdge.target_id).where(
+                or_(TemporalEdge.source_id == memory_id, TemporalEdge.target_id == memory_id)
+            )
+        ).all()
+        if not rows:
+            return
+        session.execute(
+            TemporalEdge.__table__.delete().where(
+                or_(TemporalEdge.source_id == memory_id, TemporalEdge.target_id == memory_id)
+            )
+        )
+        edges = [
+            (earlier.namespace, earlier.source_id, later.target_id)
+            for earlier in rows
+            if earlier.target_id == memory_id
+            for later in rows
+            if later.source_id == memory_id
+            and later.namespace == earlier.namespace
+            and later.target_id != earlier.source_id
+        ]
+        self._insert_temporal_edges(session, edges)
+
+    def _move_to_archive(self, session: Session, memory_ids: List[int]) -> int:
+        """Move memories to the archive table within a session (no commit)."""
+        now = datetime.utcnow()
+        hot = Memory.__table__
+        session.execute(
+            MemoryArchive.__table__.insert().from_select(
+                _MEMORY_COLUMNS + ["archived_at"],
+                select(*[hot.c[name] for name in _MEMORY_COLUMNS], literal(now, DateTime))
+                .where(hot.c.id.in_(memory_ids)),
+            )
+        )
+        # Signatures are rebuilt by consolidation once a memory is promoted
+        session.execute(
+            MemorySignature.__table__.delete().where(MemorySignature.memory_id.in_(memory_ids))
+        )
+        return session.execute(hot.delete().where(hot.c.id.in_(memory_ids))).rowcount
+
+    def _move_to_hot(self, session: Session, memory_ids: List[int]) -> int:
+        """Move archived memories back to the memories table as accessed now (no commit)."""
+        now = datetime.utcnow()
+        cold = MemoryArchive.__table__
+        columns = [
+            literal(now, DateTime).label(name) if name == "updated_at"
+            else (func.coalesce(cold.c.access_count, 0) + 1).label(name) if name == "access_count"
+            else cold.c[name]
+            for name in _MEMORY_COLUMNS
+        ]
+        session.execute(
+            Memory.__table__.insert().from_select(
+                _MEMORY_COLUMNS, select(*columns).where(cold.c.id.in_(memory_ids))
+            )
+        )
+        return session.execute(cold.delete().where(cold.c.id.in_(memory_ids))).rowcount
+
+    async def archive_memories(
+        self,
+        max_importance: float = 0.0,
+        idle_before: Optional[datetime] = None,
+        hot_size: int = 0,
+        chunk_size: int = 500,
+    ) -> int:
+        """
+        Move cold memories of this namespace to the archive table.
+        
+        Archived are memories with a stored importance below
+        ``max_importance`` that were not created, mentioned or promoted
+        since ``idle_before``, and then, while the namespace holds more than
+        ``hot_size`` memories, the least important ones (with recency
+        bonus), idle ones first.
+        
+        Args:
+            max_importance: Stored importance below which idle memories are archived
+            idle_before: Memories updated at or after this time stay hot (None: none idle)
+            hot_size: Maximum memories kept in the hot table (0 = unlimited)
+            chunk_size: Memories moved per statement
+            
+        Returns:
+            Number of memories archived
+        """
+        session = self.get_session()
+        try:
+            scope = session.query(Memory.id)
+            if self.namespace:
+                scope = scope.filter(Memory.namespace == self.namespace)
+
+            archived = 0
+            if idle_before is not None and max_importance > 0:
+                idle = [
+                    row[0]
+                    for row in scope.filter(
+                        func.coalesce(Memory.importance_score, 0.0) < max_importance
+                    ).filter(Memory.updated_at < idle_before)
+                ]
+                for start in range(0, len(idle), chunk_size):
+                    archived += self._move_to_archive(session, idle[start:start + chunk_size])
+                    session.commit()
+
+            if hot_size > 0:
+                excess = scope.count() - hot_size
+                if excess > 0:
+                    order = [
+                        _effective_importance_expr(datetime.utcnow()),
+                        Memory.updated_at,
+                        Memory.id,
+                    ]
+                    if idle_before is not None:
+                        # Memories accessed recently (e.g. just promoted) go last
+                        order.insert(0, case((Memory.updated_at >= idle_before, 1), else_=0))
+                    coldest = [row[0] for row in scope.order_by(*order).limit(excess)]
+                    for start in range(0, len(coldest), chunk_size):
+                        archived += self._move_to_archive(session, coldest[start:start + chunk_size])
+                        session.commit()
+
+            if archived:
+                self._bump_write_version()
+                logger.debug(f"Archived {archived} memories")
+            return archived
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to archive memories: {e}")
+            raise StorageError(f"Failed to archive memories: {e}") from e
+        finally:
+            session.close()
+
+    async def promote_memories(self, memory_ids: Iterable[int]) -> int:
+        """
+        Move archived memories back to the hot table, counting it as an access.
+        
+        Args:
+            memory_ids: Archived memory IDs (others are ignored)
+            
+        Returns:
+            Number of memories promoted
+        """
+        memory_ids = list(set(memory_ids))
+        if not memory_ids:
+            return 0
+
+        session = self.get_session()
+        try:
+            promoted = 0
+            for start in range(0, len(memory_ids), 500):
+                promoted += self._move_to_hot(session, memory_ids[start:start + 500])
+            session.commit()
+            if promoted:
+                self._bump_write_version()
+            return promoted
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to promote memories: {e}")
+            raise StorageError(f"Failed to promote memories: {e}") from e
+        finally:
+            session.close()
+
+    async def search_archive(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Text search over archived memories; matches are promoted back to the hot table.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            memory_type: Filter by memory type
+            
+        Returns:
+            List of matching (now promoted) memories
+        """
+        session = self.get_session()
+        try:
+            db_query = session.query(MemoryArchive).filter(
+                MemoryArchive.content.like(f"%{query}%")
+            )
+            if self.namespace:
+                db_query = db_query.filter(MemoryArchive.namespace == self.namespace)
+            if memory_type:
+                db_query = db_query.filter(MemoryArchive.memory_type == memory_type)
+
+            now = datetime.utcnow()
+            matches = (
+                db_query.order_by(MemoryArchive.importance_score.desc(), MemoryArchive.id.desc())
+                .limit(limit)
+                .all()
+            )
+            results = [
+                {
+                    "id": m.id,
+                    "content": m.content,
+                    "type": m.memory_type,
+                    "metadata": m.extra_metadata or {},
+                    "importance_score": effective_importance(
+                        m.importance_score, m.memory_type, m.created_at, now
+                    ),
+                    "archived": True,
+                }
+                for m in matches
+            ]
+            if results:
+                self._move_to_hot(session, [m["id"] for m in results])
+                session.commit()
+                self._bump_write_version()
+            return results
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to search archive: {e}")
+            return []
+        finally:
+            session.close()
+
+    def _session_cache_query(self, session: Session, session_id: str):
+        """Build query for a spilled session cache entry in this namespace."""
+        query = session.query(SessionCacheEntry).filter(
+            SessionCacheEntry.session_id == session_id
+        )
+        if self.namespace:
+            return query.filter(SessionCacheEntry.namespace == self.namespace)
+        return query.filter(SessionCacheEntry.namespace.is_(None))
+
+    def save_session_cache(
+        self,
+        session_id: str,
+        memories: List[Dict[str, Any]],
+        ttl: Optional[float] = None,
+    ):
+        """
+        Persist session memories evicted from the session cache.
+        
+        Args:
+            session_id: Session identifier
+            memories: Cached session memories
+            ttl: Seconds until the entry expires (None for no expiry)
+        """
+        session = self.get_session()
+        try:
+            expires_at = datetime.utcnow() + timedelta(seconds=ttl) if ttl else None
+            entry = self._session_cache_query(session, session_id).first()
+            if entry:
+                entry.memories = memories
+                entry.expires_at = expires_at
+            else:
+                session.add(
+                    SessionCacheEntry(
+                        namespace=self.namespace,
+                        session_id=session_id,
+                        memories=memories,
+                        expires_at=expires_at,
+                    )
+                )
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to save session cache entry: {e}")
+            raise StorageError(f"Failed to save session cache entry: {e}") from e
+        finally:
+            session.close()
+
+    def load_session_cache(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load and remove spilled session memories.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Session memories, or None if missing or expired
+        """
+        session = self.get_session()
+        try:
+            entry = self._session_cache_query(session, session_id).first()
+            if not entry:
+                return None
+            memories = entry.memories
+            expired = entry.expires_at is not None and entry.expires_at <= datetime.utcnow()
+            session.delete(entry)
+            session.commit()
+            return None if expired else memories
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to load session cache entry: {e}")
+            return None
+        finally:
+            session.close()
+
+    def delete_session_cache(self, session_id: Optional[str] = None):
+        """
+        Delete spilled session memories.
+        
+        Args:
+            session_id: Session identifier (None deletes expired entries only)
+        """
+        session = self.get_session()
+        try:
+            if session_id is not None:
+                self._session_cache_query(session, session_id).delete(
+                    synchronize_session=False
+                )
+            else:
+                session.query(SessionCacheEntry).filter(
+                    SessionCacheEntry.expires_at <= datetime.utcnow()
+                ).delete(synchronize_session=False)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to delete session cache entry: {e}")
         finally:
             session.close()
 
@@ -382,16 +2019,19 @@ class Storage:
         session = self.get_session()
         try:
             total_memories = session.query(Memory).count()
+            archived = session.query(MemoryArchive)
             if self.namespace:
                 namespace_memories = (
                     session.query(Memory).filter(Memory.namespace == self.namespace).count()
                 )
+                archived = archived.filter(MemoryArchive.namespace == self.namespace)
             else:
                 namespace_memories = total_memories
 
             return {
                 "total_memories": total_memories,
                 "namespace_memories": namespace_memories,
+                "archived_memories": archived.count(),
                 "namespace": self.namespace,
             }
         except Exception as e:
@@ -12,6 +12,8 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from memorable_ai.core.storage import temporal_links
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,96 +75,65 @@ class TemporalMemory:
         }
 
         await self.storage.store_memories([memory])
+        if memory.get("id") is not None:
+            await self.storage.store_temporal_edges(temporal_links(memory["id"], before, after))
         return memory
 
     async def get_temporal_sequence(
-        self, start_memory_id: int, direction: str = "forward", limit: int = 10
+        self,
+        start_memory_id: int,
+        direction: str = "forward",
+        limit: int = 10,
+        max_depth: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get temporal sequence of memories.
         
+        Follows before/after links transitively (a recursive query over the
+        indexed ``temporal_edges`` table), nearest memories first.
+        
         Args:
             start_memory_id: Starting memory ID
             direction: "forward" (after) or "backward" (before)
             limit: Maximum number of memories to retrieve
+            max_depth: Maximum number of links followed (default: ``limit``)
             
         Returns:
-            List of memories in temporal order
+            List of memories in temporal order, including the starting memory
         """
-        memories = await self.storage.get_memories(limit=1000)
-        start_memory = next((m for m in memories if m.get("id") == start_memory_id), None)
-
-        if not start_memory:
-            return []
-
-        sequence = [start_memory]
-        visited = {start_memory_id}
-
-        if direction == "forward":
-            # Get memories that come after
-            after_ids = start_memory.get("metadata", {}).get("after", [])
-            for mem_id in after_ids[:limit]:
-                if mem_id not in visited:
-                    mem = next((m for m in memories if m.get("id") == mem_id), None)
-                    if mem:
-                        sequence.append(mem)
-                        visited.add(mem_id)
-        else:
-            # Get memories that come before
-            before_ids = start_memory.get("metadata", {}).get("before", [])
-            for mem_id in before_ids[:limit]:
-                if mem_id not in visited:
-                    mem = next((m for m in memories if m.get("id") == mem_id), None)
-                    if mem:
-                        sequence.insert(0, mem)
-                        visited.add(mem_id)
-
-        return sequence
+        return await self.storage.get_temporal_sequence(
+            start_memory_id,
+            direction=direction,
+            max_depth=limit if max_depth is None else max_depth,
+            limit=limit,
+        )
 
     async def get_memories_by_time_range(
         self,
         start_time: datetime,
         end_time: datetime,
         memory_type: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Get memories within a time range.
+        Get memories within a time range, latest first.
+        
+        The range, type filter and ordering run in SQL on the indexed
+        ``event_at`` column (the memory's timestamp).
         
         Args:
             start_time: Start of time range
             end_time: End of time range
             memory_type: Filter by memory type (optional)
+            limit: Maximum number of memories (optional)
             
         Returns:
             List of memories in time range
         """
-        memories = await self.storage.get_memories(
-            memory_type=memory_type, limit=10000
+        return await self.storage.get_memories_by_event_time(
+            start=start_time, end=end_time, memory_type=memory_type, limit=limit
         )
 
-        result = []
-        for memory in memories:
-            metadata = memory.get("metadata", {})
-            timestamp_str = metadata.get("timestamp")
-
-            if not timestamp_str:
-                continue
-
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                if start_time <= timestamp <= end_time:
-                    result.append(memory)
-            except Exception as e:
-                logger.debug(f"Failed to parse timestamp: {e}")
-                continue
-
-        # Sort by timestamp
-        result.sort(
-            key=lambda m: m.get("metadata", {}).get("timestamp", ""), reverse=True
-        )
-
-        return result
-
     def extract_temporal_relationships(self, text: str) -> Dict[str, Any]:
         """
         Extract temporal relationships from text.
@@ -1,5 +1,20 @@
 """Graph-based memory components."""
 
-from memorable_ai.graph.builder import GraphBuilder
+from memorable_ai.utils.lazy import lazy_module
 
-__all__ = ["GraphBuilder"]
+# Imported on first access (PEP 562) so networkx is only loaded when needed
+_LAZY_IMPORTS = {
+    "GraphBuilder": "memorable_ai.graph.builder",
+    "SQLGraphBuilder": "memorable_ai.graph.sql_builder",
+    "CSRGraph": "memorable_ai.graph.csr",
+    "CSRGraphBuilder": "memorable_ai.graph.csr",
+    "PageRankRanker": "memorable_ai.graph.ranking",
+    "EntityMatcher": "memorable_ai.graph.matcher",
+    "PartitionedGraph": "memorable_ai.graph.partitions",
+    "GraphSnapshotStore": "memorable_ai.graph.snapshot",
+    "GraphCounters": "memorable_ai.graph.stats",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -8,8 +8,10 @@ Reference: https://github.com/supermemoryai/supermemory
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-import networkx as nx
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from memorable_ai.graph.matcher import EntityMatcher
+from memorable_ai.graph.stats import GraphCounters
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +23,56 @@ class GraphBuilder:
     Extracts entities and relationships to enable multi-hop reasoning.
     """
 
-    def __init__(self, connection_string: Optional[str] = None):
+    # Pruning goes this far below a cap so that it does not run on every write
+    PRUNE_TARGET = 0.9
+
+    # Approximate networkx overhead per node and per edge (attribute dicts,
+    # adjacency dicts), for memory estimates
+    NODE_BYTES = 450
+    EDGE_BYTES = 300
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        ranking: str = "depth",
+        max_nodes: int = 0,
+        max_edges: int = 0,
+    ):
         """
         Initialize graph builder.
         
         Args:
             connection_string: Optional graph database connection (Neo4j, etc.)
+            ranking: Order of related memories: 'depth' (hop distance) or
+                'pagerank' (personalized PageRank from the query entities)
+            max_nodes: Node cap; lowest-count entities are pruned beyond it (0 = unlimited)
+            max_edges: Edge cap; lowest-count entities are pruned beyond it (0 = unlimited)
         """
         self.connection_string = connection_string
-        # Use NetworkX for in-memory graph (can be backed by Neo4j)
-        self.graph = nx.MultiDiGraph()
+        self.max_nodes = max_nodes
+        self.max_edges = max_edges
+        self.pruned = 0
+        # Node/edge counters maintained on every insert and delete
+        self.counters = GraphCounters()
+        self.graph = self._create_graph()
+        # Known entity names and aliases, for query-time lookups
+        self.matcher = EntityMatcher()
+        self._aliases: Dict[str, str] = {}
+        self.version = 0
+        self.ranker = None
+        if ranking == "pagerank":
+            from memorable_ai.graph.ranking import PageRankRanker
+
+            self.ranker = PageRankRanker()
         logger.info("Graph builder initialized")
 
+    def _create_graph(self) -> Any:
+        """Create the in-memory graph (subclasses with other backends return None)."""
+        import networkx as nx
+
+        # Use NetworkX for in-memory graph (can be backed by Neo4j)
+        return nx.MultiDiGraph()
+
     async def update_graph(self, memories: List[Dict[str, Any]]):
         """
         Update graph with new memories.
@@ -44,6 +84,148 @@ class GraphBuilder:
         """
         for memory in memories:
             await self._add_memory_to_graph(memory)
+        self.version += 1
+        self._enforce_caps()
+
+    def _enforce_caps(self):
+        """Prune the graph if it exceeds its node or edge cap."""
+        if not self.max_nodes and not self.max_edges:
+            return
+        nodes, edges = self._size()
+        if (self.max_nodes and nodes > self.max_nodes) or (self.max_edges and edges > self.max_edges):
+            removed = self.prune(
+                int(self.max_nodes * self.PRUNE_TARGET),
+                int(self.max_edges * self.PRUNE_TARGET),
+            )
+            logger.debug(f"Pruned {removed} graph entities ({nodes} nodes, {edges} edges)")
+
+    def _size(self) -> Tuple[int, int]:
+        """Number of nodes and edges."""
+        return sum(self.counters.nodes.values()), self.counters.edges
+
+    def prune(self, max_nodes: int = 0, max_edges: int = 0) -> int:
+        """
+        Shrink the graph until it fits the limits.
+        
+        Memory nodes beyond half the node limit are dropped oldest first, then
+        the least-mentioned entities are removed together with memory nodes
+        no longer linked from any entity.
+        
+        Args:
+            max_nodes: Node limit (0 = unlimited)
+            max_edges: Edge limit (0 = unlimited)
+            
+        Returns:
+            Number of nodes removed
+        """
+        before = self.graph.number_of_nodes()
+        if max_nodes:
+            memory_nodes = [
+                node for node, data in self.graph.nodes(data=True) if data.get("type") == "memory"
+            ]
+            for node in memory_nodes[: max(0, len(memory_nodes) - max_nodes // 2)]:
+                self._remove_node(node)
+
+        entities = sorted(
+            (data.get("count", 0), node)
+            for node, data in self.graph.nodes(data=True)
+            if data.get("type") == "entity"
+        )
+        for _, entity in entities:
+            if (not max_nodes or self.graph.number_of_nodes() <= max_nodes) and (
+                not max_edges or self.graph.number_of_edges() <= max_edges
+            ):
+                break
+            successors = list(self.graph.successors(entity))
+            self._remove_node(entity)
+            for node in successors:
+                if (
+                    self.graph.has_node(node)
+                    and self.graph.nodes[node].get("type") == "memory"
+                    and self.graph.in_degree(node) == 0
+                ):
+                    self._remove_node(node)
+
+        removed = before - self.graph.number_of_nodes()
+        if removed:
+            self._rebuild_matcher(
+                node for node, data in self.graph.nodes(data=True) if data.get("type") == "entity"
+            )
+            self.pruned += removed
+            self.version += 1
+        return removed
+
+    async def merge_memories(
+        self,
+        mapping: Dict[Any, Any],
+        canonicals: Optional[Dict[Any, Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Redirect the links of merged memories to their canonical memory.
+        
+        Each duplicate memory node is removed; the entities that linked to
+        it link to the canonical memory node instead (created from
+        ``canonicals`` if the graph does not have it yet).
+        
+        Args:
+            mapping: Duplicate memory ID -> canonical memory ID
+            canonicals: Canonical memory ID -> memory dictionary (optional)
+            
+        Returns:
+            Number of memory nodes removed
+        """
+        canonicals = canonicals or {}
+        removed = 0
+        for duplicate, canonical in mapping.items():
+            node = f"memory_{duplicate}"
+            if not self.graph.has_node(node):
+                continue
+            target = f"memory_{canonical}"
+            if not self.graph.has_node(target):
+                data = self.graph.nodes[node]
+                memory = canonicals.get(canonical, {})
+                content = memory.get("content", data.get("content", ""))
+                self.graph.add_node(
+                    target,
+                    type="memory",
+                    memory_id=canonical,
+                    content=content,
+                    memory_type=memory.get("type", data.get("memory_type", "fact")),
+                )
+                self.counters.add_node(target, "memory", len(content))
+            for entity in list(self.graph.predecessors(node)):
+                if not self.graph.has_edge(entity, target):
+                    self.graph.add_edge(entity, target, relationship="contains")
+                    self.counters.add_edge(entity, target, "contains")
+            self._remove_node(node)
+            removed += 1
+
+        if removed:
+            self.version += 1
+        return removed
+
+    def _remove_node(self, node: Any):
+        """Remove a node and its edges, keeping the counters in sync."""
+        for source, target, data in self.graph.out_edges(node, data=True):
+            self.counters.remove_edge(source, target, data.get("relationship", ""))
+        for source, target, data in self.graph.in_edges(node, data=True):
+            if source != node:  # Self-loops were counted as out-edges
+                self.counters.remove_edge(source, target, data.get("relationship", ""))
+        data = self.graph.nodes[node]
+        self.counters.remove_node(node, data.get("type", "entity"), len(data.get("content", "")))
+        self.graph.remove_node(node)
+
+    def _rebuild_matcher(self, entities: Iterable[str]):
+        """Re-index the remaining entity names and their aliases."""
+        matcher = EntityMatcher()
+        remaining = set()
+        for entity in entities:
+            matcher.add(entity)
+            remaining.add(entity)
+        for alias, entity in self._aliases.items():
+            if entity in remaining:
+                matcher.add(alias, entity)
+        self.matcher = matcher
 
     async def _add_memory_to_graph(self, memory: Dict[str, Any]):
         """
@@ -60,6 +242,11 @@ class GraphBuilder:
 
         if not content:
             return
+        memory_node = f"memory_{memory_id}" if memory_id else None
+        if memory_node is not None and self.graph.has_node(memory_node):
+            # Repeated mention: storage returns the ID of the existing memory,
+            # whose entities, edges and counts are already in the graph
+            return
 
         # Extract entities (simplified - can be enhanced with NER)
         entities = self._extract_entities(content)
@@ -68,14 +255,17 @@ class GraphBuilder:
         for entity in entities:
             if not self.graph.has_node(entity):
                 self.graph.add_node(entity, type="entity", count=0)
+                self.counters.add_node(entity, "entity")
+                self.matcher.add(entity)
             self.graph.nodes[entity]["count"] += 1
 
         # Create memory node
-        if memory_id:
-            memory_node = f"memory_{memory_id}"
+        if memory_node is not None:
+            self.counters.add_node(memory_node, "memory", len(content))
             self.graph.add_node(
                 memory_node,
                 type="memory",
+                memory_id=memory_id,
                 content=content,
                 memory_type=memory_type,
             )
@@ -83,12 +273,14 @@ class GraphBuilder:
             # Create edges from entities to memory
             for entity in entities:
                 self.graph.add_edge(entity, memory_node, relationship="contains")
+                self.counters.add_edge(entity, memory_node, "contains")
 
         # Extract relationships between entities
         relationships = self._extract_relationships(content, entities)
         for rel in relationships:
             source, target, rel_type = rel
             self.graph.add_edge(source, target, relationship=rel_type)
+            self.counters.add_edge(source, target, rel_type)
 
     def _extract_entities(self, text: str) -> List[str]:
         """
@@ -126,6 +318,33 @@ class GraphBuilder:
         # Deduplicate
         return list(set(entities))
 
+    def add_alias(self, alias: str, entity: str):
+        """
+        Register an alternative name for an entity, matched in queries.
+        
+        Args:
+            alias: Alternative name (e.g. "NYC")
+            entity: Entity name as stored in the graph (e.g. "New York")
+        """
+        self._aliases[alias] = entity
+        self.matcher.add(alias, entity)
+
+    def _query_entities(self, query: str) -> List[str]:
+        """
+        Known entities mentioned in a query.
+        
+        Matched against the gazetteer of entity names and aliases
+        (case-insensitive, one pass) rather than extracted by pattern, so
+        lowercase mentions are found too.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            List of entity names
+        """
+        return self.matcher.match(query)
+
     def _extract_relationships(
         self, text: str, entities: List[str]
     ) -> List[tuple]:
@@ -162,7 +381,7 @@ class GraphBuilder:
         return relationships
 
     async def find_related(
-        self, query: str, limit: int = 10
+        self, query: str, limit: int = 10, hops: int = 2
     ) -> List[Dict[str, Any]]:
         """
         Find related memories using graph traversal.
@@ -170,53 +389,90 @@ class GraphBuilder:
         Args:
             query: Search query
             limit: Maximum results
+            hops: Maximum number of edges from a query entity to a memory
             
         Returns:
-            List of related memories
+            List of related memories (with ``graph_score`` when ranked by PageRank)
         """
-        # Extract entities from query
-        query_entities = self._extract_entities(query)
+        # Find known entities in query
+        query_entities = self._query_entities(query)
         
         if not query_entities:
             return []
 
-        # Find nodes connected to query entities
+        # Find nodes connected to query entities (multi-hop reasoning)
         related_nodes = set()
-        for entity in query_entities:
-            if self.graph.has_node(entity):
-                # Get neighbors (1-hop)
-                neighbors = list(self.graph.neighbors(entity))
-                related_nodes.update(neighbors)
-                
-                # Get 2-hop neighbors for multi-hop reasoning
-                for neighbor in neighbors:
-                    two_hop = list(self.graph.neighbors(neighbor))
-                    related_nodes.update(two_hop)
+        seeds = {entity for entity in query_entities if self.graph.has_node(entity)}
+        frontier = seeds
+        for _ in range(hops):
+            next_frontier = set()
+            for node in frontier:
+                next_frontier.update(self.graph.neighbors(node))
+            next_frontier -= related_nodes
+            related_nodes.update(next_frontier)
+            frontier = next_frontier
+
+        if self.ranker is not None and seeds:
+            from memorable_ai.graph.ranking import top_memories
+
+            scores = self.ranker.rank(
+                seeds, self.version, lambda: self._subgraph(seeds | related_nodes)
+            )
+            return top_memories(scores, self._memory_of, limit)
 
         # Extract memory nodes
         memories = []
         for node in related_nodes:
-            if self.graph.nodes[node].get("type") == "memory":
-                content = self.graph.nodes[node].get("content", "")
-                memory_type = self.graph.nodes[node].get("memory_type", "fact")
-                memories.append({
-                    "content": content,
-                    "type": memory_type,
-                    "id": node,
-                })
+            memory = self._memory_of(node)
+            if memory is not None:
+                memories.append(memory)
 
         return memories[:limit]
 
-    def get_graph_stats(self) -> Dict[str, Any]:
-        """Get graph statistics."""
+    def _memory_of(self, node: Any) -> Optional[Dict[str, Any]]:
+        """Memory dictionary for a memory node (None for other nodes)."""
+        data = self.graph.nodes[node]
+        if data.get("type") != "memory":
+            return None
         return {
-            "nodes": self.graph.number_of_nodes(),
-            "edges": self.graph.number_of_edges(),
-            "entity_nodes": sum(
-                1 for n, d in self.graph.nodes(data=True) if d.get("type") == "entity"
-            ),
-            "memory_nodes": sum(
-                1 for n, d in self.graph.nodes(data=True) if d.get("type") == "memory"
-            ),
+            "content": data.get("content", ""),
+            "type": data.get("memory_type", "fact"),
+            "id": data.get("memory_id", node),
         }
 
+    def _memory_bytes(self) -> int:
+        """Estimated memory used by the graph."""
+        nodes, edges = self._size()
+        return nodes * self.NODE_BYTES + edges * self.EDGE_BYTES + self.counters.content_bytes
+
+    def _subgraph(self, nodes: Set[Any]) -> Tuple[List[Any], List[int], List[int]]:
+        """Local subgraph over the given nodes, for ranking."""
+        keys = list(nodes)
+        index = {node: i for i, node in enumerate(keys)}
+        sources, targets = [], []
+        for node in keys:
+            for neighbor in self.graph.successors(node):
+                if neighbor in index:
+                    sources.append(index[node])
+                    targets.append(index[neighbor])
+        return keys, sources, targets
+
+    def get_graph_stats(self) -> Dict[str, Any]:
+        """
+        Get graph statistics.
+        
+        Read from incrementally maintained counters, so the cost does not
+        depend on the size of the graph.
+        
+        Returns:
+            Node and edge counts, edges per relationship type, degree
+            histogram and an estimate of the graph's memory usage in bytes
+        """
+        stats = self.counters.get_stats()
+        stats["memory_bytes"] = self._memory_bytes()
+        if self.max_nodes or self.max_edges or self.pruned:
+            stats["pruned_nodes"] = self.pruned
+        if self.ranker is not None:
+            stats["ranking"] = self.ranker.get_stats()
+        return stats
+
@@ -0,0 +1,785 @@
+"""
+CSR Graph
+
+Compact, read-optimized in-process graph. Nodes are dense integer ids and
+adjacency is stored in compressed sparse row (CSR) form: an ``offsets``
+array (one entry per node) plus ``neighbors`` and ``labels`` arrays (one
+entry per edge), about 5 bytes per edge instead of the hundreds a networkx
+``MultiDiGraph`` spends.
+
+New edges go to an append-only write log. Traversals read the CSR snapshot
+plus the (small) log, and the log is merged into the snapshot incrementally
+once it grows past a fraction of the graph. k-hop expansion is vectorized:
+each hop gathers the neighbors of the whole frontier with numpy.
+"""
+
+import logging
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from memorable_ai.core.errors import GraphError
+from memorable_ai.graph.builder import GraphBuilder
+from memorable_ai.graph.ranking import top_memories
+from memorable_ai.graph.snapshot import read_snapshot, write_snapshot
+from memorable_ai.graph.stats import GraphCounters
+
+logger = logging.getLogger(__name__)
+
+# Node kinds
+ENTITY = 0
+MEMORY = 1
+_KIND_NAMES = {ENTITY: "entity", MEMORY: "memory"}
+
+
+class CSRGraph:
+    """
+    Directed, edge-labelled graph in CSR form with an append-only write log.
+
+    Snapshot arrays are never modified in place - compaction builds new
+    ones - so readers can traverse without holding the lock.
+    """
+
+    def __init__(self, compact_threshold: int = 4096, compact_ratio: float = 0.125):
+        """
+        Initialize CSR graph.
+
+        Args:
+            compact_threshold: Minimum write log size that triggers a merge
+            compact_ratio: Merge once the log exceeds this fraction of snapshot edges
+        """
+        self.compact_threshold = max(1, compact_threshold)
+        self.compact_ratio = compact_ratio
+
+        self._ids: Dict[Any, int] = {}
+        self._keys: List[Any] = []
+        self._label_codes: Dict[str, int] = {}
+        self._label_names: List[str] = []
+
+        # Snapshot
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._neighbors = np.zeros(0, dtype=np.int32)
+        self._labels = np.zeros(0, dtype=np.uint8)
+
+        # Write log
+        self._log_src = array("i")
+        self._log_dst = array("i")
+        self._log_labels = array("B")
+        self._log_view: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+        self.version = 0
+        self.compactions = 0
+        self._lock = threading.Lock()
+
+    def node_id(self, key: Any, create: bool = True) -> Optional[int]:
+        """
+        Integer id of a node.
+
+        Args:
+            key: Node key (any hashable)
+            create: Add the node if it does not exist
+
+        Returns:
+            Node id, or None if the node does not exist and create is False
+        """
+        node = self._ids.get(key)
+        if node is not None or not create:
+            return node
+        with self._lock:
+            node = self._ids.get(key)
+            if node is None:
+                node = len(self._keys)
+                self._ids[key] = node
+                self._keys.append(key)
+                self.version += 1
+        return node
+
+    def node_key(self, node: int) -> Any:
+        """Key of a node id."""
+        return self._keys[node]
+
+    def label_code(self, label: str) -> int:
+        """Integer code of an edge label."""
+        code = self._label_codes.get(label)
+        if code is None:
+            if len(self._label_names) >= 256:
+                raise GraphError("CSR graph supports at most 256 edge labels")
+            code = len(self._label_names)
+            self._label_codes[label] = code
+            self._label_names.append(label)
+        return code
+
+    def label_name(self, code: int) -> str:
+        """Edge label of a code."""
+        return self._label_names[code]
+
+    def add_edge(self, source: int, target: int, label: str):
+        """Append an edge to the write log."""
+        with self._lock:
+            self._log_src.append(source)
+            self._log_dst.append(target)
+            self._log_labels.append(self.label_code(label))
+            self._log_view = None
+            self.version += 1
+            if len(self._log_src) >= max(
+                self.compact_threshold, int(len(self._neighbors) * self.compact_ratio)
+            ):
+                self._compact()
+
+    def compact(self):
+        """Merge the write log into the CSR snapshot."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        """Merge the write log into the snapshot (lock held)."""
+        if not self._log_src:
+            return
+
+        src = np.frombuffer(self._log_src, dtype=np.int32).astype(np.int64)
+        dst = np.frombuffer(self._log_dst, dtype=np.int32).copy()
+        labels = np.frombuffer(self._log_labels, dtype=np.uint8).copy()
+
+        old_offsets = self._offsets
+        old_nodes = len(old_offsets) - 1
+        nodes = len(self._keys)
+
+        old_degree = np.zeros(nodes, dtype=np.int64)
+        old_degree[:old_nodes] = np.diff(old_offsets)
+        new_degree = np.bincount(src, minlength=nodes)
+
+        offsets = np.zeros(nodes + 1, dtype=np.int64)
+        np.cumsum(old_degree + new_degree, out=offsets[1:])
+        neighbors = np.empty(offsets[-1], dtype=np.int32)
+        edge_labels = np.empty(offsets[-1], dtype=np.uint8)
+
+        # Existing edges keep their position within their row
+        if len(self._neighbors):
+            old_src = np.repeat(np.arange(old_nodes, dtype=np.int64), old_degree[:old_nodes])
+            positions = offsets[old_src] + (np.arange(len(old_src)) - old_offsets[old_src])
+            neighbors[positions] = self._neighbors
+            edge_labels[positions] = self._labels
+
+        # Logged edges go after them, in log order
+        order = np.argsort(src, kind="stable")
+        sorted_src = src[order]
+        rank = np.arange(len(order)) - np.searchsorted(sorted_src, sorted_src, side="left")
+        positions = offsets[sorted_src] + old_degree[sorted_src] + rank
+        neighbors[positions] = dst[order]
+        edge_labels[positions] = labels[order]
+
+        self._offsets = offsets
+        self._neighbors = neighbors
+        self._labels = edge_labels
+        self._log_src = array("i")
+        self._log_dst = array("i")
+        self._log_labels = array("B")
+        self._log_view = None
+        self.compactions += 1
+
+    def _snapshot(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[np.ndarray, ...]]:
+        """Consistent view of the snapshot arrays and the write log."""
+        with self._lock:
+            if self._log_view is None:
+                self._log_view = (
+                    np.array(self._log_src, dtype=np.int64),
+                    np.array(self._log_dst, dtype=np.int64),
+                    np.array(self._log_labels, dtype=np.uint8),
+                )
+            return self._offsets, self._neighbors, self._labels, self._log_view
+
+    def neighbors(self, node: int, labels: Optional[Iterable[str]] = None) -> np.ndarray:
+        """Out-neighbors of a node (optionally only along the given edge labels)."""
+        nodes, _ = self.expand(np.array([node], dtype=np.int64), labels)
+        return nodes
+
+    def expand(
+        self, frontier: np.ndarray, labels: Optional[Iterable[str]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gather the out-edges of a set of nodes.
+
+        Args:
+            frontier: Node ids
+            labels: Only follow edges with these labels (default: all)
+
+        Returns:
+            (targets, sources) arrays, one entry per edge
+        """
+        offsets, neighbors, edge_labels, (log_src, log_dst, log_labels) = self._snapshot()
+        frontier = np.asarray(frontier, dtype=np.int64)
+        codes = self._codes(labels)
+
+        in_snapshot = frontier[frontier < len(offsets) - 1]
+        starts = offsets[in_snapshot]
+        lengths = offsets[in_snapshot + 1] - starts
+        total = int(lengths.sum())
+        if total:
+            # Flat edge indexes of all frontier rows
+            row_starts = np.cumsum(lengths) - lengths
+            index = np.arange(total) - np.repeat(row_starts - starts, lengths)
+            targets = neighbors[index].astype(np.int64)
+            sources = np.repeat(in_snapshot, lengths)
+            if codes is not None:
+                mask = np.isin(edge_labels[index], codes)
+                targets, sources = targets[mask], sources[mask]
+        else:
+            targets = sources = np.zeros(0, dtype=np.int64)
+
+        if len(log_src):
+            mask = np.isin(log_src, frontier)
+            if codes is not None:
+                mask &= np.isin(log_labels, codes)
+            if mask.any():
+                targets = np.concatenate([targets, log_dst[mask]])
+                sources = np.concatenate([sources, log_src[mask]])
+
+        return targets, sources
+
+    def k_hop(
+        self,
+        seeds: Iterable[int],
+        hops: int,
+        labels: Optional[Iterable[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nodes reachable from seeds in at most ``hops`` edges.
+
+        Args:
+            seeds: Start node ids
+            hops: Maximum number of edges
+            labels: Only follow edges with these labels (default: all)
+
+        Returns:
+            (nodes, depths) arrays in BFS order, excluding the seeds
+        """
+        frontier = np.unique(np.asarray(list(seeds), dtype=np.int64))
+        visited = np.zeros(len(self._keys), dtype=bool)
+        visited[frontier] = True
+
+        reached, depths = [], []
+        for depth in range(1, hops + 1):
+            if not len(frontier):
+                break
+            targets, _ = self.expand(frontier, labels)
+            targets = targets[targets < len(visited)]
+            frontier = np.unique(targets[~visited[targets]])
+            visited[frontier] = True
+            reached.append(frontier)
+            depths.append(np.full(len(frontier), depth, dtype=np.int32))
+
+        if not reached:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32)
+        return np.concatenate(reached), np.concatenate(depths)
+
+    def _codes(self, labels: Optional[Iterable[str]]) -> Optional[np.ndarray]:
+        """Label codes for a label filter."""
+        if labels is None:
+            return None
+        return np.array(
+            [self._label_codes[l] for l in labels if l in self._label_codes], dtype=np.uint8
+        )
+
+    def retain(self, keep: np.ndarray) -> np.ndarray:
+        """
+        Drop nodes (and their edges) not marked in ``keep``; ids are renumbered.
+
+        Args:
+            keep: Boolean mask over node ids
+
+        Returns:
+            New id for each old id (-1 for dropped nodes)
+        """
+        with self._lock:
+            self._compact()
+            nodes = len(self._keys)
+            keep = np.asarray(keep, dtype=bool)[:nodes]
+            remap = np.full(nodes, -1, dtype=np.int64)
+            remap[keep] = np.arange(int(keep.sum()))
+
+            offsets = np.zeros(nodes + 1, dtype=np.int64)
+            offsets[: len(self._offsets)] = self._offsets
+            offsets[len(self._offsets):] = self._offsets[-1]
+            sources = np.repeat(np.arange(nodes, dtype=np.int64), np.diff(offsets))
+            mask = keep[sources] & keep[self._neighbors]
+
+            # Sources stay sorted because the remapping is monotonic
+            kept_sources = remap[sources[mask]]
+            kept = int(keep.sum())
+            self._offsets = np.zeros(kept + 1, dtype=np.int64)
+            np.cumsum(np.bincount(kept_sources, minlength=kept), out=self._offsets[1:])
+            self._neighbors = remap[self._neighbors[mask]].astype(np.int32)
+            self._labels = self._labels[mask]
+            self._keys = [key for key, flag in zip(self._keys, keep.tolist()) if flag]
+            self._ids = {key: node for node, key in enumerate(self._keys)}
+            self._log_view = None
+            self.version += 1
+            return remap
+
+    def load(
+        self,
+        keys: List[Any],
+        label_names: List[str],
+        offsets: np.ndarray,
+        neighbors: np.ndarray,
+        labels: np.ndarray,
+    ):
+        """
+        Replace the graph with snapshot arrays (used as-is, e.g. memory-mapped).
+
+        Args:
+            keys: Node keys in id order
+            label_names: Edge labels in code order
+            offsets: CSR row offsets (len(keys) + 1)
+            neighbors: CSR neighbor ids
+            labels: Edge label codes
+        """
+        if len(offsets) != len(keys) + 1 or len(neighbors) != len(labels):
+            raise GraphError("Inconsistent CSR snapshot arrays")
+        with self._lock:
+            self._keys = list(keys)
+            self._ids = {key: node for node, key in enumerate(self._keys)}
+            self._label_names = list(label_names)
+            self._label_codes = {label: code for code, label in enumerate(self._label_names)}
+            self._offsets = offsets
+            self._neighbors = neighbors
+            self._labels = labels
+            self._log_src = array("i")
+            self._log_dst = array("i")
+            self._log_labels = array("B")
+            self._log_view = None
+            self.version += 1
+
+    def number_of_nodes(self) -> int:
+        return len(self._keys)
+
+    def number_of_edges(self) -> int:
+        return len(self._neighbors) + len(self._log_src)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by adjacency arrays and the write log (excluding node keys)."""
+        return (
+            self._offsets.nbytes
+            + self._neighbors.nbytes
+            + self._labels.nbytes
+            + self._log_src.itemsize * len(self._log_src)
+            + self._log_dst.itemsize * len(self._log_dst)
+            + self._log_labels.itemsize * len(self._log_labels)
+        )
+
+
+class CSRGraphBuilder(GraphBuilder):
+    """
+    Knowledge graph kept in a CSRGraph.
+
+    Same extraction and API as GraphBuilder; per-node attributes are kept
+    in compact side arrays instead of networkx attribute dicts.
+    """
+
+    # Approximate overhead of a node key (id dict and key list entries) and
+    # of a memory node's side tuple, for memory estimates
+    NODE_BYTES = 130
+    MEMORY_BYTES = 170
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        ranking: str = "depth",
+        max_nodes: int = 0,
+        max_edges: int = 0,
+        compact_threshold: int = 4096,
+    ):
+        """
+        Initialize CSR graph builder.
+
+        Args:
+            connection_string: Unused (kept for API compatibility)
+            ranking: Order of related memories: 'depth' or 'pagerank'
+            max_nodes: Node cap (0 = unlimited)
+            max_edges: Edge cap (0 = unlimited)
+            compact_threshold: Minimum write log size that triggers a merge
+        """
+        self.csr = CSRGraph(compact_threshold=compact_threshold)
+        self._kinds = array("b")
+        self._counts = array("i")
+        # Memory node id -> (memory_id, content, memory_type)
+        self._memories: Dict[int, Tuple[Any, str, str]] = {}
+        self._matcher_stale = False
+        super().__init__(
+            connection_string=connection_string,
+            ranking=ranking,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+        )
+        self.counters = GraphCounters(dense=True)
+
+    def _create_graph(self) -> Any:
+        """No networkx graph: nodes and edges live in the CSR graph."""
+        return None
+
+    def _entity_names(self) -> List[Any]:
+        """Keys of all entity nodes."""
+        kinds = np.frombuffer(self._kinds, dtype=np.int8)[: self.csr.number_of_nodes()]
+        return [self.csr.node_key(node) for node in np.flatnonzero(kinds == ENTITY).tolist()]
+
+    def _query_entities(self, query: str) -> List[str]:
+        """Known entities mentioned in a query (re-indexing names after a snapshot load)."""
+        if self._matcher_stale:
+            self._matcher_stale = False
+            self._rebuild_matcher(self._entity_names())
+        return super()._query_entities(query)
+
+    def _node(self, key: Any, kind: int) -> int:
+        """Node id for a key, adding it (with its side attributes) if new."""
+        node = self.csr.node_id(key)
+        while len(self._kinds) <= node:
+            self._kinds.append(kind)
+            self._counts.append(0)
+            self.counters.add_node(len(self._kinds) - 1, _KIND_NAMES[kind])
+        return node
+
+    async def _add_memory_to_graph(self, memory: Dict[str, Any]):
+        """Add a memory to the graph."""
+        content = memory.get("content", "")
+        memory_id = memory.get("id")
+        if not content:
+            return
+        if memory_id:
+            known = self.csr.node_id(f"memory_{memory_id}", create=False)
+            if known is not None and known in self._memories:
+                # Repeated mention: storage returns the ID of the existing
+                # memory, whose edges and entity counts are already in place
+                return
+
+        entities = self._extract_entities(content)
+        entity_nodes = {}
+        for entity in entities:
+            if self.csr.node_id(entity, create=False) is None:
+                self.matcher.add(entity)
+            node = self._node(entity, ENTITY)
+            self._counts[node] += 1
+            entity_nodes[entity] = node
+
+        if memory_id:
+            memory_node = self._node(f"memory_{memory_id}", MEMORY)
+            self._memories[memory_node] = (memory_id, content, memory.get("type", "fact"))
+            self.counters.content_bytes += len(content)
+            for node in entity_nodes.values():
+                self._add_edge(node, memory_node, "contains")
+
+        for source, target, rel_type in self._extract_relationships(content, entities):
+            self._add_edge(entity_nodes[source], entity_nodes[target], rel_type)
+
+    def _add_edge(self, source: int, target: int, relationship: str):
+        """Add an edge and count it."""
+        self.csr.add_edge(source, target, relationship)
+        self.counters.add_edge(source, target, relationship)
+
+    def _recount(self):
+        """Rebuild the counters from the CSR arrays (after bulk changes)."""
+        self.csr.compact()
+        nodes = self.csr.number_of_nodes()
+        offsets = self.csr._offsets
+        kinds = np.frombuffer(self._kinds, dtype=np.int8)[:nodes]
+        self.counters = GraphCounters.from_arrays(
+            {name: kinds == kind for kind, name in _KIND_NAMES.items()},
+            np.repeat(np.arange(nodes, dtype=np.int64), np.diff(offsets)),
+            self.csr._neighbors,
+            self.csr._labels,
+            self.csr._label_names,
+            content_bytes=sum(len(content) for _, content, _ in self._memories.values()),
+        )
+
+    async def find_related(
+        self, query: str, limit: int = 10, hops: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Find related memories using vectorized k-hop expansion.
+
+        Args:
+            query: Search query
+            limit: Maximum results
+            hops: Maximum number of edges from a query entity to a memory
+
+        Returns:
+            List of related memories, closest first (with ``graph_depth``), or
+            best first (with ``graph_score``) when ranked by PageRank
+        """
+        seeds = [
+            node
+            for node in (self.csr.node_id(e, create=False) for e in self._query_entities(query))
+            if node is not None
+        ]
+        if not seeds:
+            return []
+
+        nodes, depths = self.csr.k_hop(seeds, hops)
+        if self.ranker is not None:
+            scores = self.ranker.rank(
+                seeds, self.csr.version, lambda: self._subgraph(seeds, nodes)
+            )
+            return top_memories(scores, self._memory_of, limit)
+
+        kinds = np.frombuffer(self._kinds, dtype=np.int8)[: self.csr.number_of_nodes()]
+        mask = kinds[nodes] == MEMORY
+
+        memories = []
+        for node, depth in zip(nodes[mask][:limit].tolist(), depths[mask][:limit].tolist()):
+            memory_id, content, memory_type = self._memories[node]
+            memories.append({
+                "content": content,
+                "type": memory_type,
+                "id": memory_id,
+                "graph_depth": depth,
+            })
+        return memories
+
+    def _memory_of(self, node: int) -> Optional[Dict[str, Any]]:
+        """Memory dictionary for a memory node (None for other nodes)."""
+        memory = self._memories.get(node)
+        if memory is None:
+            return None
+        memory_id, content, memory_type = memory
+        return {"content": content, "type": memory_type, "id": memory_id}
+
+    def _subgraph(self, seeds: List[int], nodes: np.ndarray) -> Tuple[List[int], np.ndarray, np.ndarray]:
+        """Local subgraph over the seeds and their k-hop neighborhood, for ranking."""
+        local = np.unique(np.concatenate([np.asarray(seeds, dtype=np.int64), nodes]))
+        targets, sources = self.csr.expand(local)
+        mask = np.isin(targets, local)
+        return (
+            local.tolist(),
+            np.searchsorted(local, sources[mask]),
+            np.searchsorted(local, targets[mask]),
+        )
+
+    def _size(self) -> Tuple[int, int]:
+        """Number of nodes and edges."""
+        return self.csr.number_of_nodes(), self.csr.number_of_edges()
+
+    def save_snapshot(self, path: str, sequence: int = 0) -> int:
+        """
+        Write the graph to a binary snapshot file.
+
+        Args:
+            path: Snapshot file
+            sequence: Replay log sequence number covered by the snapshot
+
+        Returns:
+            Size of the snapshot in bytes
+        """
+        self.csr.compact()
+        nodes = self.csr.number_of_nodes()
+        arrays = {
+            "offsets": self.csr._offsets,
+            "neighbors": self.csr._neighbors,
+            "labels": self.csr._labels,
+            "kinds": np.frombuffer(self._kinds, dtype=np.int8)[:nodes],
+            "counts": np.frombuffer(self._counts, dtype=np.int32)[:nodes],
+        }
+        metadata = {
+            "sequence": sequence,
+            "keys": self.csr._keys,
+            "labels": self.csr._label_names,
+            "memories": [[node, *memory] for node, memory in self._memories.items()],
+            "aliases": self._aliases,
+            "pruned": self.pruned,
+        }
+        return write_snapshot(path, arrays, metadata)
+
+    def load_snapshot(self, path: str, mmap: bool = True) -> int:
+        """
+        Replace the graph with a binary snapshot.
+
+        Adjacency arrays are memory-mapped read-only; writes go to the write
+        log and compaction builds new arrays, so the file is never modified.
+
+        Args:
+            path: Snapshot file
+            mmap: Map adjacency arrays instead of reading them into memory
+
+        Returns:
+            Replay log sequence number covered by the snapshot
+        """
+        arrays, metadata = read_snapshot(path, mmap=mmap)
+        self.csr.load(
+            metadata["keys"],
+            metadata["labels"],
+            arrays["offsets"],
+            arrays["neighbors"],
+            arrays["labels"],
+        )
+        # Per-node attributes are updated in place, so they are copied
+        self._kinds = array("b", np.asarray(arrays["kinds"]).tobytes())
+        self._counts = array("i", np.asarray(arrays["counts"]).tobytes())
+        self._memories = {
+            node: (memory_id, content, memory_type)
+            for node, memory_id, content, memory_type in metadata["memories"]
+        }
+        self._aliases = dict(metadata.get("aliases", {}))
+        self.pruned = metadata.get("pruned", 0)
+        self._recount()
+        # Re-indexing names dominates load time, so it waits for the first query
+        self._matcher_stale = True
+        self.version += 1
+        return metadata.get("sequence", 0)
+
+    def prune(self, max_nodes: int = 0, max_edges: int = 0) -> int:
+        """
+        Shrink the graph until it fits the limits.
+
+        Memory nodes beyond half the node limit are dropped oldest first, then
+        the least-mentioned entities are removed together with memory nodes
+        no longer linked from any entity.
+
+        Args:
+            max_nodes: Node limit (0 = unlimited)
+            max_edges: Edge limit (0 = unlimited)
+
+        Returns:
+            Number of nodes removed
+        """
+        self.csr.compact()
+        nodes, edges = self._size()
+        kinds = np.frombuffer(self._kinds, dtype=np.int8)[:nodes]
+        counts = np.frombuffer(self._counts, dtype=np.int32)[:nodes]
+        offsets, neighbors = self.csr._offsets, self.csr._neighbors
+        keep = np.ones(nodes, dtype=bool)
+
+        if max_nodes:
+            # Memory node ids grow with insertion order
+            memory_nodes = np.flatnonzero(kinds == MEMORY)
+            keep[memory_nodes[: max(0, len(memory_nodes) - max_nodes // 2)]] = False
+
+        # Lowest-count entities first; drop enough to cover both caps
+        entities = np.flatnonzero(kinds == ENTITY)
+        order = entities[np.argsort(counts[entities], kind="stable")]
+        remaining = int(keep.sum())
+        drop = max(remaining - max_nodes, 0) if max_nodes else 0
+        if max_edges and edges > max_edges:
+            degree = np.diff(offsets) + np.bincount(neighbors, minlength=nodes)
+            covered = np.cumsum(degree[order])
+            drop = max(drop, int(np.searchsorted(covered, edges - max_edges)) + 1)
+        keep[order[: min(drop, len(order))]] = False
+
+        # Memory nodes survive only if a kept entity still links to them
+        sources = np.repeat(np.arange(nodes), np.diff(offsets))
+        linked = np.zeros(nodes, dtype=bool)
+        linked[neighbors[keep[sources]]] = True
+        keep &= (kinds == ENTITY) | linked
+
+        removed = nodes - int(keep.sum())
+        if not removed:
+            return 0
+
+        self._retain(keep)
+        self._rebuild_matcher(self._entity_names())
+        self._matcher_stale = False
+        self.pruned += removed
+        return removed
+
+    def _retain(self, keep: np.ndarray):
+        """Drop the nodes not marked in ``keep`` and renumber the side arrays."""
+        nodes = self.csr.number_of_nodes()
+        kinds = np.frombuffer(self._kinds, dtype=np.int8)[:nodes]
+        counts = np.frombuffer(self._counts, dtype=np.int32)[:nodes]
+        remap = self.csr.retain(keep)
+        kept = np.flatnonzero(keep)
+        self._kinds = array("b", kinds[kept].tobytes())
+        self._counts = array("i", counts[kept].tobytes())
+        self._memories = {
+            int(remap[node]): memory for node, memory in self._memories.items() if keep[node]
+        }
+        self._recount()
+        self.version += 1
+
+    async def merge_memories(
+        self,
+        mapping: Dict[Any, Any],
+        canonicals: Optional[Dict[Any, Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Redirect the links of merged memories to their canonical memory.
+
+        Links are found with one vectorized scan of the CSR arrays, the
+        missing entity -> canonical links are appended, and all duplicate
+        nodes are dropped in a single ``retain``.
+
+        Args:
+            mapping: Duplicate memory ID -> canonical memory ID
+            canonicals: Canonical memory ID -> memory dictionary (optional)
+
+        Returns:
+            Number of memory nodes removed
+        """
+        canonicals = canonicals or {}
+        duplicates = {}
+        for duplicate, canonical in mapping.items():
+            node = self.csr.node_id(f"memory_{duplicate}", create=False)
+            if node is not None and node in self._memories:
+                duplicates[node] = canonical
+        if not duplicates:
+            return 0
+
+        self.csr.compact()
+        offsets, neighbors = self.csr._offsets, self.csr._neighbors
+        sources = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+        targets = {}
+        for node, canonical in duplicates.items():
+            target = self.csr.node_id(f"memory_{canonical}", create=False)
+            if target is None:
+                _, content, memory_type = self._memories[node]
+                memory = canonicals.get(canonical, {})
+                content = memory.get("content", content)
+                target = self._node(f"memory_{canonical}", MEMORY)
+                self._memories[target] = (canonical, content, memory.get("type", memory_type))
+                self.counters.content_bytes += len(content)
+            targets[node] = target
+
+        duplicate_nodes = np.fromiter(duplicates, dtype=np.int64, count=len(duplicates))
+        target_nodes = np.fromiter(set(targets.values()), dtype=np.int64)
+        linked = np.isin(neighbors, target_nodes)
+        existing = set(zip(sources[linked].tolist(), neighbors[linked].tolist()))
+        moved = np.isin(neighbors, duplicate_nodes)
+        for source, node in zip(sources[moved].tolist(), neighbors[moved].tolist()):
+            target = targets[node]
+            if (source, target) not in existing:
+                existing.add((source, target))
+                self._add_edge(source, target, "contains")
+
+        keep = np.ones(self.csr.number_of_nodes(), dtype=bool)
+        keep[duplicate_nodes] = False
+        self._retain(keep)
+        return len(duplicates)
+
+    def _memory_bytes(self) -> int:
+        """Estimated memory used by the graph (mapped snapshot arrays included)."""
+        nodes = self.csr.number_of_nodes()
+        return (
+            self.csr.nbytes
+            + self._kinds.itemsize * len(self._kinds)
+            + self._counts.itemsize * len(self._counts)
+            + self.counters.nbytes
+            + nodes * self.NODE_BYTES
+            + len(self._memories) * self.MEMORY_BYTES
+            + self.counters.content_bytes
+        )
+
+    def get_graph_stats(self) -> Dict[str, Any]:
+        """Get graph statistics (from counters, in constant time)."""
+        stats = self.counters.get_stats()
+        stats.update({
+            "backend": "csr",
+            "adjacency_bytes": self.csr.nbytes,
+            "memory_bytes": self._memory_bytes(),
+            "compactions": self.csr.compactions,
+        })
+        if self.max_nodes or self.max_edges or self.pruned:
+            stats["pruned_nodes"] = self.pruned
+        if self.ranker is not None:
+            stats["ranking"] = self.ranker.get_stats()
+        return stats
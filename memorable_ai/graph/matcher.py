@@ -0,0 +1,125 @@
+"""
+Entity Matcher
+
+Gazetteer of known entity names and aliases, used to find graph entities in
+queries. Names are indexed in a word-level trie that is updated as entities
+are added, and queries are matched case-insensitively in one left-to-right
+pass (leftmost-longest match, bounded by the longest name), so lowercase
+queries such as "where does alice work" still hit the graph.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+_TOKEN = re.compile(r"\w+")
+
+# Names made only of these words are not indexed (sentence-initial words
+# such as "The" or "What" are picked up as entities by capitalization)
+STOPWORDS = frozenset(
+    "a an and are as at be but by can could did do does for from had has have he her "
+    "hers him his how i if in into is it its me my no not of on or our she so than that "
+    "the their them then there these they this those to was we were what when where "
+    "which who whom why will with would you your yes ok okay hi hello please thanks "
+    "tell show give find let".split()
+)
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+class _Node:
+    __slots__ = ("children", "entities")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.entities: Optional[Set[Hashable]] = None
+
+
+class EntityMatcher:
+    """
+    Incremental word-level trie over entity names and aliases.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._lock = threading.Lock()
+        self.max_tokens = 0
+        self.names = 0
+
+    def add(self, name: str, entity: Optional[Hashable] = None) -> bool:
+        """
+        Index a name (or alias) for an entity.
+
+        Args:
+            name: Entity name or alias
+            entity: Entity key returned on match (default: the name itself)
+
+        Returns:
+            True if the name was indexed (False for empty or stopword-only names)
+        """
+        tokens = _tokens(name)
+        if not tokens or all(token in STOPWORDS for token in tokens):
+            return False
+
+        with self._lock:
+            node = self._root
+            for token in tokens:
+                child = node.children.get(token)
+                if child is None:
+                    child = _Node()
+                    node.children[token] = child
+                node = child
+            if node.entities is None:
+                node.entities = set()
+                self.names += 1
+            node.entities.add(name if entity is None else entity)
+            self.max_tokens = max(self.max_tokens, len(tokens))
+        return True
+
+    def add_many(self, names: Iterable[str]):
+        """Index several entity names."""
+        for name in names:
+            self.add(name)
+
+    def match(self, text: str) -> List[Any]:
+        """
+        Find known entities in text.
+
+        Args:
+            text: Text to scan (case-insensitive)
+
+        Returns:
+            Matched entity keys, in order of first occurrence
+        """
+        tokens = _tokens(text)
+        found: Dict[Any, None] = {}
+        position = 0
+        while position < len(tokens):
+            node = self._root
+            longest_end, longest = position, None
+            for end in range(position, min(len(tokens), position + self.max_tokens)):
+                node = node.children.get(tokens[end])
+                if node is None:
+                    break
+                if node.entities:
+                    longest_end, longest = end + 1, node.entities
+            if longest:
+                for entity in sorted(longest, key=str):
+                    found.setdefault(entity)
+                position = longest_end
+            else:
+                position += 1
+        return list(found)
+
+    def __contains__(self, name: str) -> bool:
+        node = self._root
+        for token in _tokens(name):
+            node = node.children.get(token)
+            if node is None:
+                return False
+        return bool(node.entities)
+
+    def __len__(self) -> int:
+        return self.names
@@ -0,0 +1,250 @@
+"""
+Partitioned Graph
+
+Per-namespace partitions for the in-process graph backends, so that tenants
+never see each other's entities and traversal cost scales with the
+tenant's graph rather than the whole process's.
+
+Partitions are built on demand - from a binary snapshot plus replay log
+when a snapshot store is configured, otherwise from the namespace's stored
+memories - and kept in an LRU; cold partitions are evicted (and
+snapshotted) and rebuilt the next time they are used. Each partition
+enforces its own node and edge caps.
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from memorable_ai.graph.builder import GraphBuilder
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionedGraph:
+    """
+    LRU of per-namespace graph builders with the GraphBuilder API.
+
+    Like Storage, an instance is bound to one namespace; ``for_namespace``
+    returns a cheap view sharing the partition cache.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], GraphBuilder],
+        storage: Optional[Any] = None,
+        namespace: Optional[str] = None,
+        max_partitions: int = 256,
+        load_limit: int = 10000,
+        snapshots: Optional[Any] = None,
+    ):
+        """
+        Initialize partitioned graph.
+
+        Args:
+            factory: Creates an empty graph builder for a partition
+            storage: Storage used to rebuild partitions on demand (optional)
+            namespace: Namespace of this view
+            max_partitions: Maximum partitions kept in memory (LRU)
+            load_limit: Maximum memories (most important first) loaded into a partition
+            snapshots: Optional GraphSnapshotStore; partitions are then loaded from
+                snapshots (plus replay log) instead of re-extracted from storage
+        """
+        self.factory = factory
+        self.storage = storage
+        self.namespace = namespace
+        self.max_partitions = max(1, max_partitions)
+        self.load_limit = load_limit
+        self.snapshots = snapshots
+
+        self._partitions: "OrderedDict[Optional[str], GraphBuilder]" = OrderedDict()
+        # Aliases per namespace, replayed when a partition is rebuilt
+        self._aliases: Dict[Optional[str], Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._counters = {"loads": 0, "evictions": 0}
+
+    def for_namespace(self, namespace: Optional[str]) -> "PartitionedGraph":
+        """
+        Get a view bound to another namespace.
+
+        Args:
+            namespace: Namespace for the view
+
+        Returns:
+            PartitionedGraph sharing this instance's partitions
+        """
+        view = copy.copy(self)
+        view.namespace = namespace
+        return view
+
+    async def _partition(self) -> Tuple[GraphBuilder, Set[Any]]:
+        """
+        Partition for this namespace, loading or building it if needed.
+
+        Returns:
+            (partition, IDs of memories loaded while building it)
+        """
+        with self._lock:
+            partition = self._partitions.get(self.namespace)
+            if partition is not None:
+                self._partitions.move_to_end(self.namespace)
+                return partition, set()
+
+        partition = self.factory()
+        loaded: Set[Any] = set()
+        restored = self.snapshots is not None and await self.snapshots.load(
+            self.namespace, partition
+        )
+        if not restored and self.storage is not None:
+            storage = self.storage.for_namespace(self.namespace)
+            memories = await storage.get_memories(limit=self.load_limit)
+            await partition.update_graph(memories)
+            loaded = {memory.get("id") for memory in memories}
+            if self.snapshots is not None and memories:
+                self.snapshots.save(self.namespace, partition, force=True)
+        for alias, entity in self._aliases.get(self.namespace, {}).items():
+            partition.add_alias(alias, entity)
+
+        evicted = []
+        with self._lock:
+            existing = self._partitions.get(self.namespace)
+            if existing is not None:
+                # Built concurrently by another task
+                self._partitions.move_to_end(self.namespace)
+                return existing, set()
+            self._partitions[self.namespace] = partition
+            self._counters["loads"] += 1
+            while len(self._partitions) > self.max_partitions:
+                evicted.append(self._partitions.popitem(last=False))
+                self._counters["evictions"] += 1
+
+        for namespace, cold in evicted:
+            logger.debug(f"Evicted graph partition {namespace!r}")
+            if self.snapshots is not None:
+                self.snapshots.save(namespace, cold)
+        return partition, loaded
+
+    async def update_graph(self, memories: List[Dict[str, Any]]):
+        """
+        Update this namespace's partition with new memories.
+
+        Args:
+            memories: List of extracted memories
+        """
+        partition, loaded = await self._partition()
+        # A freshly built partition already contains stored memories
+        memories = [m for m in memories if m.get("id") is None or m.get("id") not in loaded]
+        if memories:
+            await partition.update_graph(memories)
+            if self.snapshots is not None:
+                self.snapshots.append(self.namespace, memories)
+                if self.snapshots.due(self.namespace):
+                    self.snapshots.save(self.namespace, partition)
+
+    async def merge_memories(
+        self,
+        mapping: Dict[Any, Any],
+        canonicals: Optional[Dict[Any, Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Redirect the links of merged memories in this namespace's partition.
+
+        The partition is loaded if needed, and re-snapshotted afterwards so
+        that the replay log does not bring the duplicates back.
+
+        Args:
+            mapping: Duplicate memory ID -> canonical memory ID
+            canonicals: Canonical memory ID -> memory dictionary (optional)
+
+        Returns:
+            Number of memory nodes removed
+        """
+        partition, _ = await self._partition()
+        removed = await partition.merge_memories(mapping, canonicals)
+        if removed and self.snapshots is not None:
+            self.snapshots.save(self.namespace, partition, force=True)
+        return removed
+
+    def save_snapshots(self) -> int:
+        """
+        Snapshot every loaded partition with unsaved changes (e.g. on shutdown).
+
+        Returns:
+            Number of snapshots written
+        """
+        if self.snapshots is None:
+            return 0
+        with self._lock:
+            partitions = list(self._partitions.items())
+        return sum(
+            1 for namespace, partition in partitions if self.snapshots.save(namespace, partition)
+        )
+
+    async def find_related(
+        self, query: str, limit: int = 10, hops: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Find related memories in this namespace's partition.
+
+        Args:
+            query: Search query
+            limit: Maximum results
+            hops: Maximum number of edges from a query entity to a memory
+
+        Returns:
+            List of related memories
+        """
+        partition, _ = await self._partition()
+        return await partition.find_related(query, limit=limit, hops=hops)
+
+    def add_alias(self, alias: str, entity: str):
+        """
+        Register an alternative name for an entity in this namespace.
+
+        Args:
+            alias: Alternative name
+            entity: Entity name as stored in the graph
+        """
+        with self._lock:
+            self._aliases.setdefault(self.namespace, {})[alias] = entity
+            partition = self._partitions.get(self.namespace)
+        if partition is not None:
+            partition.add_alias(alias, entity)
+        if self.snapshots is not None:
+            self.snapshots.append_alias(self.namespace, alias, entity)
+
+    def get_graph_stats(self) -> Dict[str, Any]:
+        """Get statistics of this namespace's partition plus partition counters."""
+        with self._lock:
+            partition = self._partitions.get(self.namespace)
+            counters = {
+                "loaded": len(self._partitions),
+                "max_partitions": self.max_partitions,
+                **self._counters,
+            }
+
+        if partition is not None:
+            stats = partition.get_graph_stats()
+        else:
+            stats = {
+                "nodes": 0,
+                "edges": 0,
+                "entity_nodes": 0,
+                "memory_nodes": 0,
+                "relationships": {},
+                "degree_histogram": {},
+                "memory_bytes": 0,
+            }
+        stats["partition_loaded"] = partition is not None
+        stats["partitions"] = counters
+        if self.snapshots is not None:
+            stats["snapshots"] = self.snapshots.get_stats()
+        return stats
+
+    def get_partition_stats(self) -> Dict[Optional[str], Dict[str, Any]]:
+        """Statistics of every loaded partition, keyed by namespace."""
+        with self._lock:
+            partitions = list(self._partitions.items())
+        return {namespace: partition.get_graph_stats() for namespace, partition in partitions}
@@ -0,0 +1,291 @@
+"""
+Graph Snapshots
+
+Binary snapshots of in-process graphs, so a warm start loads the graph in
+time proportional to its size on disk instead of re-extracting entities
+from every memory.
+
+File layout (little-endian)::
+
+    b"MEMGRAPH" | u32 format version | u32 reserved | u64 header length
+    header (UTF-8 JSON: metadata + array table)
+    arrays, each aligned to 64 bytes
+
+Arrays are loaded with ``np.memmap`` (zero-copy, read-only). Changes made
+after a snapshot go to an append-only replay log (JSON lines of the
+memories passed to ``update_graph`` and of added aliases), replayed on load; the log is
+truncated whenever a new snapshot is written. Snapshots are replaced
+atomically, so a mapped snapshot is never modified underneath a reader.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from memorable_ai.core.errors import GraphError
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MEMGRAPH"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sIIQ")
+_ALIGN = 64
+
+
+def _aligned(position: int) -> int:
+    return -(-position // _ALIGN) * _ALIGN
+
+
+def write_snapshot(path: str, arrays: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> int:
+    """
+    Write a snapshot file atomically.
+
+    Args:
+        path: Destination file
+        arrays: Named arrays (any fixed-size dtype)
+        metadata: JSON-serializable metadata
+
+    Returns:
+        Size of the file in bytes
+    """
+    table = {}
+    position = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        position = _aligned(position)
+        table[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": position}
+        position += array.nbytes
+
+    header = json.dumps({"metadata": metadata, "arrays": table}, separators=(",", ":")).encode()
+    data_start = _aligned(_PREAMBLE.size + len(header))
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + table[name]["offset"])
+            f.write(array.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+        size = f.tell()
+    os.replace(temporary, path)
+    return size
+
+
+def read_snapshot(path: str, mmap: bool = True) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Read a snapshot file.
+
+    Args:
+        path: Snapshot file
+        mmap: Map arrays read-only instead of reading them into memory
+
+    Returns:
+        (arrays, metadata)
+    """
+    with open(path, "rb") as f:
+        magic, version, _, header_length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise GraphError(f"Not a graph snapshot: {path}")
+        if version != FORMAT_VERSION:
+            raise GraphError(f"Unsupported graph snapshot version {version}: {path}")
+        header = json.loads(f.read(header_length))
+
+    data_start = _aligned(_PREAMBLE.size + header_length)
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        count = int(np.prod(shape)) if shape else 1
+        offset = data_start + entry["offset"]
+        if not count:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+        elif mmap:
+            arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        else:
+            arrays[name] = np.fromfile(path, dtype=dtype, count=count, offset=offset).reshape(shape)
+    return arrays, header["metadata"]
+
+
+class GraphSnapshotStore:
+    """
+    Snapshot files and replay logs of graph partitions, one pair per namespace.
+
+    Graphs must implement ``save_snapshot(path, sequence)`` and
+    ``load_snapshot(path) -> sequence``.
+    """
+
+    def __init__(self, directory: str, interval: float = 300.0):
+        """
+        Initialize snapshot store.
+
+        Args:
+            directory: Directory holding ``<namespace>.graph`` / ``<namespace>.log`` files
+            interval: Seconds between periodic snapshots of a changed partition
+        """
+        self.directory = directory
+        self.interval = interval
+        os.makedirs(directory, exist_ok=True)
+
+        # namespace -> last logged sequence number / time of the last snapshot
+        self._sequences: Dict[Optional[str], int] = {}
+        self._saved_at: Dict[Optional[str], float] = {}
+        self._dirty: Dict[Optional[str], bool] = {}
+        self._lock = threading.Lock()
+
+        self.snapshots = 0
+        self.loads = 0
+        self.replayed = 0
+
+    def _paths(self, namespace: Optional[str]) -> Tuple[str, str]:
+        """Snapshot and log paths of a namespace."""
+        if namespace is None:
+            name = "_default"
+        else:
+            # Readable prefix plus a hash, so distinct namespaces never collide
+            safe = re.sub(r"[^A-Za-z0-9_.-]", "_", namespace)[:64]
+            name = f"{safe}-{hashlib.md5(namespace.encode()).hexdigest()[:8]}"
+        base = os.path.join(self.directory, name)
+        return f"{base}.graph", f"{base}.log"
+
+    async def load(self, namespace: Optional[str], graph: Any) -> bool:
+        """
+        Load a namespace's snapshot into an empty graph and replay its log.
+
+        Args:
+            namespace: Namespace
+            graph: Empty graph builder
+
+        Returns:
+            True if a snapshot or log was found
+        """
+        snapshot_path, log_path = self._paths(namespace)
+        sequence = 0
+        found = False
+        if os.path.exists(snapshot_path):
+            try:
+                sequence = graph.load_snapshot(snapshot_path)
+                found = True
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable graph snapshot {snapshot_path}: {e}")
+                return False
+
+        replayed = 0
+        for entry in self._read_log(log_path):
+            found = True
+            if entry["seq"] <= sequence:
+                continue
+            if "alias" in entry:
+                graph.add_alias(*entry["alias"])
+            else:
+                await graph.update_graph(entry["memories"])
+            sequence = entry["seq"]
+            replayed += 1
+
+        with self._lock:
+            self._sequences[namespace] = sequence
+            self._saved_at[namespace] = time.monotonic()
+            self._dirty[namespace] = replayed > 0
+            if found:
+                self.loads += 1
+            self.replayed += replayed
+        return found
+
+    def append(self, namespace: Optional[str], memories: List[Dict[str, Any]]):
+        """
+        Append memories added to a namespace's graph to its replay log.
+
+        Args:
+            namespace: Namespace
+            memories: Memories passed to update_graph
+        """
+        entries = [
+            {"id": m.get("id"), "content": m.get("content", ""), "type": m.get("type", "fact")}
+            for m in memories
+            if m.get("content")
+        ]
+        if entries:
+            self._log(namespace, {"memories": entries})
+
+    def append_alias(self, namespace: Optional[str], alias: str, entity: str):
+        """Append an entity alias to a namespace's replay log."""
+        self._log(namespace, {"alias": [alias, entity]})
+
+    def _log(self, namespace: Optional[str], entry: Dict[str, Any]):
+        """Append one sequenced entry to a namespace's replay log."""
+        _, log_path = self._paths(namespace)
+        with self._lock:
+            sequence = self._sequences.get(namespace, 0) + 1
+            self._sequences[namespace] = sequence
+            self._dirty[namespace] = True
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"seq": sequence, **entry}) + "\n")
+
+    def due(self, namespace: Optional[str]) -> bool:
+        """Whether a namespace has unsaved changes older than the snapshot interval."""
+        with self._lock:
+            if not self._dirty.get(namespace):
+                return False
+            saved_at = self._saved_at.get(namespace)
+            return saved_at is None or time.monotonic() - saved_at >= self.interval
+
+    def save(self, namespace: Optional[str], graph: Any, force: bool = False) -> bool:
+        """
+        Snapshot a namespace's graph and truncate its log.
+
+        Args:
+            namespace: Namespace
+            graph: Graph builder
+            force: Write even without unsaved changes
+
+        Returns:
+            True if a snapshot was written
+        """
+        snapshot_path, log_path = self._paths(namespace)
+        with self._lock:
+            if not force and not self._dirty.get(namespace, True):
+                return False
+            sequence = self._sequences.get(namespace, 0)
+            graph.save_snapshot(snapshot_path, sequence)
+            # Everything logged so far is in the snapshot
+            if os.path.exists(log_path):
+                os.remove(log_path)
+            self._saved_at[namespace] = time.monotonic()
+            self._dirty[namespace] = False
+            self.snapshots += 1
+        logger.debug(f"Wrote graph snapshot {snapshot_path} (sequence {sequence})")
+        return True
+
+    def _read_log(self, log_path: str):
+        """Yield entries of a replay log, skipping a torn last line."""
+        if not os.path.exists(log_path):
+            return
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt graph log entry in {log_path}")
+                    continue
+                yield entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot statistics."""
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "snapshots": self.snapshots,
+                "loads": self.loads,
+                "replayed_entries": self.replayed,
+                "dirty_partitions": sum(1 for dirty in self._dirty.values() if dirty),
+            }
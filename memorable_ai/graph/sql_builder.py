@@ -0,0 +1,861 @@
+"""
+SQL Graph Builder
+
+Persists the knowledge graph in indexed SQL tables - by default in the same
+database as the memories - so that it survives restarts and every worker
+process sees the same graph without holding a full copy of it.
+
+k-hop expansion runs either as a recursive CTE in the database or, with the
+adjacency cache enabled, as a breadth-first walk over per-entity adjacency
+lists that are loaded lazily (one batched query per hop) and kept in a
+bounded in-process LRU.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    bindparam,
+    create_engine,
+    func,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from memorable_ai.core.errors import GraphError
+from memorable_ai.core.storage import Memory
+from memorable_ai.graph.builder import GraphBuilder
+from memorable_ai.graph.matcher import EntityMatcher
+
+logger = logging.getLogger(__name__)
+
+GraphBase = declarative_base()
+
+# Maximum number of bound parameters per IN (...) clause
+_CHUNK_SIZE = 500
+
+
+class GraphEntity(GraphBase):
+    """Entity node table."""
+
+    __tablename__ = "graph_entities"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, default="")  # "" for no namespace
+    name = Column(String(255), nullable=False)
+    name_key = Column(String(255), nullable=False)  # Lowercased name for lookups
+    count = Column(Integer, default=0)  # Number of memories mentioning the entity
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_graph_entity_key", "namespace", "name_key", unique=True),
+    )
+
+
+class GraphMemoryLink(GraphBase):
+    """Entity -> memory ('contains') edges."""
+
+    __tablename__ = "graph_memory_links"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, default="")
+    entity_id = Column(Integer, nullable=False)
+    memory_id = Column(Integer, nullable=False, index=True)
+
+    __table_args__ = (
+        Index("idx_graph_link_entity_memory", "entity_id", "memory_id", unique=True),
+    )
+
+
+class GraphEdge(GraphBase):
+    """Entity -> entity relationship edges."""
+
+    __tablename__ = "graph_edges"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(255), nullable=False, default="")
+    source_id = Column(Integer, nullable=False)
+    target_id = Column(Integer, nullable=False, index=True)
+    relationship = Column(String(50), nullable=False)
+    weight = Column(Integer, default=1)  # Number of times the relationship was seen
+
+    __table_args__ = (
+        Index("idx_graph_edge_key", "source_id", "target_id", "relationship", unique=True),
+    )
+
+
+class SQLGraphBuilder(GraphBuilder):
+    """
+    Knowledge graph persisted in SQL.
+
+    Entity extraction is shared with the in-memory GraphBuilder; nodes and
+    edges are stored in the ``graph_entities``, ``graph_memory_links`` and
+    ``graph_edges`` tables, scoped by namespace.
+    """
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        engine: Optional[Any] = None,
+        namespace: Optional[str] = None,
+        adjacency_cache_size: int = 100_000,
+        cache_ttl: Optional[float] = 30.0,
+        ranking: str = "depth",
+        max_nodes: int = 0,
+        max_edges: int = 0,
+    ):
+        """
+        Initialize SQL graph builder.
+
+        Args:
+            connection_string: Database connection string (ignored if engine is given)
+            engine: Existing SQLAlchemy engine to share (e.g. Storage.engine)
+            namespace: Namespace of the graph
+            adjacency_cache_size: Maximum entities in the adjacency cache (0 uses
+                recursive CTEs for every expansion)
+            cache_ttl: Seconds before cached adjacency is reloaded, so that
+                writes from other processes become visible (None never expires)
+            ranking: Order of related memories: 'depth' or 'pagerank'
+            max_nodes: Node cap per namespace (0 = unlimited)
+            max_edges: Edge cap per namespace (0 = unlimited)
+        """
+        super().__init__(
+            connection_string=connection_string,
+            ranking=ranking,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+        )
+
+        if engine is None:
+            if not connection_string:
+                raise GraphError("SQLGraphBuilder needs a connection string or an engine")
+            if connection_string.startswith("sqlite"):
+                engine = create_engine(
+                    connection_string,
+                    connect_args={"check_same_thread": False},
+                    poolclass=StaticPool,
+                )
+            else:
+                engine = create_engine(connection_string, pool_pre_ping=True)
+
+        self.engine = engine
+        self.SessionLocal = sessionmaker(bind=engine)
+        GraphBase.metadata.create_all(engine)
+
+        self.namespace = namespace
+        self.adjacency_cache_size = max(0, adjacency_cache_size)
+        self.cache_ttl = cache_ttl if cache_ttl and cache_ttl > 0 else None
+        if self.ranker is not None:
+            # Rankings must also expire to pick up other workers' writes
+            self.ranker.cache_ttl = self.cache_ttl
+
+        # entity_id -> (loaded_at, target entity ids, memory ids)
+        self._adjacency: "OrderedDict[int, Tuple[float, Tuple[int, ...], Tuple[int, ...]]]" = (
+            OrderedDict()
+        )
+        # namespace key -> (computed_at, stats); shared with namespace views
+        self._stats_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._reset_matcher()
+
+    def for_namespace(self, namespace: Optional[str]) -> "SQLGraphBuilder":
+        """
+        Get a graph view bound to another namespace.
+        
+        The view shares this instance's engine and adjacency cache (entity
+        IDs are unique across namespaces), so creating one is cheap.
+        
+        Args:
+            namespace: Namespace for the view
+            
+        Returns:
+            SQLGraphBuilder scoped to the namespace
+        """
+        view = copy.copy(self)
+        view.namespace = namespace
+        view._aliases = {}
+        view.pruned = 0
+        view._reset_matcher()
+        return view
+
+    def _reset_matcher(self):
+        """Start an empty entity gazetteer, filled from the database on first query."""
+        self.matcher = EntityMatcher()
+        self._matcher_max_id = 0
+        self._matcher_loaded_at: Optional[float] = None
+        self._matcher_lock = threading.Lock()
+
+    def _refresh_matcher(self, session: Session):
+        """
+        Load entities added since the last refresh into the gazetteer.
+
+        Runs on first use and then at most once per cache TTL, so entities
+        written by other workers become matchable.
+        """
+        now = time.monotonic()
+        loaded_at = self._matcher_loaded_at
+        if loaded_at is not None and (self.cache_ttl is None or now - loaded_at <= self.cache_ttl):
+            return
+
+        with self._matcher_lock:
+            if self._matcher_loaded_at is not loaded_at:
+                return
+            rows = (
+                session.query(GraphEntity.id, GraphEntity.name)
+                .filter(GraphEntity.namespace == self._namespace_key)
+                .filter(GraphEntity.id > self._matcher_max_id)
+                .order_by(GraphEntity.id)
+            )
+            for entity_id, name in rows:
+                self.matcher.add(name)
+                self._matcher_max_id = entity_id
+            if loaded_at is None:
+                for alias, entity in self._aliases.items():
+                    self.matcher.add(alias, entity)
+            self._matcher_loaded_at = now
+
+    def _create_graph(self) -> Any:
+        """No in-memory graph: the SQL tables are the graph."""
+        return None
+
+    @property
+    def _namespace_key(self) -> str:
+        return self.namespace or ""
+
+    def get_session(self) -> Session:
+        """Get database session."""
+        return self.SessionLocal()
+
+    async def update_graph(self, memories: List[Dict[str, Any]]):
+        """
+        Update graph with new memories, in one transaction.
+
+        Args:
+            memories: List of extracted memories (with ``id`` set by Storage)
+        """
+        if not memories:
+            return
+
+        for attempt in range(2):
+            try:
+                touched = self._write_memories(memories)
+                break
+            except IntegrityError:
+                # Another worker inserted the same entity or edge concurrently
+                if attempt:
+                    raise
+                logger.debug("Graph write conflict, retrying")
+
+        self._invalidate(touched)
+        if self.cache_ttl is None:
+            with self._lock:
+                self._stats_cache.pop(self._namespace_key, None)
+        self.version += 1
+        self._enforce_caps()
+
+    async def _add_memory_to_graph(self, memory: Dict[str, Any]):
+        """Add a single memory to the graph."""
+        await self.update_graph([memory])
+
+    def _write_memories(self, memories: List[Dict[str, Any]]) -> Set[int]:
+        """
+        Insert entities, memory links and relationship edges.
+
+        Returns:
+            IDs of entities whose adjacency changed
+        """
+        touched: Set[int] = set()
+        names: Set[str] = set()
+        session = self.get_session()
+        try:
+            for memory in memories:
+                content = memory.get("content", "")
+                if not content:
+                    continue
+
+                entities = self._extract_entities(content)
+                if not entities:
+                    continue
+                entity_ids = self._upsert_entities(session, entities)
+                touched.update(entity_ids.values())
+                names.update(entities)
+
+                memory_id = memory.get("id")
+                if isinstance(memory_id, int):
+                    self._link_memory(session, memory_id, entity_ids.values())
+
+                for source, target, rel_type in self._extract_relationships(content, entities):
+                    self._upsert_edge(session, entity_ids[source], entity_ids[target], rel_type)
+
+            session.commit()
+            self.matcher.add_many(names)
+            return touched
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _upsert_entities(self, session: Session, names: List[str]) -> Dict[str, int]:
+        """Insert missing entities, bump mention counts, and return name -> id."""
+        keys = {name: name.lower() for name in names}
+        existing = {
+            entity.name_key: entity
+            for entity in session.query(GraphEntity)
+            .filter(GraphEntity.namespace == self._namespace_key)
+            .filter(GraphEntity.name_key.in_(set(keys.values())))
+        }
+
+        for name, key in keys.items():
+            entity = existing.get(key)
+            if entity is None:
+                entity = GraphEntity(
+                    namespace=self._namespace_key, name=name, name_key=key, count=0
+                )
+                session.add(entity)
+                existing[key] = entity
+            entity.count = (entity.count or 0) + 1
+
+        session.flush()
+        return {name: existing[key].id for name, key in keys.items()}
+
+    def _link_memory(self, session: Session, memory_id: int, entity_ids: Iterable[int]):
+        """Add entity -> memory links that do not exist yet."""
+        entity_ids = set(entity_ids)
+        linked = {
+            row[0]
+            for row in session.query(GraphMemoryLink.entity_id)
+            .filter(GraphMemoryLink.memory_id == memory_id)
+            .filter(GraphMemoryLink.entity_id.in_(entity_ids))
+        }
+        for entity_id in entity_ids - linked:
+            session.add(
+                GraphMemoryLink(
+                    namespace=self._namespace_key, entity_id=entity_id, memory_id=memory_id
+                )
+            )
+
+    def _upsert_edge(self, session: Session, source_id: int, target_id: int, rel_type: str):
+        """Insert a relationship edge or bump its weight."""
+        edge = (
+            session.query(GraphEdge)
+            .filter_by(source_id=source_id, target_id=target_id, relationship=rel_type)
+            .first()
+        )
+        if edge is None:
+            session.add(
+                GraphEdge(
+                    namespace=self._namespace_key,
+                    source_id=source_id,
+                    target_id=target_id,
+                    relationship=rel_type,
+                    weight=1,
+                )
+            )
+            session.flush()
+        else:
+            edge.weight = (edge.weight or 0) + 1
+
+    async def find_related(
+        self, query: str, limit: int = 10, hops: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Find related memories using graph traversal.
+
+        Args:
+            query: Search query
+            limit: Maximum results
+            hops: Maximum number of edges from a query entity to a memory
+
+        Returns:
+            List of related memories, closest first (with ``graph_depth``), or
+            best first (with ``graph_score``) when ranked by PageRank
+        """
+        if hops < 1:
+            return []
+
+        session = self.get_session()
+        try:
+            self._refresh_matcher(session)
+            query_entities = self._query_entities(query)
+            if not query_entities:
+                return []
+
+            seeds = self._entity_ids(session, query_entities)
+            if not seeds:
+                return []
+
+            if self.ranker is not None:
+                scores = self.ranker.rank(
+                    seeds, self.version, lambda: self._subgraph(session, seeds, hops)
+                )
+                memory_scores = {
+                    node[1]: score for node, score in scores.items()
+                    if isinstance(node, tuple) and score > 0
+                }
+                ranked = sorted(memory_scores.items(), key=lambda item: item[1], reverse=True)
+                top = ranked[0][1] if ranked else 1.0
+                ranked = [(memory_id, score / top) for memory_id, score in ranked]
+                return self._memory_details(session, ranked, limit, field="graph_score")
+
+            if self.adjacency_cache_size:
+                depths = self._expand_cached(session, seeds, hops)
+            else:
+                depths = self._expand_cte(session, seeds, hops)
+
+            ranked = sorted(depths.items(), key=lambda item: (item[1], -item[0]))
+            return self._memory_details(session, ranked, limit)
+        except Exception as e:
+            logger.error(f"Graph expansion failed: {e}")
+            return []
+        finally:
+            session.close()
+
+    def _entity_ids(self, session: Session, names: List[str]) -> Set[int]:
+        """IDs of known entities among the given names."""
+        keys = {name.lower() for name in names}
+        return {
+            row[0]
+            for row in session.query(GraphEntity.id)
+            .filter(GraphEntity.namespace == self._namespace_key)
+            .filter(GraphEntity.name_key.in_(keys))
+        }
+
+    def _expand_cte(self, session: Session, seeds: Set[int], hops: int) -> Dict[int, int]:
+        """
+        k-hop expansion as a recursive CTE.
+
+        Returns:
+            memory_id -> number of edges from the nearest seed entity
+        """
+        reach = (
+            select(GraphEntity.id.label("entity_id"), literal(0).label("depth"))
+            .where(GraphEntity.id.in_(seeds))
+            .cte("reach", recursive=True)
+        )
+        reach = reach.union_all(
+            select(GraphEdge.target_id, reach.c.depth + 1)
+            .where(GraphEdge.source_id == reach.c.entity_id)
+            .where(reach.c.depth < hops - 1)
+        )
+        statement = (
+            select(GraphMemoryLink.memory_id, func.min(reach.c.depth))
+            .where(GraphMemoryLink.entity_id == reach.c.entity_id)
+            .group_by(GraphMemoryLink.memory_id)
+        )
+        return {memory_id: depth + 1 for memory_id, depth in session.execute(statement)}
+
+    def _expand_cached(self, session: Session, seeds: Set[int], hops: int) -> Dict[int, int]:
+        """
+        k-hop expansion over the lazily loaded adjacency cache.
+
+        Returns:
+            memory_id -> number of edges from the nearest seed entity
+        """
+        visited = set(seeds)
+        frontier = set(seeds)
+        memories: Dict[int, int] = {}
+
+        for depth in range(1, hops + 1):
+            adjacency = self._adjacency_for(session, frontier)
+            next_frontier = set()
+            for entity_id in frontier:
+                targets, memory_ids = adjacency.get(entity_id, ((), ()))
+                for memory_id in memory_ids:
+                    memories.setdefault(memory_id, depth)
+                next_frontier.update(targets)
+            frontier = next_frontier - visited
+            visited |= frontier
+            if not frontier:
+                break
+        return memories
+
+    def _subgraph(
+        self, session: Session, seeds: Set[int], hops: int
+    ) -> Tuple[List[Any], List[int], List[int]]:
+        """
+        Local subgraph within ``hops`` edges of the seeds, for ranking.
+
+        Entity nodes are keyed by entity id, memory nodes by ("memory", id).
+        """
+        index: Dict[Any, int] = {entity_id: i for i, entity_id in enumerate(seeds)}
+        sources: List[int] = []
+        targets: List[int] = []
+
+        def node(key: Any) -> int:
+            if key not in index:
+                index[key] = len(index)
+            return index[key]
+
+        frontier = set(seeds)
+        for depth in range(1, hops + 1):
+            adjacency = self._adjacency_for(session, frontier)
+            next_frontier = set()
+            for entity_id in frontier:
+                entity_targets, memory_ids = adjacency.get(entity_id, ((), ()))
+                for memory_id in memory_ids:
+                    sources.append(index[entity_id])
+                    targets.append(node(("memory", memory_id)))
+                if depth < hops:
+                    for target_id in entity_targets:
+                        if target_id not in index:
+                            next_frontier.add(target_id)
+                        sources.append(index[entity_id])
+                        targets.append(node(target_id))
+            frontier = next_frontier
+            if not frontier:
+                break
+        return list(index), sources, targets
+
+    def _adjacency_for(
+        self, session: Session, entity_ids: Set[int]
+    ) -> Dict[int, Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+        """Adjacency lists for entities, loading cache misses in batched queries."""
+        now = time.monotonic()
+        result: Dict[int, Tuple[Tuple[int, ...], Tuple[int, ...]]] = {}
+        missing = []
+
+        with self._lock:
+            for entity_id in entity_ids:
+                entry = self._adjacency.get(entity_id)
+                if entry is None or (self.cache_ttl is not None and now - entry[0] > self.cache_ttl):
+                    missing.append(entity_id)
+                    continue
+                self._adjacency.move_to_end(entity_id)
+                result[entity_id] = entry[1:]
+
+        if not missing:
+            return result
+
+        targets: Dict[int, List[int]] = {entity_id: [] for entity_id in missing}
+        memory_ids: Dict[int, List[int]] = {entity_id: [] for entity_id in missing}
+        for chunk in _chunks(missing):
+            for source_id, target_id in session.query(GraphEdge.source_id, GraphEdge.target_id).filter(
+                GraphEdge.source_id.in_(chunk)
+            ):
+                targets[source_id].append(target_id)
+            for entity_id, memory_id in session.query(
+                GraphMemoryLink.entity_id, GraphMemoryLink.memory_id
+            ).filter(GraphMemoryLink.entity_id.in_(chunk)):
+                memory_ids[entity_id].append(memory_id)
+
+        with self._lock:
+            for entity_id in missing:
+                entry = (now, tuple(targets[entity_id]), tuple(memory_ids[entity_id]))
+                self._adjacency[entity_id] = entry
+                self._adjacency.move_to_end(entity_id)
+                result[entity_id] = entry[1:]
+            while len(self._adjacency) > self.adjacency_cache_size:
+                self._adjacency.popitem(last=False)
+        return result
+
+    def _invalidate(self, entity_ids: Iterable[int]):
+        """Drop cached adjacency for entities changed by this process."""
+        with self._lock:
+            for entity_id in entity_ids:
+                self._adjacency.pop(entity_id, None)
+
+    def _memory_details(
+        self,
+        session: Session,
+        ranked: Sequence[Tuple[int, Any]],
+        limit: int,
+        field: str = "graph_depth",
+    ) -> List[Dict[str, Any]]:
+        """Load content for ranked (memory_id, value) pairs, skipping deleted memories."""
+        results: List[Dict[str, Any]] = []
+        # Over-fetch a little in case some linked memories were deleted
+        candidates = list(ranked[: max(limit * 2, limit + 10)])
+        values = dict(candidates)
+
+        rows = {}
+        for chunk in _chunks([memory_id for memory_id, _ in candidates]):
+            for memory in session.query(Memory.id, Memory.content, Memory.memory_type).filter(
+                Memory.id.in_(chunk)
+            ):
+                rows[memory.id] = memory
+
+        for memory_id, _ in candidates:
+            memory = rows.get(memory_id)
+            if memory is None:
+                continue
+            results.append({
+                "id": memory.id,
+                "content": memory.content,
+                "type": memory.memory_type,
+                field: values[memory_id],
+            })
+            if len(results) >= limit:
+                break
+        return results
+
+    def _counts(self, session: Session) -> Tuple[int, int, int, int]:
+        """Entity nodes, memory nodes, memory links and relationship edges in the namespace."""
+        namespace = self._namespace_key
+        entity_nodes = (
+            session.query(func.count(GraphEntity.id))
+            .filter(GraphEntity.namespace == namespace)
+            .scalar()
+        )
+        memory_nodes = (
+            session.query(func.count(func.distinct(GraphMemoryLink.memory_id)))
+            .filter(GraphMemoryLink.namespace == namespace)
+            .scalar()
+        )
+        links = (
+            session.query(func.count(GraphMemoryLink.id))
+            .filter(GraphMemoryLink.namespace == namespace)
+            .scalar()
+        )
+        edges = (
+            session.query(func.count(GraphEdge.id))
+            .filter(GraphEdge.namespace == namespace)
+            .scalar()
+        )
+        return entity_nodes, memory_nodes, links, edges
+
+    def _size(self) -> Tuple[int, int]:
+        """Number of nodes and edges in the namespace."""
+        session = self.get_session()
+        try:
+            entity_nodes, memory_nodes, links, edges = self._counts(session)
+            return entity_nodes + memory_nodes, links + edges
+        finally:
+            session.close()
+
+    def prune(self, max_nodes: int = 0, max_edges: int = 0) -> int:
+        """
+        Shrink the namespace's graph until it fits the limits.
+
+        Memory nodes beyond half the node limit are unlinked oldest first,
+        then the least-mentioned entities are deleted in batches together
+        with their links and edges (memory nodes disappear with their last
+        link).
+
+        Args:
+            max_nodes: Node limit (0 = unlimited)
+            max_edges: Edge limit (0 = unlimited)
+
+        Returns:
+            Number of nodes removed
+        """
+        namespace = self._namespace_key
+        session = self.get_session()
+        try:
+            entity_nodes, memory_nodes, _, _ = self._counts(session)
+            before = entity_nodes + memory_nodes
+
+            excess = memory_nodes - max_nodes // 2 if max_nodes else 0
+            while excess > 0:
+                memory_ids = [
+                    row[0]
+                    for row in session.query(GraphMemoryLink.memory_id)
+                    .filter(GraphMemoryLink.namespace == namespace)
+                    .distinct()
+                    .order_by(GraphMemoryLink.memory_id)
+                    .limit(min(excess, _CHUNK_SIZE))
+                ]
+                session.query(GraphMemoryLink).filter(
+                    GraphMemoryLink.namespace == namespace,
+                    GraphMemoryLink.memory_id.in_(memory_ids),
+                ).delete(synchronize_session=False)
+                session.commit()
+                excess -= len(memory_ids)
+
+            while True:
+                entity_nodes, memory_nodes, links, edges = self._counts(session)
+                node_excess = entity_nodes + memory_nodes - max_nodes if max_nodes else 0
+                edge_excess = links + edges - max_edges if max_edges else 0
+                if (node_excess <= 0 and edge_excess <= 0) or not entity_nodes:
+                    break
+
+                # Each entity carries about this many edges
+                degree = max(1, (links + 2 * edges) // entity_nodes)
+                batch = min(_CHUNK_SIZE, max(node_excess, -(-edge_excess // degree), 1))
+                ids = [
+                    row[0]
+                    for row in session.query(GraphEntity.id)
+                    .filter(GraphEntity.namespace == namespace)
+                    .order_by(GraphEntity.count, GraphEntity.id)
+                    .limit(batch)
+                ]
+                session.query(GraphMemoryLink).filter(
+                    GraphMemoryLink.entity_id.in_(ids)
+                ).delete(synchronize_session=False)
+                session.query(GraphEdge).filter(
+                    or_(GraphEdge.source_id.in_(ids), GraphEdge.target_id.in_(ids))
+                ).delete(synchronize_session=False)
+                session.query(GraphEntity).filter(GraphEntity.id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+                session.commit()
+
+            entity_nodes, memory_nodes, _, _ = self._counts(session)
+            removed = before - entity_nodes - memory_nodes
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        if removed:
+            with self._lock:
+                self._adjacency.clear()
+                self._stats_cache.pop(namespace, None)
+            self._reset_matcher()
+            self.pruned += removed
+            self.version += 1
+        return removed
+
+    async def merge_memories(
+        self,
+        mapping: Dict[Any, Any],
+        canonicals: Optional[Dict[Any, Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Redirect the links of merged memories to their canonical memory.
+
+        Links of a duplicate are re-pointed at the canonical memory, or
+        deleted where the entity already links to it, with one batched
+        UPDATE and DELETE per chunk.
+
+        Args:
+            mapping: Duplicate memory ID -> canonical memory ID
+            canonicals: Unused (memory content is read from storage)
+
+        Returns:
+            Number of duplicate memories that had links
+        """
+        if not mapping:
+            return 0
+
+        namespace = self._namespace_key
+        links = GraphMemoryLink.__table__
+        touched: Set[int] = set()
+        merged: Set[int] = set()
+        session = self.get_session()
+        try:
+            for chunk in _chunks(list(mapping)):
+                rows = (
+                    session.query(
+                        GraphMemoryLink.id, GraphMemoryLink.entity_id, GraphMemoryLink.memory_id
+                    )
+                    .filter(GraphMemoryLink.namespace == namespace)
+                    .filter(GraphMemoryLink.memory_id.in_(chunk))
+                    .all()
+                )
+                if not rows:
+                    continue
+                canonical_ids = {mapping[row.memory_id] for row in rows}
+                existing = {
+                    (row.entity_id, row.memory_id)
+                    for row in session.query(GraphMemoryLink.entity_id, GraphMemoryLink.memory_id)
+                    .filter(GraphMemoryLink.namespace == namespace)
+                    .filter(GraphMemoryLink.memory_id.in_(canonical_ids))
+                }
+
+                redirect, delete = [], []
+                for row in rows:
+                    key = (row.entity_id, mapping[row.memory_id])
+                    if key in existing:
+                        delete.append(row.id)
+                    else:
+                        existing.add(key)
+                        redirect.append({"link_id": row.id, "target": key[1]})
+                    touched.add(row.entity_id)
+                    merged.add(row.memory_id)
+
+                if redirect:
+                    session.execute(
+                        links.update()
+                        .where(links.c.id == bindparam("link_id"))
+                        .values(memory_id=bindparam("target")),
+                        redirect,
+                    )
+                if delete:
+                    session.execute(links.delete().where(links.c.id.in_(delete)))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        if merged:
+            self._invalidate(touched)
+            with self._lock:
+                self._stats_cache.pop(namespace, None)
+            self.version += 1
+        return len(merged)
+
+    def get_graph_stats(self) -> Dict[str, Any]:
+        """
+        Get graph statistics.
+
+        The graph is shared with other workers, so counts cannot be kept in
+        process; they are queried at most once per cache TTL and namespace
+        (without a TTL, once per local write).
+        """
+        namespace = self._namespace_key
+        now = time.monotonic()
+        cached = self._stats_cache.get(namespace)
+        if cached is not None and (self.cache_ttl is None or now - cached[0] <= self.cache_ttl):
+            counts = cached[1]
+        else:
+            counts = self._query_stats()
+            with self._lock:
+                self._stats_cache[namespace] = (now, counts)
+
+        stats = dict(counts)
+        stats["relationships"] = dict(counts["relationships"])
+        stats["backend"] = "sql"
+        stats["cached_entities"] = len(self._adjacency)
+        if self.max_nodes or self.max_edges or self.pruned:
+            stats["pruned_nodes"] = self.pruned
+        if self.ranker is not None:
+            stats["ranking"] = self.ranker.get_stats()
+        return stats
+
+    def _query_stats(self) -> Dict[str, Any]:
+        """Node, edge and per-relationship counts of the namespace."""
+        session = self.get_session()
+        try:
+            entity_nodes, memory_nodes, links, edges = self._counts(session)
+            relationships = dict(
+                session.query(GraphEdge.relationship, func.count(GraphEdge.id))
+                .filter(GraphEdge.namespace == self._namespace_key)
+                .group_by(GraphEdge.relationship)
+                .all()
+            )
+            if links:
+                relationships["contains"] = relationships.get("contains", 0) + links
+            return {
+                "nodes": entity_nodes + memory_nodes,
+                "edges": links + edges,
+                "entity_nodes": entity_nodes,
+                "memory_nodes": memory_nodes,
+                "relationships": relationships,
+            }
+        finally:
+            session.close()
+
+
+def _chunks(items: Sequence[Any], size: int = _CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    """Split a sequence into chunks for IN (...) clauses."""
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,176 @@
+"""
+Graph Statistics
+
+Counters kept up to date as nodes and edges are inserted and deleted, so
+that graph statistics are read in constant time instead of by scanning the
+graph: nodes per kind, edges per relationship type, a degree histogram and
+the bytes of memory content held by the graph.
+"""
+
+from array import array
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+def _bucket(degree: int) -> int:
+    """Histogram bucket of a degree: 0, 1, 2-3, 4-7, ..."""
+    return degree.bit_length()
+
+
+def _bucket_label(bucket: int) -> str:
+    if bucket <= 1:
+        return str(bucket)
+    return f"{1 << (bucket - 1)}-{(1 << bucket) - 1}"
+
+
+class GraphCounters:
+    """
+    Incrementally maintained node, edge and degree counters.
+
+    Degrees (in + out) are tracked per node so that each edge moves its
+    endpoints between power-of-two histogram buckets. With ``dense=True``
+    nodes must be consecutive integer ids and degrees are kept in a compact
+    array instead of a dict.
+    """
+
+    def __init__(self, dense: bool = False):
+        """
+        Initialize counters.
+
+        Args:
+            dense: Nodes are integer ids 0..n-1 (degrees kept in an array)
+        """
+        self.dense = dense
+        self.nodes: Dict[str, int] = {}  # kind -> count
+        self.relationships: Dict[str, int] = {}  # relationship -> edge count
+        self.edges = 0
+        self.content_bytes = 0
+        self._histogram: List[int] = [0]
+        self._degrees: Any = array("i") if dense else {}
+
+    @classmethod
+    def from_arrays(
+        cls,
+        kinds: Dict[str, np.ndarray],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        labels: np.ndarray,
+        label_names: List[str],
+        content_bytes: int = 0,
+    ) -> "GraphCounters":
+        """
+        Build dense counters from edge arrays in one vectorized pass.
+
+        Args:
+            kinds: Node kind -> boolean mask over node ids (all of equal length)
+            sources: Source id of each edge
+            targets: Target id of each edge
+            labels: Label code of each edge
+            label_names: Relationship name of each label code
+            content_bytes: Bytes of memory content in the graph
+
+        Returns:
+            GraphCounters with dense degrees
+        """
+        counters = cls(dense=True)
+        nodes = len(next(iter(kinds.values()))) if kinds else 0
+        counters.nodes = {kind: int(mask.sum()) for kind, mask in kinds.items() if mask.any()}
+        counters.edges = len(sources)
+        counters.content_bytes = content_bytes
+
+        by_label = np.bincount(np.asarray(labels, dtype=np.int64), minlength=len(label_names))
+        counters.relationships = {
+            label_names[code]: int(count) for code, count in enumerate(by_label.tolist()) if count
+        }
+
+        degrees = np.bincount(np.asarray(sources, dtype=np.int64), minlength=nodes) + np.bincount(
+            np.asarray(targets, dtype=np.int64), minlength=nodes
+        )
+        counters._degrees = array("i", degrees.astype(np.int32).tobytes())
+        buckets = np.zeros(nodes, dtype=np.int64)
+        positive = degrees > 0
+        buckets[positive] = np.floor(np.log2(degrees[positive])).astype(np.int64) + 1
+        counters._histogram = np.bincount(buckets, minlength=1).tolist()
+        return counters
+
+    def add_node(self, node: Hashable, kind: str, content_bytes: int = 0):
+        """Count a new node (with degree 0)."""
+        self.nodes[kind] = self.nodes.get(kind, 0) + 1
+        self.content_bytes += content_bytes
+        if self.dense:
+            while len(self._degrees) <= node:
+                self._degrees.append(0)
+        else:
+            self._degrees[node] = 0
+        self._histogram[0] += 1
+
+    def remove_node(self, node: Hashable, kind: str, content_bytes: int = 0):
+        """Uncount a node; its edges must have been removed first."""
+        self.nodes[kind] = self.nodes.get(kind, 0) - 1
+        self.content_bytes -= content_bytes
+        if self.dense:
+            degree = self._degrees[node]
+            self._degrees[node] = 0
+        else:
+            degree = self._degrees.pop(node, 0)
+        self._histogram[_bucket(degree)] -= 1
+
+    def add_edge(self, source: Hashable, target: Hashable, relationship: str):
+        """Count a new edge."""
+        self.edges += 1
+        self.relationships[relationship] = self.relationships.get(relationship, 0) + 1
+        self._shift(source, 1)
+        self._shift(target, 1)
+
+    def remove_edge(self, source: Hashable, target: Hashable, relationship: str):
+        """Uncount an edge."""
+        self.edges -= 1
+        remaining = self.relationships.get(relationship, 0) - 1
+        if remaining > 0:
+            self.relationships[relationship] = remaining
+        else:
+            self.relationships.pop(relationship, None)
+        self._shift(source, -1)
+        self._shift(target, -1)
+
+    def _shift(self, node: Hashable, delta: int):
+        """Change a node's degree and move it between histogram buckets."""
+        degree = self._degrees[node]
+        self._degrees[node] = degree + delta
+        old, new = _bucket(degree), _bucket(degree + delta)
+        if old != new:
+            self._histogram[old] -= 1
+            if new >= len(self._histogram):
+                self._histogram.append(0)
+            self._histogram[new] += 1
+
+    def degree(self, node: Hashable) -> Optional[int]:
+        """Degree (in + out) of a node, or None if it is not counted."""
+        if self.dense:
+            return self._degrees[node] if 0 <= node < len(self._degrees) else None
+        return self._degrees.get(node)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of the dense degree array (0 for dict-backed counters)."""
+        return self._degrees.itemsize * len(self._degrees) if self.dense else 0
+
+    def degree_histogram(self) -> Dict[str, int]:
+        """Number of nodes per degree range ("0", "1", "2-3", "4-7", ...)."""
+        return {
+            _bucket_label(bucket): count
+            for bucket, count in enumerate(self._histogram)
+            if count
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters as graph statistics."""
+        return {
+            "nodes": sum(self.nodes.values()),
+            "edges": self.edges,
+            "entity_nodes": self.nodes.get("entity", 0),
+            "memory_nodes": self.nodes.get("memory", 0),
+            "relationships": dict(self.relationships),
+            "degree_histogram": self.degree_histogram(),
+        }
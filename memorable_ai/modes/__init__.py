@@ -1,7 +1,18 @@
 """Memory mode implementations."""
 
-from memorable_ai.modes.conscious import ConsciousMode
-from memorable_ai.modes.auto import AutoMode
-from memorable_ai.modes.hybrid import HybridMode
+from memorable_ai.utils.lazy import lazy_module
 
-__all__ = ["ConsciousMode", "AutoMode", "HybridMode"]
+# Modes are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "ConsciousMode": "memorable_ai.modes.conscious",
+    "AutoMode": "memorable_ai.modes.auto",
+    "HybridMode": "memorable_ai.modes.hybrid",
+    "AdaptiveMode": "memorable_ai.modes.adaptive",
+    "SessionCache": "memorable_ai.modes.session_cache",
+    "ContextLayout": "memorable_ai.modes.layout",
+    "ContextCompressor": "memorable_ai.modes.compression",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
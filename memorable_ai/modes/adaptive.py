@@ -0,0 +1,238 @@
+"""
+Adaptive Mode
+
+Per-query retrieval gated by topic drift - re-retrieves only when the
+conversation has moved away from the topic of the previous retrieval or
+new memories were written.
+
+Builds on auto mode: follow-ups such as "ok, and then?" reuse the previously
+ranked memories instead of running a full hybrid retrieval.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from memorable_ai.modes.auto import AutoMode
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveMode:
+    """
+    Adaptive mode: Drift-gated per-query retrieval.
+
+    Keeps a rolling query embedding per session. Retrieval is re-run only
+    when the cosine drift between the rolling embedding and the embedding at
+    the last retrieval exceeds a threshold, or when the storage namespace
+    has been written to since (by any process: the write version is read
+    from the database). A session's own conversation stores are absorbed
+    (see ``absorb_write``).
+    """
+
+    def __init__(
+        self,
+        retriever: Any,
+        drift_threshold: float = 0.15,
+        momentum: float = 0.5,
+        max_sessions: int = 1024,
+        limit: int = 10,
+        compressor: Optional[Any] = None,
+    ):
+        """
+        Initialize adaptive mode.
+
+        Args:
+            retriever: HybridRetriever instance
+            drift_threshold: Cosine distance that triggers a new retrieval
+            momentum: Weight of the previous rolling embedding (0 = last query only)
+            max_sessions: Maximum number of sessions tracked (LRU)
+            limit: Maximum memories per retrieval
+            compressor: Optional ContextCompressor merging near-duplicate memories
+        """
+        self.retriever = retriever
+        self.compressor = compressor
+        self.auto = AutoMode(retriever)
+        self.drift_threshold = drift_threshold
+        self.momentum = min(max(momentum, 0.0), 1.0)
+        self.max_sessions = max(1, max_sessions)
+        self.limit = limit
+
+        # session_id -> {"rolling", "anchor", "query", "version", "memories"}
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.retrievals = 0
+        self.skips = 0
+        self.drift_retrievals = 0
+        self.write_retrievals = 0
+
+    async def get_context(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Get context for current query.
+
+        Args:
+            session_id: Session identifier
+            messages: Current conversation messages
+
+        Returns:
+            Formatted context string
+        """
+        memories = await self.get_memories(session_id, messages)
+        if self.compressor is not None:
+            memories = await self.compressor.compress(memories)
+        return self.auto._format_memories(memories)
+
+    async def get_memories(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get ranked memories for current query, reusing the previous set
+        when the topic has not drifted.
+
+        Args:
+            session_id: Session identifier
+            messages: Current conversation messages
+
+        Returns:
+            List of relevant memories
+        """
+        query = self.retriever._extract_query(messages)
+        query_embedding = self._embed(query)
+        version = self._write_version()
+
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is not None:
+                self._sessions.move_to_end(session_id)
+                rolling = self._roll(state["rolling"], query_embedding)
+                state["rolling"] = rolling
+                reason = self._retrieval_reason(state, query, rolling, version)
+                if reason is None:
+                    self.skips += 1
+                    return state["memories"]
+                if reason == "drift":
+                    self.drift_retrievals += 1
+                elif reason == "write":
+                    self.write_retrievals += 1
+            else:
+                rolling = query_embedding
+
+        memories = await self.retriever.retrieve(
+            messages,
+            limit=self.limit,
+            query_embedding=query_embedding.tolist() if query_embedding is not None else None,
+        )
+
+        with self._lock:
+            self.retrievals += 1
+            self._sessions[session_id] = {
+                "rolling": rolling,
+                "anchor": rolling,
+                "query": query,
+                "version": version,
+                "memories": memories,
+            }
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+        return memories
+
+    def absorb_write(self, session_id: str, before: int, after: int):
+        """
+        Treat a session's own conversation store as already seen.
+
+        Memories extracted from a conversation repeat what is already in its
+        messages, so storing them should not force a retrieval on the next
+        turn. The session keeps its ranked set only if it was current before
+        the store (writes by others observed earlier still count); a write
+        by another process during the store is absorbed as well.
+
+        Args:
+            session_id: Session whose conversation was stored
+            before: Write version read before the store
+            after: Write version read after the store
+        """
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is not None and state["version"] == before:
+                state["version"] = after
+
+    def clear_session(self, session_id: str):
+        """Forget the rolling embedding and ranked set for a session."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get retrieval gating statistics."""
+        with self._lock:
+            turns = self.retrievals + self.skips
+            return {
+                "sessions": len(self._sessions),
+                "retrievals": self.retrievals,
+                "skips": self.skips,
+                "skip_rate": self.skips / turns if turns else 0.0,
+                "drift_retrievals": self.drift_retrievals,
+                "write_retrievals": self.write_retrievals,
+                "drift_threshold": self.drift_threshold,
+            }
+
+    def _retrieval_reason(
+        self,
+        state: Dict[str, Any],
+        query: str,
+        rolling: Optional[np.ndarray],
+        version: int,
+    ) -> Optional[str]:
+        """Return why retrieval must be re-run, or None to reuse the last result."""
+        if version != state["version"]:
+            return "write"
+        if rolling is None or state["anchor"] is None:
+            # No embeddings available: only reuse for an identical query
+            return None if query == state["query"] else "drift"
+        if self._cosine_distance(rolling, state["anchor"]) > self.drift_threshold:
+            return "drift"
+        return None
+
+    def _roll(
+        self, rolling: Optional[np.ndarray], query_embedding: Optional[np.ndarray]
+    ) -> Optional[np.ndarray]:
+        """Blend the current query into the rolling session embedding."""
+        if rolling is None or query_embedding is None:
+            return query_embedding
+        return self.momentum * rolling + (1.0 - self.momentum) * query_embedding
+
+    def _embed(self, query: str) -> Optional[np.ndarray]:
+        """Embed and L2-normalize the query, if an embedding model is available."""
+        model = getattr(self.retriever, "embedding_model", None)
+        if not query or not model:
+            return None
+        try:
+            vector = np.asarray(model.encode(query), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            return vector / norm if norm else vector
+        except Exception as e:
+            logger.debug(f"Failed to embed query for drift check: {e}")
+            return None
+
+    def _write_version(self) -> int:
+        """Current write version of the retriever's storage namespace (shared by all processes)."""
+        storage = getattr(self.retriever, "storage", None)
+        if storage is None:
+            return 0
+        return storage.get_write_version()
+
+    @staticmethod
+    def _cosine_distance(vec1: np.ndarray, vec2: np.ndarray) -> float:
+        """Cosine distance between two vectors."""
+        norm1 = np.linalg.norm(vec1)
+        norm2 = np.linalg.norm(vec2)
+        if norm1 == 0 or norm2 == 0:
+            return 1.0
+        return float(1.0 - np.dot(vec1, vec2) / (norm1 * norm2))
@@ -9,7 +9,7 @@ Reference: https://github.com/GibsonAI/Memori
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +21,16 @@ class AutoMode:
     Retrieves relevant memories for each query dynamically.
     """
 
-    def __init__(self, retriever: Any):
+    def __init__(self, retriever: Any, compressor: Optional[Any] = None):
         """
         Initialize auto mode.
         
         Args:
             retriever: HybridRetriever instance
+            compressor: Optional ContextCompressor merging near-duplicate memories
         """
         self.retriever = retriever
+        self.compressor = compressor
 
     async def get_context(self, messages: List[Dict[str, Any]]) -> str:
         """
@@ -42,11 +44,25 @@ class AutoMode:
         Returns:
             Formatted context string
         """
-        # Retrieve memories for current query
-        memories = await self.retriever.retrieve(messages, limit=10)
+        memories = await self.get_memories(messages)
+        if self.compressor is not None:
+            memories = await self.compressor.compress(memories)
 
         return self._format_memories(memories)
 
+    async def get_memories(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Get ranked memories for current query.
+        
+        Args:
+            messages: Current conversation messages
+            
+        Returns:
+            List of relevant memories
+        """
+        # Retrieve memories for current query
+        return await self.retriever.retrieve(messages, limit=10)
+
     def _format_memories(self, memories: List[Dict[str, Any]]) -> str:
         """Format memories for context injection."""
         if not memories:
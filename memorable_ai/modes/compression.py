@@ -0,0 +1,230 @@
+"""
+Context Compression
+
+Merges near-duplicate or overlapping memories before they are injected, so
+that many matching memories cost fewer context tokens.
+
+Memories are clustered by embedding similarity (falling back to word
+overlap when no embeddings are available) and each cluster is merged into a
+single line. Memories of opposite polarity ("is vegetarian" / "is not
+vegetarian") are never merged. Merging is extractive by default; an optional summarizer hook
+(e.g. an LLM call) can produce the merged line instead. Merged lines are
+cached keyed by the set of member memory IDs.
+"""
+
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+import numpy as np
+
+from memorable_ai.core.consolidation import is_negated
+from memorable_ai.utils.helpers import calculate_similarity
+
+logger = logging.getLogger(__name__)
+
+
+class ContextCompressor:
+    """
+    Cluster-and-merge compression of retrieved memories.
+
+    Clustering is greedy in rank order: each memory joins the first cluster
+    whose leader (highest-ranked member) it is similar enough to, so the
+    output keeps the retrieval ranking.
+    """
+
+    def __init__(
+        self,
+        embedding_model: Optional[Any] = None,
+        threshold: float = 0.85,
+        lexical_threshold: float = 0.6,
+        summarizer: Optional[Callable[[List[str]], Any]] = None,
+        cache_size: int = 1024,
+    ):
+        """
+        Initialize context compressor.
+
+        Args:
+            embedding_model: Model used to embed memories without stored embeddings
+            threshold: Cosine similarity at which memories are merged
+            lexical_threshold: Word-overlap (Jaccard) similarity used without embeddings
+            summarizer: Optional callable (sync or async) turning a cluster's
+                contents into one line; extractive merging is used otherwise
+            cache_size: Maximum number of merged lines cached
+        """
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.lexical_threshold = lexical_threshold
+        self.summarizer = summarizer
+        self.cache_size = max(1, cache_size)
+
+        # frozenset of member keys -> merged content
+        self._cache: "OrderedDict[FrozenSet[Any], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.compressions = 0
+        self.merged_memories = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    async def compress(self, memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge near-duplicate memories.
+
+        Args:
+            memories: Ranked memories
+
+        Returns:
+            Ranked memories where each cluster is replaced by one merged memory
+            (with ``merged_ids`` listing the member IDs)
+        """
+        if len(memories) < 2:
+            return memories
+
+        clusters = self._cluster(memories)
+        compressed = []
+        for cluster in clusters:
+            members = [memories[i] for i in cluster]
+            if len(members) == 1:
+                compressed.append(members[0])
+                continue
+
+            content = await self._merged_content(members)
+            merged = {k: v for k, v in members[0].items() if k != "embedding"}
+            merged["content"] = content
+            merged["merged_ids"] = [m.get("id") for m in members]
+            compressed.append(merged)
+
+        with self._lock:
+            self.compressions += 1
+            self.merged_memories += len(memories) - len(compressed)
+        return compressed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get compression statistics."""
+        with self._lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                "compressions": self.compressions,
+                "merged_memories": self.merged_memories,
+                "cached": len(self._cache),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "cache_hit_rate": self.cache_hits / lookups if lookups else 0.0,
+                "threshold": self.threshold,
+            }
+
+    def _cluster(self, memories: List[Dict[str, Any]]) -> List[List[int]]:
+        """Group memory indexes into clusters of the same polarity, in rank order."""
+        similarity = self._similarity_matrix(memories)
+        negated = [is_negated(m.get("content", "")) for m in memories]
+
+        clusters: List[List[int]] = []
+        for index in range(len(memories)):
+            for cluster in clusters:
+                if negated[cluster[0]] == negated[index] and similarity(cluster[0], index):
+                    cluster.append(index)
+                    break
+            else:
+                clusters.append([index])
+        return clusters
+
+    def _similarity_matrix(
+        self, memories: List[Dict[str, Any]]
+    ) -> Callable[[int, int], bool]:
+        """Pairwise 'similar enough to merge' predicate."""
+        vectors = self._embeddings(memories)
+        if vectors is not None:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            normalized = vectors / norms
+            matrix = normalized @ normalized.T
+            return lambda i, j: bool(matrix[i, j] >= self.threshold)
+
+        contents = [m.get("content", "") for m in memories]
+        return lambda i, j: calculate_similarity(contents[i], contents[j]) >= self.lexical_threshold
+
+    def _embeddings(self, memories: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Embedding matrix for memories, encoding missing ones in one batch."""
+        vectors: List[Optional[Any]] = [m.get("embedding") for m in memories]
+        missing = [i for i, vector in enumerate(vectors) if vector is None or len(vector) == 0]
+
+        if missing:
+            if not self.embedding_model:
+                return None
+            try:
+                encoded = self.embedding_model.encode(
+                    [memories[i].get("content", "") for i in missing]
+                )
+            except Exception as e:
+                logger.debug(f"Failed to embed memories for compression: {e}")
+                return None
+            for i, vector in zip(missing, encoded):
+                vectors[i] = vector
+
+        try:
+            return np.asarray(vectors, dtype=np.float32)
+        except ValueError:
+            # Mixed embedding dimensions (model changed)
+            return None
+
+    async def _merged_content(self, members: List[Dict[str, Any]]) -> str:
+        """Merged line for a cluster, from cache when possible."""
+        key = frozenset(self._member_key(m) for m in members)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+
+        contents = [m.get("content", "").strip() for m in members]
+        content = None
+        if self.summarizer is not None:
+            try:
+                content = self.summarizer(contents)
+                if inspect.isawaitable(content):
+                    content = await content
+            except Exception as e:
+                logger.warning(f"Context summarizer failed, merging extractively: {e}")
+                content = None
+        if not content:
+            content = self._extractive_merge(contents)
+
+        with self._lock:
+            self._cache[key] = content
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return content
+
+    @staticmethod
+    def _extractive_merge(contents: List[str]) -> str:
+        """
+        Merge contents into one line.
+
+        Keeps the highest-ranked content, then adds other members only if
+        they contribute words not already covered (or a negation).
+        """
+        kept: List[str] = []
+        covered: set = set()
+        for content in contents:
+            words = content.lower().split()
+            if not words:
+                continue
+            new_words = [word for word in words if word not in covered]
+            if kept and len(set(new_words)) < 2 and not is_negated(" ".join(new_words)):
+                continue
+            kept.append(content.rstrip(". "))
+            covered.update(words)
+        return "; ".join(kept)
+
+    @staticmethod
+    def _member_key(memory: Dict[str, Any]) -> Any:
+        """Cache identity of a member memory."""
+        memory_id = memory.get("id")
+        if memory_id is not None:
+            return memory_id
+        return memory.get("content", "").strip().lower()
@@ -10,7 +10,9 @@ Reference: https://github.com/GibsonAI/Memori
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from memorable_ai.modes.session_cache import SessionCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +25,23 @@ class ConsciousMode:
     and injects them as context.
     """
 
-    def __init__(self, retriever: Any):
+    def __init__(
+        self,
+        retriever: Any,
+        session_cache: Optional[SessionCache] = None,
+        compressor: Optional[Any] = None,
+    ):
         """
         Initialize conscious mode.
         
         Args:
             retriever: HybridRetriever instance
+            session_cache: Optional bounded session cache (default: LRU/TTL cache)
+            compressor: Optional ContextCompressor merging near-duplicate memories
         """
         self.retriever = retriever
-        self._injected_memories: Dict[str, List[Dict[str, Any]]] = {}
+        self.compressor = compressor
+        self.sessions = session_cache if session_cache is not None else SessionCache()
 
     async def get_context(
         self, session_id: str, messages: List[Dict[str, Any]]
@@ -48,15 +58,32 @@ class ConsciousMode:
         Returns:
             Formatted context string
         """
+        memories = await self.get_memories(session_id, messages)
+        if self.compressor is not None:
+            memories = await self.compressor.compress(memories)
+
+        return self._format_memories(memories)
+
+    async def get_memories(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get session-level memories, retrieving them once per session.
+        
+        Args:
+            session_id: Unique session identifier
+            messages: Conversation messages
+            
+        Returns:
+            List of session memories
+        """
         # Check if already injected for this session
-        if session_id in self._injected_memories:
-            memories = self._injected_memories[session_id]
-        else:
+        memories = self.sessions.get(session_id)
+        if memories is None:
             # Retrieve memories once
             memories = await self.retriever.retrieve(messages, limit=10)
-            self._injected_memories[session_id] = memories
-
-        return self._format_memories(memories)
+            self.sessions.set(session_id, memories)
+        return memories
 
     def _format_memories(self, memories: List[Dict[str, Any]]) -> str:
         """Format memories for context injection."""
@@ -73,6 +100,5 @@ class ConsciousMode:
 
     def clear_session(self, session_id: str):
         """Clear cached memories for a session."""
-        if session_id in self._injected_memories:
-            del self._injected_memories[session_id]
+        self.sessions.discard(session_id)
 
@@ -8,11 +8,13 @@ Inspired by Memori's combined mode.
 Reference: https://github.com/GibsonAI/Memori
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from memorable_ai.modes.conscious import ConsciousMode
 from memorable_ai.modes.auto import AutoMode
+from memorable_ai.modes.session_cache import SessionCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +25,45 @@ class HybridMode:
     
     Uses conscious mode for session-level context and
     auto mode for query-specific context.
+    
+    Both blocks are served from a single retrieval: on a cold session one
+    larger top-k result set is split into the session block and the query
+    block, and on later turns the query block is only refreshed when the
+    query changes. Memories already in the session block are never repeated
+    in the query block.
     """
 
-    def __init__(self, retriever: Any):
+    def __init__(
+        self,
+        retriever: Any,
+        session_cache: Optional[SessionCache] = None,
+        session_limit: int = 10,
+        query_limit: int = 10,
+        compressor: Optional[Any] = None,
+    ):
         """
         Initialize hybrid mode.
         
         Args:
             retriever: HybridRetriever instance
+            session_cache: Optional bounded session cache (default: LRU/TTL cache)
+            session_limit: Maximum memories in the session-level block
+            query_limit: Maximum memories in the query-specific block
+            compressor: Optional ContextCompressor merging near-duplicate memories
         """
-        self.conscious = ConsciousMode(retriever)
+        self.retriever = retriever
+        self.compressor = compressor
+        self.conscious = ConsciousMode(retriever, session_cache=session_cache)
         self.auto = AutoMode(retriever)
+        self.sessions = self.conscious.sessions
+        self.session_limit = session_limit
+        self.query_limit = query_limit
+        # Query blocks keyed by (session, query), bounded like the session cache
+        self._query_blocks = SessionCache(
+            max_entries=self.sessions.max_entries,
+            ttl=self.sessions.ttl,
+            max_bytes=self.sessions.max_bytes,
+        )
 
     async def get_context(
         self, session_id: str, messages: List[Dict[str, Any]]
@@ -48,11 +78,16 @@ class HybridMode:
         Returns:
             Combined formatted context
         """
+        session_memories, query_memories = await self.get_blocks(session_id, messages)
+        if self.compressor is not None:
+            session_memories = await self.compressor.compress(session_memories)
+            query_memories = await self.compressor.compress(query_memories)
+
         # Get conscious (session-level) context
-        conscious_context = await self.conscious.get_context(session_id, messages)
+        conscious_context = self.conscious._format_memories(session_memories)
         
         # Get auto (query-specific) context
-        auto_context = await self.auto.get_context(messages)
+        auto_context = self.auto._format_memories(query_memories)
         
         # Combine
         if conscious_context and auto_context:
@@ -64,7 +99,75 @@ class HybridMode:
         else:
             return ""
 
+    async def get_blocks(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get the session-level and query-specific memory blocks.
+        
+        Args:
+            session_id: Session identifier
+            messages: Current conversation messages
+            
+        Returns:
+            (session memories, query memories), without overlap
+        """
+        query = self.retriever._extract_query(messages)
+        query_key = self._query_key(session_id, query)
+
+        session_memories = self.sessions.get(session_id)
+        if session_memories is None:
+            # Cold session: one retrieval feeds both blocks
+            results = await self.retriever.retrieve(
+                messages, limit=self.session_limit + self.query_limit
+            )
+            session_memories = results[: self.session_limit]
+            query_memories = self._exclude(
+                results[self.session_limit:], session_memories
+            )[: self.query_limit]
+            self.sessions.set(session_id, session_memories)
+            self._query_blocks.set(query_key, query_memories)
+        else:
+            query_memories = self._query_blocks.get(query_key)
+            if query_memories is None:
+                # Over-fetch so the block stays full after removing session memories
+                results = await self.retriever.retrieve(
+                    messages, limit=self.query_limit + len(session_memories)
+                )
+                query_memories = self._exclude(results, session_memories)[: self.query_limit]
+                self._query_blocks.set(query_key, query_memories)
+
+        return session_memories, query_memories
+
     def clear_session(self, session_id: str):
         """Clear cached memories for a session."""
         self.conscious.clear_session(session_id)
+        self._query_blocks.discard_prefix(f"{session_id}:")
+
+    @staticmethod
+    def _query_key(session_id: str, query: str) -> str:
+        """Build the query block cache key for a session and query."""
+        digest = hashlib.md5(query.strip().lower().encode()).hexdigest()[:16]
+        return f"{session_id}:{digest}"
+
+    @staticmethod
+    def _memory_key(memory: Dict[str, Any]) -> Any:
+        """Identity used to deduplicate memories across blocks."""
+        memory_id = memory.get("id")
+        if memory_id is not None:
+            return memory_id
+        return memory.get("content", "").strip().lower()
 
+    def _exclude(
+        self, memories: List[Dict[str, Any]], existing: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Drop memories already present in another block (and repeats)."""
+        seen = {self._memory_key(m) for m in existing}
+        unique = []
+        for memory in memories:
+            key = self._memory_key(memory)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(memory)
+        return unique
@@ -0,0 +1,193 @@
+"""
+Context Layout
+
+Prefix-stable placement of injected memories, so that provider prompt
+caching (OpenAI automatic prefix caching, Anthropic ``cache_control``)
+keeps working across turns.
+
+Session-level memories are rendered in a deterministic, sorted block placed
+right after the caller's own leading system messages. Per-query memories
+change every turn and go late in the prompt, right before the latest user
+message, so the conversation history in between stays cacheable.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used for token estimates
+CHARS_PER_TOKEN = 4
+
+
+class ContextLayout:
+    """
+    Prefix-stable context layout.
+
+    Tracks, per session, whether the stable block is identical to the one
+    injected on the previous turn; those tokens are reported as
+    prefix-stable (eligible for provider prompt caching).
+    """
+
+    STABLE_HEADER = "Relevant memories from previous conversations:"
+    VOLATILE_HEADER = "Relevant memories for the current message:"
+
+    def __init__(self, max_sessions: int = 1024):
+        """
+        Initialize context layout.
+
+        Args:
+            max_sessions: Maximum number of sessions tracked for prefix statistics (LRU)
+        """
+        self.max_sessions = max(1, max_sessions)
+        # session_id -> digest of the last stable block
+        self._stable_digests: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.injections = 0
+        self.stable_tokens = 0
+        self.volatile_tokens = 0
+        self.prefix_stable_tokens = 0
+        self.last: Dict[str, Any] = {}
+
+    def apply(
+        self,
+        messages: List[Dict[str, Any]],
+        stable: List[Dict[str, Any]],
+        volatile: List[Dict[str, Any]],
+        session_id: str = "default",
+        provider: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Inject memory blocks into messages.
+
+        Args:
+            messages: Original conversation messages
+            stable: Session-level memories (rendered sorted, at a fixed position)
+            volatile: Per-query memories (rendered in rank order, late in the prompt)
+            session_id: Session identifier, used for prefix-stability statistics
+            provider: 'anthropic' to mark the stable block with a cache breakpoint
+
+        Returns:
+            Messages with memory context
+        """
+        stable_text = self.format_stable(stable)
+        volatile_text = self.format_volatile(volatile)
+        self._record(session_id, stable_text, volatile_text)
+
+        if not stable_text and not volatile_text:
+            return messages
+
+        # Caller's leading system messages are the most stable part of the prompt
+        head = 0
+        while head < len(messages) and self._role(messages[head]) == "system":
+            head += 1
+
+        enhanced = list(messages[:head])
+        if stable_text:
+            enhanced.append(self._stable_message(stable_text, provider))
+
+        rest = list(messages[head:])
+        if volatile_text:
+            position = self._last_user_index(rest)
+            rest.insert(position, {"role": "system", "content": volatile_text})
+        return enhanced + rest
+
+    def format_stable(self, memories: List[Dict[str, Any]]) -> str:
+        """Render session-level memories in a deterministic order."""
+        if not memories:
+            return ""
+
+        lines = sorted(
+            {f"- [{m.get('type', 'fact')}] {m.get('content', '').strip()}" for m in memories}
+        )
+        return "\n".join([self.STABLE_HEADER] + lines)
+
+    def format_volatile(self, memories: List[Dict[str, Any]]) -> str:
+        """Render per-query memories in rank order."""
+        if not memories:
+            return ""
+
+        lines = [f"- [{m.get('type', 'fact')}] {m.get('content', '').strip()}" for m in memories]
+        return "\n".join([self.VOLATILE_HEADER] + lines)
+
+    def clear_session(self, session_id: str):
+        """Forget prefix statistics for a session."""
+        with self._lock:
+            self._stable_digests.pop(session_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get layout statistics (token counts are estimates)."""
+        with self._lock:
+            injected = self.stable_tokens + self.volatile_tokens
+            return {
+                "injections": self.injections,
+                "stable_tokens": self.stable_tokens,
+                "volatile_tokens": self.volatile_tokens,
+                "prefix_stable_tokens": self.prefix_stable_tokens,
+                "prefix_stable_rate": self.prefix_stable_tokens / injected if injected else 0.0,
+                "last": dict(self.last),
+            }
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Estimate the number of tokens in a text."""
+        if not text:
+            return 0
+        return max(1, len(text) // CHARS_PER_TOKEN)
+
+    def _record(self, session_id: str, stable_text: str, volatile_text: str):
+        """Update token counters for one injection."""
+        stable_tokens = self.estimate_tokens(stable_text)
+        volatile_tokens = self.estimate_tokens(volatile_text)
+        digest = hashlib.md5(stable_text.encode()).hexdigest() if stable_text else ""
+
+        with self._lock:
+            previous = self._stable_digests.get(session_id)
+            prefix_stable = stable_tokens if digest and digest == previous else 0
+
+            self._stable_digests[session_id] = digest
+            self._stable_digests.move_to_end(session_id)
+            while len(self._stable_digests) > self.max_sessions:
+                self._stable_digests.popitem(last=False)
+
+            self.injections += 1
+            self.stable_tokens += stable_tokens
+            self.volatile_tokens += volatile_tokens
+            self.prefix_stable_tokens += prefix_stable
+            self.last = {
+                "stable_tokens": stable_tokens,
+                "volatile_tokens": volatile_tokens,
+                "prefix_stable_tokens": prefix_stable,
+            }
+
+        logger.debug(
+            f"Context layout: {stable_tokens} stable tokens "
+            f"({prefix_stable} prefix-stable), {volatile_tokens} volatile tokens"
+        )
+
+    @staticmethod
+    def _stable_message(text: str, provider: Optional[str]) -> Dict[str, Any]:
+        """System message carrying the stable block."""
+        if provider == "anthropic":
+            return {
+                "role": "system",
+                "content": [
+                    {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+                ],
+            }
+        return {"role": "system", "content": text}
+
+    @staticmethod
+    def _role(message: Any) -> Optional[str]:
+        return message.get("role") if isinstance(message, dict) else None
+
+    def _last_user_index(self, messages: List[Dict[str, Any]]) -> int:
+        """Index of the latest user message (or the end if there is none)."""
+        for index in range(len(messages) - 1, -1, -1):
+            if self._role(messages[index]) == "user":
+                return index
+        return len(messages)
@@ -0,0 +1,253 @@
+"""
+Session Cache
+
+Bounded store for per-session memories used by conscious and hybrid modes.
+
+Entries are evicted least-recently-used first once the entry or byte budget
+is exceeded, and expire after a configurable TTL. Evicted entries can
+optionally be spilled to SQL storage and transparently reloaded on the next
+access.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    LRU/TTL cache of session memories.
+
+    Tracks hits, misses, evictions and expirations so that cache
+    effectiveness can be reported through ``MemoryEngine.get_stats``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 3600.0,
+        max_bytes: Optional[int] = None,
+        spill_storage: Optional[Any] = None,
+    ):
+        """
+        Initialize session cache.
+
+        Args:
+            max_entries: Maximum number of sessions kept in memory
+            ttl: Seconds after which a session entry expires (None disables expiry)
+            max_bytes: Approximate memory budget for cached entries (None disables)
+            spill_storage: Optional Storage instance that receives evicted entries
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self.spill_storage = spill_storage
+
+        # session_id -> (memories, expires_at, size_bytes)
+        self._entries: "OrderedDict[str, Tuple[List[Dict[str, Any]], Optional[float], int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.spills = 0
+        self.spill_hits = 0
+
+    def get(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached memories for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Cached memories, or None if the session is not cached
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None:
+                memories, expires_at, size = entry
+                if expires_at is not None and expires_at <= now:
+                    self._remove(session_id)
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(session_id)
+                    self.hits += 1
+                    return memories
+
+        # Fall back to spilled entries
+        if self.spill_storage is not None:
+            memories = self._load_spilled(session_id)
+            if memories is not None:
+                with self._lock:
+                    self.hits += 1
+                    self.spill_hits += 1
+                self.set(session_id, memories)
+                return memories
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, session_id: str, memories: List[Dict[str, Any]]):
+        """
+        Cache memories for a session.
+
+        Args:
+            session_id: Session identifier
+            memories: Retrieved memories for the session
+        """
+        memories = [self._compact(m) for m in memories]
+        size = self._estimate_size(memories)
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+
+        with self._lock:
+            if session_id in self._entries:
+                self._remove(session_id)
+            self._entries[session_id] = (memories, expires_at, size)
+            self._bytes += size
+            evicted = self._evict()
+
+        for evicted_id, evicted_memories, evicted_expires_at in evicted:
+            self._spill(evicted_id, evicted_memories, evicted_expires_at)
+
+    def discard(self, session_id: str):
+        """
+        Remove a session from the cache (and from spilled storage).
+
+        Args:
+            session_id: Session identifier
+        """
+        with self._lock:
+            if session_id in self._entries:
+                self._remove(session_id)
+
+        if self.spill_storage is not None:
+            try:
+                self.spill_storage.delete_session_cache(session_id)
+            except Exception as e:
+                logger.debug(f"Failed to delete spilled session {session_id}: {e}")
+
+    def discard_prefix(self, prefix: str):
+        """
+        Remove all in-memory entries whose key starts with a prefix.
+
+        Args:
+            prefix: Key prefix (e.g. ``"<session_id>:"`` for composite keys)
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "spills": self.spills,
+                "spill_hits": self.spill_hits,
+            }
+
+    def _remove(self, session_id: str):
+        """Remove an entry. Caller must hold the lock."""
+        _, _, size = self._entries.pop(session_id)
+        self._bytes -= size
+
+    def _evict(self) -> List[Tuple[str, List[Dict[str, Any]], Optional[float]]]:
+        """
+        Evict least-recently-used entries until within budget.
+
+        Caller must hold the lock. Always keeps the most recent entry.
+
+        Returns:
+            List of (session_id, memories, expires_at) for evicted entries
+        """
+        evicted = []
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            session_id, (memories, expires_at, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            evicted.append((session_id, memories, expires_at))
+        return evicted
+
+    def _spill(
+        self,
+        session_id: str,
+        memories: List[Dict[str, Any]],
+        expires_at: Optional[float],
+    ):
+        """Write an evicted entry to spill storage."""
+        if self.spill_storage is None:
+            return
+
+        ttl = None
+        if expires_at is not None:
+            ttl = expires_at - time.monotonic()
+            if ttl <= 0:
+                return
+
+        try:
+            self.spill_storage.save_session_cache(session_id, memories, ttl=ttl)
+            with self._lock:
+                self.spills += 1
+        except Exception as e:
+            logger.debug(f"Failed to spill session {session_id}: {e}")
+
+    def _load_spilled(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Load (and remove) a spilled entry from storage."""
+        try:
+            return self.spill_storage.load_session_cache(session_id)
+        except Exception as e:
+            logger.debug(f"Failed to load spilled session {session_id}: {e}")
+            return None
+
+    @staticmethod
+    def _compact(memory: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop embeddings, which are not needed for context formatting."""
+        if "embedding" not in memory:
+            return memory
+        return {k: v for k, v in memory.items() if k != "embedding"}
+
+    @staticmethod
+    def _estimate_size(memories: List[Dict[str, Any]]) -> int:
+        """Approximate the in-memory footprint of an entry in bytes."""
+        try:
+            return len(json.dumps(memories, default=str))
+        except Exception:
+            return sum(len(str(m)) for m in memories)
@@ -0,0 +1,7 @@
+"""Local memory service: warm daemon and clients."""
+
+from memorable_ai.service.protocol import default_address
+from memorable_ai.service.client import MemoryClient
+from memorable_ai.service.server import MemoryServer
+
+__all__ = ["MemoryClient", "MemoryServer", "default_address"]
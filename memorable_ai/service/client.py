@@ -0,0 +1,276 @@
+"""
+Memory Client
+
+Blocking client for the memory daemon with a small connection pool and
+request pipelining. Used by the CLI and by sidecar processes.
+"""
+
+import itertools
+import logging
+import queue
+import socket
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from memorable_ai.core.errors import (
+    ServiceError,
+    ServiceResponseLostError,
+    ServiceUnavailableError,
+)
+from memorable_ai.service import protocol
+
+logger = logging.getLogger(__name__)
+
+
+class _Connection:
+    """One socket connection to the daemon."""
+
+    def __init__(self, address: str, timeout: float):
+        kind, target = protocol.parse_address(address)
+        if kind == "unix":
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.settimeout(timeout)
+        self.sock.connect(target)
+        self.rfile = self.sock.makefile("rb")
+
+    def close(self):
+        try:
+            self.rfile.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class MemoryClient:
+    """
+    Client for a running memory daemon.
+
+    Connections are reused across calls (up to ``pool_size`` idle
+    connections), and ``pipeline`` sends several requests before reading
+    any response.
+    """
+
+    def __init__(
+        self,
+        address: Optional[str] = None,
+        pool_size: int = 4,
+        timeout: float = 5.0,
+    ):
+        """
+        Initialize memory client.
+
+        Args:
+            address: Unix socket path or tcp://host:port (default: per-user socket)
+            pool_size: Maximum idle connections kept open
+            timeout: Socket timeout in seconds
+        """
+        self.address = address or protocol.default_address()
+        self.timeout = timeout
+        self.info: Dict[str, Any] = {}
+        self._idle: "queue.LifoQueue[_Connection]" = queue.LifoQueue(maxsize=max(1, pool_size))
+        self._ids = itertools.count(1)
+        self._id_lock = threading.Lock()
+
+    @classmethod
+    def connect(
+        cls, address: Optional[str] = None, timeout: float = 5.0, **kwargs
+    ) -> Optional["MemoryClient"]:
+        """
+        Connect to a daemon if one is running.
+
+        Args:
+            address: Daemon address (default: per-user socket)
+            timeout: Socket timeout in seconds
+            **kwargs: Additional MemoryClient options
+
+        Returns:
+            Connected client, or None if no daemon answers
+        """
+        client = cls(address=address, timeout=timeout, **kwargs)
+        try:
+            client.info = client.ping()
+            return client
+        except (OSError, ServiceError) as e:
+            logger.debug(f"No memory daemon at {client.address}: {e}")
+            client.close()
+            return None
+
+    def call(self, op: str, **args) -> Any:
+        """
+        Send one request and wait for its response.
+
+        Args:
+            op: Operation name
+            **args: Operation arguments
+
+        Returns:
+            Operation result
+        """
+        return self.pipeline([(op, args)])[0]
+
+    def pipeline(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Send several requests on one connection, then collect all responses.
+
+        An idle connection found closed by the daemon (e.g. after a restart)
+        is replaced and the requests are sent again once. Failing to connect
+        raises ServiceUnavailableError (nothing was sent); losing the
+        connection or timing out once the requests were sent raises
+        ServiceResponseLostError, as the daemon may have run them. A request
+        that failed in the daemon raises ServiceError.
+
+        Args:
+            requests: List of (op, args) tuples
+
+        Returns:
+            Results in request order
+        """
+        if not requests:
+            return []
+
+        with self._id_lock:
+            ids = [next(self._ids) for _ in requests]
+        payload = b"".join(
+            protocol.encode({"id": request_id, "op": op, "args": args})
+            for request_id, (op, args) in zip(ids, requests)
+        )
+
+        conn, reused = self._acquire()
+        responses: Dict[int, Dict[str, Any]] = {}
+        try:
+            try:
+                conn.sock.sendall(payload)
+                self._receive(conn, ids, responses)
+            except ConnectionError:
+                if not reused or responses:
+                    raise
+                # Idle connection went stale: the daemon that accepted it is
+                # gone, so the requests never ran; resend them once
+                conn.close()
+                conn = self._open()
+                conn.sock.sendall(payload)
+                self._receive(conn, ids, responses)
+        except ServiceError:
+            conn.close()
+            raise
+        except OSError as e:
+            conn.close()
+            raise ServiceResponseLostError(f"No response from memory daemon: {e}") from e
+        self._release(conn)
+
+        results = []
+        for request_id in ids:
+            response = responses.get(request_id, {})
+            if "error" in response:
+                error = response["error"]
+                raise ServiceError(f"{error.get('type')}: {error.get('message')}")
+            results.append(response.get("result"))
+        return results
+
+    @staticmethod
+    def _receive(conn: _Connection, ids: List[int], responses: Dict[int, Dict[str, Any]]):
+        """Read responses into ``responses`` until every request is answered."""
+        while len(responses) < len(ids):
+            line = conn.rfile.readline(protocol.MAX_MESSAGE_BYTES)
+            if not line:
+                raise ConnectionResetError("Memory daemon closed the connection")
+            try:
+                response = protocol.decode(line)
+            except ValueError as e:
+                raise ServiceResponseLostError(f"Invalid response from memory daemon: {e}") from e
+            responses[response.get("id")] = response
+
+    # Convenience methods
+    def ping(self) -> Dict[str, Any]:
+        """Get daemon information (pid, database, mode, namespace)."""
+        return self.call("ping")
+
+    def add_memory(
+        self,
+        content: str,
+        memory_type: str = "fact",
+        namespace: Optional[str] = None,
+        **metadata,
+    ):
+        """Add a memory through the daemon."""
+        self.call(
+            "add",
+            content=content,
+            memory_type=memory_type,
+            namespace=namespace,
+            metadata=metadata,
+        )
+
+    def search_memories(
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search memories through the daemon."""
+        return self.call(
+            "search", query=query, limit=limit, memory_type=memory_type, namespace=namespace
+        )
+
+    def get_stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """Get engine statistics from the daemon."""
+        return self.call("stats", namespace=namespace)
+
+    def inject_context(
+        self,
+        messages: List[Dict[str, Any]],
+        namespace: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get messages with memory context injected by the daemon."""
+        return self.call("inject", messages=messages, namespace=namespace, provider=provider)
+
+    def store_conversation(
+        self,
+        messages: List[Dict[str, Any]],
+        response: Optional[Any] = None,
+        namespace: Optional[str] = None,
+        wait: bool = False,
+    ):
+        """
+        Extract and store memories from a conversation through the daemon.
+
+        By default the daemon acknowledges immediately and writes the store
+        in its next batch; ``wait=True`` returns only once it is written.
+        """
+        self.call(
+            "store", messages=messages, response=response, namespace=namespace, wait=wait
+        )
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _acquire(self) -> Tuple[_Connection, bool]:
+        """Reuse an idle connection or open a new one (returns it and whether it was reused)."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._open(), False
+
+    def _open(self) -> _Connection:
+        """Open a new connection to the daemon."""
+        try:
+            return _Connection(self.address, self.timeout)
+        except OSError as e:
+            raise ServiceUnavailableError(f"Cannot connect to memory daemon: {e}") from e
+
+    def _release(self, conn: _Connection):
+        """Return a connection to the idle pool (or close it if full)."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
@@ -0,0 +1,53 @@
+"""
+Memory Service Protocol
+
+Newline-delimited JSON over a unix domain socket (or localhost TCP).
+
+Request:  {"id": 1, "op": "search", "args": {"query": "...", "limit": 10}}
+Response: {"id": 1, "result": [...]}
+          {"id": 1, "error": {"type": "StorageError", "message": "..."}}
+
+Requests on one connection may be pipelined; responses carry the request id
+and can arrive out of order.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+# Maximum size of a single request/response line
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+def default_address() -> str:
+    """Default per-user daemon address (unix socket in the temp directory)."""
+    uid = os.getuid() if hasattr(os, "getuid") else os.getenv("USERNAME", "user")
+    return os.path.join(tempfile.gettempdir(), f"memorable-{uid}.sock")
+
+
+def parse_address(address: Optional[str]) -> Tuple[str, Any]:
+    """
+    Parse a daemon address.
+
+    Args:
+        address: Unix socket path or ``tcp://host:port`` (None for default)
+
+    Returns:
+        ("unix", path) or ("tcp", (host, port))
+    """
+    address = address or default_address()
+    if address.startswith("tcp://"):
+        host, _, port = address[len("tcp://"):].rpartition(":")
+        return "tcp", (host or "127.0.0.1", int(port))
+    return "unix", address
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """Encode a protocol message as one JSON line."""
+    return json.dumps(message, default=str, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """Decode one JSON line into a protocol message."""
+    return json.loads(line)
@@ -0,0 +1,332 @@
+"""
+Memory Server
+
+Keeps a memory engine warm in a long-running process and serves add, search,
+stats, inject and store requests to the CLI, sidecar clients and
+MemoryEngine instances running in remote mode.
+
+Stores are acknowledged once queued and written by a background worker that
+coalesces stores from all clients into one transaction per namespace. The
+queue is bounded (a full queue delays acknowledgements), failed writes are
+retried per namespace, and SIGTERM stops the daemon after flushing the queue.
+The queue lives in memory only: stores still queued when the daemon crashes
+or is killed are lost (``wait=True`` stores are acknowledged once written).
+
+Usage:
+    memorable --database sqlite:///memorable.db serve
+"""
+
+import asyncio
+import logging
+import os
+import signal
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from memorable_ai.service import protocol
+from memorable_ai.utils.helpers import normalize_database_url
+
+logger = logging.getLogger(__name__)
+
+# Queued store: (namespace, messages, response)
+_StoreItem = Tuple[Optional[str], List[Dict[str, Any]], Any]
+
+
+class MemoryServer:
+    """
+    Memory daemon.
+
+    Serves a MemoryEngine or MemoryEnginePool. Requests may carry a
+    ``namespace`` argument, which is honoured when serving a pool.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        address: Optional[str] = None,
+        max_concurrency: int = 64,
+        run_consolidator: bool = True,
+        batch_size: int = 32,
+        batch_window: float = 0.01,
+        max_queued_stores: int = 1024,
+        store_retries: int = 3,
+        retry_delay: float = 0.5,
+    ):
+        """
+        Initialize memory server.
+
+        Args:
+            engine: MemoryEngine or MemoryEnginePool to serve
+            address: Unix socket path or tcp://host:port (default: per-user socket)
+            max_concurrency: Maximum requests processed concurrently
+            run_consolidator: Run the engine's consolidator in the daemon
+            batch_size: Maximum stores written in one batch
+            batch_window: Seconds to wait for more stores before writing a batch
+            max_queued_stores: Stores queued before acknowledgements wait for room
+            store_retries: Retries of a namespace's failed write before its stores are dropped
+            retry_delay: Seconds before the first retry (doubled for each retry)
+        """
+        self.engine = engine
+        self.address = address or protocol.default_address()
+        self.run_consolidator = run_consolidator
+        self.max_concurrency = max_concurrency
+        self.batch_size = max(1, batch_size)
+        self.batch_window = max(0.0, batch_window)
+        self.max_queued_stores = max(1, max_queued_stores)
+        self.store_retries = max(0, store_retries)
+        self.retry_delay = max(0.0, retry_delay)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._store_queue: Optional["asyncio.Queue[_StoreItem]"] = None
+        self._store_task: Optional[asyncio.Task] = None
+        self.requests = 0
+        self.errors = 0
+        self.store_batches = 0
+        self.batched_stores = 0
+        self.retried_batches = 0
+        self.dropped_stores = 0
+
+    async def start(self):
+        """Initialize the engine and start listening."""
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._store_queue = asyncio.Queue(maxsize=self.max_queued_stores)
+        # The daemon always runs the engine in-process
+        self.engine.config.service.remote = False
+        self.engine.initialize()
+        self._store_task = asyncio.create_task(self._store_worker())
+        if self.run_consolidator:
+            self.engine._start_consolidator()
+
+        kind, target = protocol.parse_address(self.address)
+        if kind == "unix":
+            if os.path.exists(target):
+                # Remove a stale socket left behind by a crashed daemon
+                os.unlink(target)
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=target, limit=protocol.MAX_MESSAGE_BYTES
+            )
+            os.chmod(target, 0o600)
+        else:
+            host, port = target
+            self._server = await asyncio.start_server(
+                self._handle_connection, host=host, port=port, limit=protocol.MAX_MESSAGE_BYTES
+            )
+        logger.info(f"Memory server listening on {self.address}")
+
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled or sent SIGTERM."""
+        if self._server is None:
+            await self.start()
+
+        loop = asyncio.get_running_loop()
+        terminated = asyncio.Event()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, terminated.set)
+            handles_sigterm = True
+        except (NotImplementedError, RuntimeError, ValueError):
+            # No signal support on this platform or outside the main thread
+            handles_sigterm = False
+
+        serving = asyncio.ensure_future(self._server.serve_forever())
+        waiting = asyncio.ensure_future(terminated.wait())
+        try:
+            await asyncio.wait({serving, waiting}, return_when=asyncio.FIRST_COMPLETED)
+            if terminated.is_set():
+                logger.info("Received SIGTERM, stopping memory server")
+        finally:
+            serving.cancel()
+            waiting.cancel()
+            if handles_sigterm:
+                loop.remove_signal_handler(signal.SIGTERM)
+            await self.stop()
+
+    async def stop(self):
+        """Stop listening, flush queued stores and shut down the consolidator."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._store_task is not None:
+            await self._store_queue.join()
+            self._store_task.cancel()
+            self._store_task = None
+        if self.run_consolidator:
+            self.engine._stop_consolidator()
+        self.engine.save_graph_snapshots()
+
+        kind, target = protocol.parse_address(self.address)
+        if kind == "unix" and os.path.exists(target):
+            os.unlink(target)
+        logger.info("Memory server stopped")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """Serve pipelined requests on one connection."""
+        write_lock = asyncio.Lock()
+        pending = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.create_task(self._handle_request(line, writer, write_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            logger.debug(f"Client connection error: {e}")
+        finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_request(
+        self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock
+    ):
+        """Process one request and write its response."""
+        request_id = None
+        try:
+            request = protocol.decode(line)
+            request_id = request.get("id")
+            async with self._semaphore:
+                result = await self._dispatch(request.get("op", ""), request.get("args") or {})
+            response = {"id": request_id, "result": result}
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Request failed: {e}")
+            response = {"id": request_id, "error": {"type": type(e).__name__, "message": str(e)}}
+
+        self.requests += 1
+        async with write_lock:
+            writer.write(protocol.encode(response))
+            await writer.drain()
+
+    def _target(self, namespace: Optional[str]) -> Any:
+        """Engine serving a namespace (pool view, or the engine itself)."""
+        if hasattr(self.engine, "namespace"):
+            return self.engine.namespace(namespace)
+        return self.engine
+
+    async def _dispatch(self, op: str, args: Dict[str, Any]) -> Any:
+        """Route a request to the engine."""
+        namespace = args.pop("namespace", None)
+
+        if op == "ping":
+            config = self.engine.config
+            return {
+                "pid": os.getpid(),
+                "database": normalize_database_url(config.database.connection_string),
+                "mode": config.memory.mode,
+                "namespace": config.memory.namespace,
+            }
+
+        engine = self._target(namespace)
+
+        if op == "add":
+            metadata = args.get("metadata") or {}
+            await engine.add_memory(
+                args["content"], memory_type=args.get("memory_type", "fact"), **metadata
+            )
+            return True
+        if op == "search":
+            results = await engine.search_memories(
+                args["query"],
+                limit=args.get("limit", 10),
+                memory_type=args.get("memory_type"),
+            )
+            return [self._strip(m) for m in results]
+        if op == "stats":
+            stats = engine.get_stats()
+            stats["server"] = {
+                "requests": self.requests,
+                "errors": self.errors,
+                "queued_stores": self._store_queue.qsize() if self._store_queue else 0,
+                "store_batches": self.store_batches,
+                "batched_stores": self.batched_stores,
+                "retried_batches": self.retried_batches,
+                "dropped_stores": self.dropped_stores,
+            }
+            return stats
+        if op == "inject":
+            return await engine._inject_context(args["messages"], args.get("provider"))
+        if op == "store":
+            if args.get("wait"):
+                await engine._store_conversation(args["messages"], args.get("response"))
+            else:
+                # Waits for room when the queue is full (backpressure)
+                await self._store_queue.put((namespace, args["messages"], args.get("response")))
+            return True
+
+        raise ValueError(f"Unknown operation: {op}")
+
+    async def _store_worker(self):
+        """Drain queued stores in batches of up to ``batch_size``."""
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self._store_queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._store_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._store_queue.task_done()
+
+    async def _write_batch(self, batch: List[_StoreItem]):
+        """
+        Write queued stores, one transaction per namespace.
+
+        Each namespace's stores are retried on their own, so a failing
+        namespace never causes stores already written for another one to be
+        written again.
+        """
+        by_namespace: Dict[Optional[str], List[Tuple[List[Dict[str, Any]], Any]]] = defaultdict(list)
+        for namespace, messages, response in batch:
+            by_namespace[namespace].append((messages, response))
+
+        for namespace, conversations in by_namespace.items():
+            if await self._write_with_retries(namespace, conversations):
+                self.batched_stores += len(conversations)
+        self.store_batches += 1
+
+    async def _write_with_retries(
+        self, namespace: Optional[str], conversations: List[Tuple[List[Dict[str, Any]], Any]]
+    ) -> bool:
+        """Write one namespace's stores, retrying with backoff; dropped if they keep failing."""
+        for attempt in range(self.store_retries + 1):
+            try:
+                await self._target(namespace)._store_conversation_batch(conversations)
+                return True
+            except Exception as e:
+                if attempt == self.store_retries:
+                    self.dropped_stores += len(conversations)
+                    logger.error(
+                        f"Dropped {len(conversations)} stores for namespace {namespace!r} "
+                        f"after {attempt + 1} failed writes: {e}"
+                    )
+                    return False
+                self.retried_batches += 1
+                delay = self.retry_delay * 2 ** attempt
+                logger.warning(
+                    f"Failed to write stores for namespace {namespace!r}, "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+        return False
+
+    @staticmethod
+    def _strip(memory: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop embeddings from memories sent over the wire."""
+        return {k: v for k, v in memory.items() if k != "embedding"}
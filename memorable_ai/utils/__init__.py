@@ -1,49 +1,35 @@
 """Utility functions and helpers."""
 
-from memorable_ai.utils.config import (
-    MemorableConfig,
-    DatabaseConfig,
-    GraphConfig,
-    MemoryConfig,
-    LLMConfig,
-)
-from memorable_ai.utils.validators import (
-    validate_connection_string,
-    validate_memory_type,
-    validate_mode,
-    sanitize_content,
-    validate_messages,
-)
-from memorable_ai.utils.helpers import (
-    generate_memory_id,
-    format_timestamp,
-    parse_timestamp,
-    chunk_text,
-    calculate_similarity,
-    merge_memories,
-)
-from memorable_ai.utils.logging_config import setup_logging, get_logger
-from memorable_ai.utils.performance import time_function, PerformanceMonitor
+from memorable_ai.utils.lazy import lazy_module
 
-__all__ = [
-    "MemorableConfig",
-    "DatabaseConfig",
-    "GraphConfig",
-    "MemoryConfig",
-    "LLMConfig",
-    "validate_connection_string",
-    "validate_memory_type",
-    "validate_mode",
-    "sanitize_content",
-    "validate_messages",
-    "generate_memory_id",
-    "format_timestamp",
-    "parse_timestamp",
-    "chunk_text",
-    "calculate_similarity",
-    "merge_memories",
-    "setup_logging",
-    "get_logger",
-    "time_function",
-    "PerformanceMonitor",
-]
+# Imported on first access (PEP 562) so that importing one utility (e.g. the
+# lazy export helper used by every package) does not load pydantic and the
+# others
+_LAZY_IMPORTS = {
+    "MemorableConfig": "memorable_ai.utils.config",
+    "DatabaseConfig": "memorable_ai.utils.config",
+    "GraphConfig": "memorable_ai.utils.config",
+    "MemoryConfig": "memorable_ai.utils.config",
+    "LLMConfig": "memorable_ai.utils.config",
+    "ServiceConfig": "memorable_ai.utils.config",
+    "validate_connection_string": "memorable_ai.utils.validators",
+    "validate_memory_type": "memorable_ai.utils.validators",
+    "validate_mode": "memorable_ai.utils.validators",
+    "sanitize_content": "memorable_ai.utils.validators",
+    "validate_messages": "memorable_ai.utils.validators",
+    "generate_memory_id": "memorable_ai.utils.helpers",
+    "format_timestamp": "memorable_ai.utils.helpers",
+    "parse_timestamp": "memorable_ai.utils.helpers",
+    "chunk_text": "memorable_ai.utils.helpers",
+    "calculate_similarity": "memorable_ai.utils.helpers",
+    "merge_memories": "memorable_ai.utils.helpers",
+    "serialize_response": "memorable_ai.utils.helpers",
+    "setup_logging": "memorable_ai.utils.logging_config",
+    "get_logger": "memorable_ai.utils.logging_config",
+    "time_function": "memorable_ai.utils.performance",
+    "PerformanceMonitor": "memorable_ai.utils.performance",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
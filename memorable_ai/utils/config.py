@@ -13,6 +13,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _parse_sizes(value: str) -> Dict[str, int]:
+    """Parse "namespace=size,namespace=size" into a dictionary."""
+    sizes = {}
+    for item in value.split(","):
+        if "=" in item:
+            namespace, size = item.rsplit("=", 1)
+            sizes[namespace.strip()] = int(size)
+    return sizes
+
+
 class DatabaseConfig(BaseModel):
     """Database configuration."""
 
@@ -28,7 +38,40 @@ class GraphConfig(BaseModel):
 
     enabled: bool = Field(default=False, description="Enable graph storage")
     connection_string: Optional[str] = Field(
-        default=None, description="Graph database connection string (Neo4j, etc.)"
+        default=None,
+        description="Graph database connection string (default: the memory database)",
+    )
+    backend: str = Field(
+        default="memory",
+        description=(
+            "Graph backend: 'memory' (networkx), 'csr' (compact in-process arrays) "
+            "or 'sql' (persisted in the memory database, shared by workers)"
+        ),
+    )
+    ranking: str = Field(
+        default="depth",
+        description="Graph result order: 'depth' (hop distance) or 'pagerank' (personalized PageRank)",
+    )
+    max_partitions: int = Field(
+        default=256,
+        description="Namespace graph partitions kept in memory (csr/memory backends, LRU)",
+    )
+    max_nodes: int = Field(
+        default=0, description="Graph node cap per namespace (0 = unlimited)"
+    )
+    max_edges: int = Field(
+        default=0, description="Graph edge cap per namespace (0 = unlimited)"
+    )
+    snapshot_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for binary graph snapshots and replay logs (csr backend)",
+    )
+    snapshot_interval: float = Field(
+        default=300.0, description="Seconds between periodic snapshots of a changed graph"
+    )
+    adjacency_cache_size: int = Field(
+        default=100000,
+        description="Entities kept in the in-process adjacency cache (0 traverses in SQL)",
     )
 
 
@@ -36,7 +79,8 @@ class MemoryConfig(BaseModel):
     """Memory engine configuration."""
 
     mode: str = Field(
-        default="auto", description="Memory mode: 'conscious', 'auto', or 'hybrid'"
+        default="auto",
+        description="Memory mode: 'conscious', 'auto', 'hybrid', or 'adaptive'",
     )
     namespace: Optional[str] = Field(
         default=None, description="Memory namespace for multi-tenant support"
@@ -47,6 +91,67 @@ class MemoryConfig(BaseModel):
     consolidation_interval: int = Field(
         default=21600, description="Memory consolidation interval in seconds (6 hours)"
     )
+    consolidation_lease_ttl: float = Field(
+        default=300.0,
+        description="Seconds a process holds a namespace's consolidation lease without renewal",
+    )
+    contradiction_threshold: float = Field(
+        default=0.8,
+        description="Embedding cosine similarity at which consolidation checks two memories "
+        "for contradiction",
+    )
+    duplicate_threshold: float = Field(
+        default=0.95,
+        description="Embedding cosine similarity at which consolidation treats memories "
+        "as duplicates",
+    )
+    session_cache_size: int = Field(
+        default=1024, description="Maximum number of sessions cached by conscious/hybrid modes"
+    )
+    session_cache_ttl: int = Field(
+        default=3600, description="Session cache entry TTL in seconds (0 disables expiry)"
+    )
+    session_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, description="Approximate session cache size budget in bytes"
+    )
+    session_cache_spill: bool = Field(
+        default=False, description="Spill evicted session cache entries to SQL storage"
+    )
+    drift_threshold: float = Field(
+        default=0.15, description="Cosine drift that triggers re-retrieval in adaptive mode"
+    )
+    compress_context: bool = Field(
+        default=False,
+        description="Merge near-duplicate memories into one line before injection",
+    )
+    compression_threshold: float = Field(
+        default=0.85, description="Embedding cosine similarity at which memories are merged"
+    )
+    context_layout: str = Field(
+        default="prepend",
+        description="Context injection layout: 'prepend' (one leading block) or "
+        "'stable' (prefix-stable, prompt-cache friendly)",
+    )
+    store_responses: bool = Field(
+        default=True,
+        description="Persist the (compact) LLM response with each stored conversation",
+    )
+    archive_importance: float = Field(
+        default=0.1, description="Stored importance below which idle memories are archived"
+    )
+    archive_after_days: float = Field(
+        default=0.0,
+        description="Days without access after which low-importance memories are archived "
+        "(0 disables)",
+    )
+    hot_tier_size: int = Field(
+        default=0, description="Memories kept in the hot table per namespace (0 = unlimited)"
+    )
+    hot_tier_sizes: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-namespace hot tier sizes overriding hot_tier_size "
+        "(\"\" for no namespace)",
+    )
 
 
 class LLMConfig(BaseModel):
@@ -65,6 +170,28 @@ class LLMConfig(BaseModel):
     )
 
 
+class ServiceConfig(BaseModel):
+    """Local memory service (daemon) configuration."""
+
+    address: Optional[str] = Field(
+        default=None,
+        description="Daemon address: unix socket path or tcp://host:port (default: per-user socket)",
+    )
+    enabled: bool = Field(
+        default=True, description="Use a running daemon when available"
+    )
+    timeout: float = Field(default=5.0, description="Request timeout in seconds")
+    remote: bool = Field(
+        default=False,
+        description="Forward MemoryEngine operations to the daemon instead of running in-process",
+    )
+    pool_size: int = Field(default=4, description="Idle daemon connections kept per process")
+    max_connect_failures: int = Field(
+        default=3,
+        description="Consecutive failed daemon connections before leaving remote mode",
+    )
+
+
 class MemorableConfig(BaseModel):
     """Main configuration for Memorable."""
 
@@ -72,6 +199,7 @@ class MemorableConfig(BaseModel):
     graph: GraphConfig = Field(default_factory=GraphConfig)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
+    service: ServiceConfig = Field(default_factory=ServiceConfig)
 
     @classmethod
     def from_env(cls) -> "MemorableConfig":
@@ -85,6 +213,16 @@ class MemorableConfig(BaseModel):
             graph=GraphConfig(
                 enabled=os.getenv("MEMORABLE_GRAPH__ENABLED", "false").lower() == "true",
                 connection_string=os.getenv("MEMORABLE_GRAPH__CONNECTION_STRING"),
+                backend=os.getenv("MEMORABLE_GRAPH__BACKEND", "memory"),
+                ranking=os.getenv("MEMORABLE_GRAPH__RANKING", "depth"),
+                max_partitions=int(os.getenv("MEMORABLE_GRAPH__MAX_PARTITIONS", "256")),
+                max_nodes=int(os.getenv("MEMORABLE_GRAPH__MAX_NODES", "0")),
+                max_edges=int(os.getenv("MEMORABLE_GRAPH__MAX_EDGES", "0")),
+                snapshot_dir=os.getenv("MEMORABLE_GRAPH__SNAPSHOT_DIR"),
+                snapshot_interval=float(os.getenv("MEMORABLE_GRAPH__SNAPSHOT_INTERVAL", "300")),
+                adjacency_cache_size=int(
+                    os.getenv("MEMORABLE_GRAPH__ADJACENCY_CACHE_SIZE", "100000")
+                ),
             ),
             memory=MemoryConfig(
                 mode=os.getenv("MEMORABLE_MEMORY__MODE", "auto"),
@@ -95,6 +233,51 @@ class MemorableConfig(BaseModel):
                 consolidation_interval=int(
                     os.getenv("MEMORABLE_MEMORY__CONSOLIDATION_INTERVAL", "21600")
                 ),
+                consolidation_lease_ttl=float(
+                    os.getenv("MEMORABLE_MEMORY__CONSOLIDATION_LEASE_TTL", "300")
+                ),
+                contradiction_threshold=float(
+                    os.getenv("MEMORABLE_MEMORY__CONTRADICTION_THRESHOLD", "0.8")
+                ),
+                duplicate_threshold=float(
+                    os.getenv("MEMORABLE_MEMORY__DUPLICATE_THRESHOLD", "0.95")
+                ),
+                session_cache_size=int(
+                    os.getenv("MEMORABLE_MEMORY__SESSION_CACHE_SIZE", "1024")
+                ),
+                session_cache_ttl=int(
+                    os.getenv("MEMORABLE_MEMORY__SESSION_CACHE_TTL", "3600")
+                ),
+                session_cache_max_bytes=int(
+                    os.getenv("MEMORABLE_MEMORY__SESSION_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+                ),
+                session_cache_spill=os.getenv(
+                    "MEMORABLE_MEMORY__SESSION_CACHE_SPILL", "false"
+                ).lower()
+                == "true",
+                drift_threshold=float(
+                    os.getenv("MEMORABLE_MEMORY__DRIFT_THRESHOLD", "0.15")
+                ),
+                compress_context=os.getenv(
+                    "MEMORABLE_MEMORY__COMPRESS_CONTEXT", "false"
+                ).lower()
+                == "true",
+                compression_threshold=float(
+                    os.getenv("MEMORABLE_MEMORY__COMPRESSION_THRESHOLD", "0.85")
+                ),
+                context_layout=os.getenv("MEMORABLE_MEMORY__CONTEXT_LAYOUT", "prepend"),
+                store_responses=os.getenv(
+                    "MEMORABLE_MEMORY__STORE_RESPONSES", "true"
+                ).lower()
+                == "true",
+                archive_importance=float(
+                    os.getenv("MEMORABLE_MEMORY__ARCHIVE_IMPORTANCE", "0.1")
+                ),
+                archive_after_days=float(
+                    os.getenv("MEMORABLE_MEMORY__ARCHIVE_AFTER_DAYS", "0")
+                ),
+                hot_tier_size=int(os.getenv("MEMORABLE_MEMORY__HOT_TIER_SIZE", "0")),
+                hot_tier_sizes=_parse_sizes(os.getenv("MEMORABLE_MEMORY__HOT_TIER_SIZES", "")),
             ),
             llm=LLMConfig(
                 openai_api_key=os.getenv("OPENAI_API_KEY")
@@ -107,6 +290,16 @@ class MemorableConfig(BaseModel):
                     "sentence-transformers/all-MiniLM-L6-v2",
                 ),
             ),
+            service=ServiceConfig(
+                address=os.getenv("MEMORABLE_SERVICE__ADDRESS"),
+                enabled=os.getenv("MEMORABLE_SERVICE__ENABLED", "true").lower() == "true",
+                timeout=float(os.getenv("MEMORABLE_SERVICE__TIMEOUT", "5.0")),
+                remote=os.getenv("MEMORABLE_SERVICE__REMOTE", "false").lower() == "true",
+                pool_size=int(os.getenv("MEMORABLE_SERVICE__POOL_SIZE", "4")),
+                max_connect_failures=int(
+                    os.getenv("MEMORABLE_SERVICE__MAX_CONNECT_FAILURES", "3")
+                ),
+            ),
         )
 
     @classmethod
@@ -3,6 +3,7 @@ Helper utilities for Memorable.
 """
 
 import hashlib
+import os
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
@@ -52,6 +53,38 @@ def parse_timestamp(timestamp_str: str) -> datetime:
     return datetime.fromisoformat(timestamp_str)
 
 
+def normalize_database_url(connection_string: Optional[str]) -> Optional[str]:
+    """
+    Canonical form of a database URL, for telling whether two refer to the same database.
+    
+    Relative SQLite paths are resolved against the current directory, so
+    ``sqlite:///memorable.db`` names a different database in every directory.
+    
+    Args:
+        connection_string: Database connection string
+        
+    Returns:
+        Connection string with an absolute SQLite path (others unchanged)
+    """
+    if not connection_string:
+        return connection_string
+    from sqlalchemy.engine import make_url
+
+    try:
+        url = make_url(connection_string)
+    except Exception:
+        return connection_string
+    database = url.database
+    if (
+        not url.drivername.startswith("sqlite")
+        or not database
+        or database == ":memory:"
+        or database.startswith("file:")
+    ):
+        return connection_string
+    return url.set(database=os.path.abspath(database)).render_as_string(hide_password=False)
+
+
 def chunk_text(text: str, max_length: int = 1000) -> List[str]:
     """
     Chunk text into smaller pieces.
@@ -146,3 +179,116 @@ def merge_memories(memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
     return merged
 
+
+
+# Fields kept by serialize_response; passed to pydantic's model_dump so that
+# the rest of a (possibly large) provider response is never copied
+_RESPONSE_INCLUDE = {
+    "id": True,
+    "model": True,
+    "role": True,
+    "content": True,
+    "usage": True,
+    "choices": {"__all__": {"text": True, "message": {"role", "content"}}},
+}
+
+
+def serialize_response(response: Any) -> Optional[Dict[str, Any]]:
+    """
+    Reduce an LLM response to the fields Memorable uses.
+    
+    Keeps id, model, role/content (OpenAI-style ``choices`` or
+    Anthropic-style content blocks) and token usage. Pydantic responses
+    (OpenAI, Anthropic, LiteLLM) are dumped with ``include`` so only those
+    fields are copied; dicts and other objects are read by attribute access.
+    
+    Args:
+        response: LLM response object, dict or string
+        
+    Returns:
+        Compact JSON-serializable dictionary, or None if there is no response
+    """
+    if response is None:
+        return None
+    if isinstance(response, str):
+        return {"choices": [{"message": {"role": "assistant", "content": response}}]}
+
+    if not isinstance(response, dict) and hasattr(response, "model_dump"):
+        try:
+            response = response.model_dump(include=_RESPONSE_INCLUDE)
+        except Exception:
+            pass
+
+    result: Dict[str, Any] = {}
+    for key in ("id", "model"):
+        value = _field(response, key)
+        if value is not None:
+            result[key] = str(value)
+
+    choices = _field(response, "choices")
+    if choices:
+        result["choices"] = [{"message": _choice_message(choice)} for choice in choices]
+    else:
+        content = _field(response, "content")
+        if content is not None:
+            result["role"] = _field(response, "role") or "assistant"
+            result["content"] = _text_blocks(content)
+
+    usage = _usage(_field(response, "usage"))
+    if usage:
+        result["usage"] = usage
+    return result
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read a field from a dict or an object."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _choice_message(choice: Any) -> Dict[str, str]:
+    """Role and text content of one OpenAI-style choice."""
+    message = _field(choice, "message")
+    if message is None:
+        # Legacy completions API
+        return {"role": "assistant", "content": str(_field(choice, "text") or "")}
+
+    content = _field(message, "content")
+    if isinstance(content, list):
+        content = " ".join(block["text"] for block in _text_blocks(content))
+    return {
+        "role": str(_field(message, "role") or "assistant"),
+        "content": str(content or ""),
+    }
+
+
+def _text_blocks(content: Any) -> List[Dict[str, str]]:
+    """Text blocks of Anthropic-style content (string or list of blocks)."""
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}]
+
+    blocks = []
+    for block in content or []:
+        text = block if isinstance(block, str) else _field(block, "text")
+        if text:
+            blocks.append({"type": "text", "text": str(text)})
+    return blocks
+
+
+def _usage(usage: Any) -> Dict[str, Any]:
+    """Numeric token counters of a usage object or dict."""
+    if usage is None:
+        return {}
+    if not isinstance(usage, dict):
+        if hasattr(usage, "model_dump"):
+            usage = usage.model_dump()
+        elif hasattr(usage, "__dict__"):
+            usage = vars(usage)
+        else:
+            return {}
+    return {
+        key: value
+        for key, value in usage.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
@@ -0,0 +1,39 @@
+"""
+Lazy package exports (PEP 562).
+
+Packages map their public names to the modules defining them, so that
+importing a package does not import the dependencies of every component.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module(
+    module_name: str, lazy_imports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module ``__getattr__`` and ``__dir__`` importing public names on first access.
+
+    Args:
+        module_name: Name of the package (``__name__``)
+        lazy_imports: Public name -> module defining it
+
+    Returns:
+        (__getattr__, __dir__) for the package
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        if name in lazy_imports:
+            value = getattr(importlib.import_module(lazy_imports[name]), name)
+            # Cache on the package so later lookups skip __getattr__
+            setattr(module, name, value)
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -55,7 +55,7 @@ def validate_mode(mode: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    valid_modes = ["conscious", "auto", "hybrid"]
+    valid_modes = ["conscious", "auto", "hybrid", "adaptive"]
     return mode in valid_modes
 
 
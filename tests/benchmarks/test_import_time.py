@@ -0,0 +1,48 @@
+"""
+Import-time regression tests: importing Memorable must stay lazy.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Modules only loaded once an engine actually needs them
+HEAVY_MODULES = [
+    "torch",
+    "sentence_transformers",
+    "sqlalchemy",
+    "networkx",
+    "numpy",
+    "openai",
+    "anthropic",
+    "litellm",
+]
+
+_PROBE = "{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+
+
+def _modules_after(statement):
+    """Modules loaded by a statement in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import memorable_ai", "from memorable_ai import MemoryEngine", "import memorable_ai.cli"],
+)
+def test_import_does_not_load_heavy_modules(statement):
+    loaded = _modules_after(statement)
+
+    assert not loaded & set(HEAVY_MODULES)
@@ -0,0 +1,93 @@
+"""
+Tests for drift-gated retrieval in adaptive mode.
+"""
+
+import asyncio
+
+from memorable_ai.core.storage import Storage
+from memorable_ai.modes.adaptive import AdaptiveMode
+
+EMBEDDINGS = {
+    "Where does Sparsh live?": [1.0, 0.0, 0.0],
+    "And since when?": [0.98, 0.2, 0.0],
+    "What is Sparsh's favourite food?": [0.0, 0.0, 1.0],
+}
+
+
+class _Model:
+    def encode(self, text):
+        return EMBEDDINGS[text]
+
+
+class _Retriever:
+    """HybridRetriever stand-in counting retrievals."""
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.embedding_model = _Model()
+        self.calls = 0
+
+    def _extract_query(self, messages):
+        return messages[-1]["content"]
+
+    async def retrieve(self, messages, limit=10, query_embedding=None):
+        self.calls += 1
+        return [{"id": self.calls, "content": f"retrieval {self.calls}"}]
+
+
+def _turn(mode, query, session="s1"):
+    return asyncio.run(mode.get_memories(session, [{"role": "user", "content": query}]))
+
+
+def _setup(tmp_path):
+    url = f"sqlite:///{tmp_path / 'memories.db'}"
+    retriever = _Retriever(Storage(url))
+    return AdaptiveMode(retriever, drift_threshold=0.15), retriever, url
+
+
+def test_follow_up_reuses_and_drift_retrieves(tmp_path):
+    mode, retriever, _ = _setup(tmp_path)
+
+    first = _turn(mode, "Where does Sparsh live?")
+    assert _turn(mode, "And since when?") == first
+    assert retriever.calls == 1
+
+    _turn(mode, "What is Sparsh's favourite food?")
+
+    stats = mode.get_stats()
+    assert retriever.calls == 2
+    assert stats["skips"] == 1
+    assert stats["drift_retrievals"] == 1
+
+
+def test_write_from_another_process_forces_retrieval(tmp_path):
+    mode, retriever, url = _setup(tmp_path)
+    _turn(mode, "Where does Sparsh live?")
+
+    # A second Storage on the same database stands in for another process
+    asyncio.run(Storage(url).store_memories([{"content": "Sparsh moved to Berlin"}]))
+    _turn(mode, "And since when?")
+
+    assert retriever.calls == 2
+    assert mode.get_stats()["write_retrievals"] == 1
+
+
+def test_own_conversation_store_is_absorbed(tmp_path):
+    mode, retriever, _ = _setup(tmp_path)
+    _turn(mode, "Where does Sparsh live?")
+
+    before = retriever.storage.get_write_version()
+    asyncio.run(retriever.storage.store_memories([{"content": "Sparsh lives in London"}]))
+    mode.absorb_write("s1", before, retriever.storage.get_write_version())
+    _turn(mode, "And since when?")
+
+    assert retriever.calls == 1
+
+
+def test_sessions_are_bounded(tmp_path):
+    mode, _, _ = _setup(tmp_path)
+    mode.max_sessions = 2
+    for session in ("a", "b", "c"):
+        _turn(mode, "Where does Sparsh live?", session=session)
+
+    assert mode.get_stats()["sessions"] == 2
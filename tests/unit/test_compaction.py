@@ -0,0 +1,97 @@
+"""
+Tests for memory compaction.
+"""
+
+import asyncio
+
+from memorable_ai.core.compaction import MemoryCompactor
+from memorable_ai.core.storage import Storage
+
+
+def _compact(tmp_path, *topics):
+    storage = Storage(f"sqlite:///{tmp_path / 'memories.db'}")
+    # Memories of one topic share an embedding: only polarity keeps them apart
+    memories = [
+        {"content": content, "type": "preference", "embedding": embedding}
+        for contents, embedding in zip(topics, ([1.0, 0.0], [0.0, 1.0]))
+        for content in contents
+    ]
+    asyncio.run(storage.store_memories(memories))
+    report = asyncio.run(MemoryCompactor(storage).compact())
+    remaining = asyncio.run(storage.scan_memories())
+    return report, [memory["content"] for memory in remaining]
+
+
+def test_contradicting_memories_are_never_merged(tmp_path):
+    diet = ["Sparsh is vegetarian", "Sparsh isn't vegetarian"]
+    travel = ["Sparsh likes flying", "Sparsh no longer likes flying"]
+
+    report, remaining = _compact(tmp_path, diet, travel)
+
+    assert report["removed"] == 0
+    assert remaining == diet + travel
+
+
+def test_equivalent_memories_are_merged(tmp_path):
+    report, remaining = _compact(
+        tmp_path, ["Sparsh isn't vegetarian", "Sparsh doesn't eat meat"], ["Sparsh likes tea"]
+    )
+
+    assert report["removed"] == 1
+    assert len(remaining) == 2
+    assert "Sparsh likes tea" in remaining
+
+
+def _storage(tmp_path, *memories):
+    storage = Storage(f"sqlite:///{tmp_path / 'memories.db'}")
+    asyncio.run(storage.store_memories(list(memories)))
+    return storage
+
+
+def test_dry_run_reports_without_merging(tmp_path):
+    storage = _storage(tmp_path, {"content": "Sparsh likes tea."}, {"content": "sparsh LIKES tea"})
+
+    report = asyncio.run(MemoryCompactor(storage).compact(dry_run=True))
+
+    assert report["clusters"] == 1 and report["duplicates"] == 1
+    assert report["removed"] == 0
+    assert len(asyncio.run(storage.scan_memories())) == 2
+
+
+def test_canonical_memory_keeps_the_most_important(tmp_path):
+    memories = [
+        {"content": "Sparsh likes tea", "importance_score": 0.2, "metadata": {"tags": ["a"]}},
+        {"content": "Sparsh likes tea!", "importance_score": 0.9, "metadata": {"tags": ["b"]}},
+    ]
+    storage = _storage(tmp_path, *memories)
+
+    report = asyncio.run(MemoryCompactor(storage).compact())
+
+    (remaining,) = asyncio.run(storage.scan_memories())
+    assert report["removed"] == 1
+    assert remaining["id"] == memories[1]["id"]
+    assert remaining["importance_score"] == 0.9
+    assert remaining["metadata"]["tags"] == ["a", "b"]
+    assert remaining["metadata"]["merged_ids"] == [memories[0]["id"]]
+
+
+def test_memories_of_different_types_are_not_merged(tmp_path):
+    storage = _storage(
+        tmp_path,
+        {"content": "Sparsh likes tea", "type": "fact"},
+        {"content": "Sparsh likes tea.", "type": "preference"},
+    )
+
+    report = asyncio.run(MemoryCompactor(storage).compact())
+
+    assert report["removed"] == 0
+
+
+def test_compaction_skips_a_leased_namespace(tmp_path):
+    storage = _storage(tmp_path, {"content": "Sparsh likes tea."}, {"content": "sparsh likes tea"})
+    assert storage.acquire_lease("consolidator", 300)
+
+    report = asyncio.run(MemoryCompactor(storage).compact())
+
+    assert report.get("skipped")
+    assert len(asyncio.run(storage.scan_memories())) == 2
@@ -0,0 +1,75 @@
+"""
+Tests for context compression.
+"""
+
+import asyncio
+
+import pytest
+
+from memorable_ai.core.consolidation import is_negated
+from memorable_ai.modes.compression import ContextCompressor
+
+
+def _memories(*contents):
+    # Identical embeddings: only polarity can keep memories apart
+    return [
+        {"id": index, "content": content, "embedding": [1.0, 0.0]}
+        for index, content in enumerate(contents, start=1)
+    ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "Sparsh isn't vegetarian",
+        "Sparsh doesn't eat meat",
+        "Sparsh can't swim",
+        "Sparsh won't move to Berlin",
+        "Sparsh wasn't at the meeting",
+        "Sparsh no longer lives in Berlin",
+        "Sparsh does not drink coffee",
+        "Sparsh never flies",
+    ],
+)
+def test_negations_are_detected(content):
+    assert is_negated(content)
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["Sparsh has another cat", "Sparsh noted the deadline", "Nothing changed for Sparsh"],
+)
+def test_words_containing_not_are_not_negations(content):
+    assert not is_negated(content)
+
+
+@pytest.mark.parametrize(
+    "negative",
+    ["Sparsh isn't vegetarian", "Sparsh is no longer vegetarian", "Sparsh is not vegetarian"],
+)
+def test_opposite_polarity_is_never_merged(negative):
+    compressed = asyncio.run(
+        ContextCompressor().compress(_memories("Sparsh is vegetarian", negative))
+    )
+
+    assert [memory["content"] for memory in compressed] == ["Sparsh is vegetarian", negative]
+    assert all("merged_ids" not in memory for memory in compressed)
+
+
+def test_same_polarity_is_merged():
+    compressed = asyncio.run(
+        ContextCompressor().compress(
+            _memories("Sparsh noted the deadline", "Sparsh noted the deadline.")
+        )
+    )
+
+    assert len(compressed) == 1
+    assert compressed[0]["merged_ids"] == [1, 2]
+
+
+def test_extractive_merge_keeps_an_added_negation():
+    merged = ContextCompressor._extractive_merge(
+        ["Sparsh lives in Berlin", "Sparsh no longer lives in Berlin"]
+    )
+
+    assert merged == "Sparsh lives in Berlin; Sparsh no longer lives in Berlin"
@@ -0,0 +1,36 @@
+"""
+Tests for memory consolidation.
+"""
+
+import asyncio
+
+import pytest
+
+from memorable_ai.core.consolidation import MemoryConsolidator
+from memorable_ai.core.storage import TYPE_WEIGHTS, Storage
+
+
+def _store(storage, content, importance):
+    memory = {
+        "content": content,
+        "type": "fact",
+        "importance_score": importance,
+        "embedding": [1.0, 0.0, 0.0],
+    }
+    asyncio.run(storage.store_memories([memory]))
+    return memory["id"]
+
+
+def test_contradiction_demotes_the_updated_score(tmp_path):
+    storage = Storage(f"sqlite:///{tmp_path / 'memories.db'}")
+    older = _store(storage, "Sparsh likes black coffee", 0.8)
+    newer = _store(storage, "Sparsh doesn't like black coffee", 0.8)
+    consolidator = MemoryConsolidator(storage, settle=0)
+
+    asyncio.run(consolidator.consolidate())
+
+    scores = {m["id"]: m["importance_score"] for m in asyncio.run(storage.scan_memories())}
+    updated = 0.8 * 0.5 * TYPE_WEIGHTS["fact"]
+    assert scores[newer] == pytest.approx(updated)
+    assert scores[older] == pytest.approx(updated * 0.5)
+    assert consolidator.get_stats()["contradictions"] == 1
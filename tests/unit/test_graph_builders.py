@@ -0,0 +1,66 @@
+"""
+Tests for the in-memory graph backends.
+"""
+
+import asyncio
+
+import pytest
+
+from memorable_ai.graph.builder import GraphBuilder
+from memorable_ai.graph.csr import CSRGraphBuilder
+
+BACKENDS = [GraphBuilder, CSRGraphBuilder]
+
+
+def _mentions(builder, entity):
+    if isinstance(builder, CSRGraphBuilder):
+        return builder._counts[builder.csr.node_id(entity, create=False)]
+    return builder.graph.nodes[entity]["count"]
+
+
+def _update(builder, *memories):
+    asyncio.run(builder.update_graph([dict(memory) for memory in memories]))
+
+
+MEMORY = {"id": 1, "content": "Sparsh works at Anthropic in London", "type": "fact"}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_repeated_memory_is_added_once(backend):
+    builder = backend()
+    _update(builder, MEMORY)
+    size = builder._size()
+
+    _update(builder, MEMORY)
+    _update(builder, MEMORY)
+
+    assert builder._size() == size
+    assert builder.counters.edges == size[1]
+    assert _mentions(builder, "Sparsh") == 1
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_new_memory_links_known_entities(backend):
+    builder = backend()
+    _update(builder, MEMORY, {"id": 2, "content": "Sparsh lives in London", "type": "fact"})
+
+    related = asyncio.run(builder.find_related("Where does Sparsh live?"))
+
+    assert sorted(memory["id"] for memory in related) == [1, 2]
+    assert _mentions(builder, "Sparsh") == 2
+
+
+def test_repeated_memory_does_not_protect_its_entities_from_pruning():
+    builder = CSRGraphBuilder()
+    _update(builder, {"id": 1, "content": "Sparsh visited Paris", "type": "fact"})
+    _update(builder, {"id": 2, "content": "Priya visited Rome", "type": "fact"})
+    _update(builder, {"id": 3, "content": "Priya visited Oslo", "type": "fact"})
+    for _ in range(3):
+        _update(builder, {"id": 1, "content": "Sparsh visited Paris", "type": "fact"})
+
+    assert _mentions(builder, "Sparsh") == 1
+
+    builder.prune(max_nodes=6)
+
+    assert "Priya" in builder._entity_names()
+    assert "Sparsh" not in builder._entity_names()
@@ -0,0 +1,186 @@
+"""
+Tests for the memory daemon client and remote-mode fallbacks.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from memorable_ai.core.errors import (
+    ServiceError,
+    ServiceResponseLostError,
+    ServiceUnavailableError,
+)
+from memorable_ai.core.memory_engine import MemoryEngine
+from memorable_ai.service import protocol
+from memorable_ai.service.client import MemoryClient
+
+
+class _Daemon:
+    """Line server answering each request with its op (or never answering)."""
+
+    def __init__(self, answer=True):
+        self.answer = answer
+        self.requests = []
+        self.connections = []
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.address = "tcp://127.0.0.1:%d" % self.sock.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        try:
+            for line in conn.makefile("rb"):
+                request = protocol.decode(line)
+                self.requests.append(request["op"])
+                if self.answer:
+                    conn.sendall(protocol.encode({"id": request["id"], "result": request["op"]}))
+        except OSError:
+            pass
+
+    def drop_connections(self):
+        """Close accepted connections, as a restarted daemon would."""
+        for conn in self.connections:
+            conn.shutdown(socket.SHUT_RDWR)
+            conn.close()
+        self.connections = []
+        time.sleep(0.05)
+
+    def close(self):
+        self.sock.close()
+        self.drop_connections()
+
+
+@pytest.fixture
+def daemon():
+    daemon = _Daemon()
+    yield daemon
+    daemon.close()
+
+
+def _closed_address():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return f"tcp://127.0.0.1:{port}"
+
+
+def test_stale_pooled_connection_is_replaced(daemon):
+    client = MemoryClient(daemon.address)
+    assert client.call("ping") == "ping"
+
+    daemon.drop_connections()
+
+    assert client.call("search") == "search"
+    assert daemon.requests == ["ping", "search"]
+
+
+def test_unreachable_daemon_raises_unavailable():
+    with pytest.raises(ServiceUnavailableError) as error:
+        MemoryClient(_closed_address()).call("store")
+
+    assert not isinstance(error.value, ServiceResponseLostError)
+
+
+def test_timeout_after_sending_raises_response_lost():
+    daemon = _Daemon(answer=False)
+    try:
+        with pytest.raises(ServiceResponseLostError):
+            MemoryClient(daemon.address, timeout=0.2).call("store")
+        assert daemon.requests == ["store"]
+    finally:
+        daemon.close()
+
+
+class _Remote:
+    """MemoryClient stand-in failing every call with one error."""
+
+    def __init__(self, error):
+        self.error = error
+        self.calls = []
+        self.closed = False
+
+    def call(self, op, **args):
+        self.calls.append(op)
+        raise self.error
+
+    def close(self):
+        self.closed = True
+
+
+def _engine(tmp_path, error):
+    engine = MemoryEngine(database=f"sqlite:///{tmp_path / 'memories.db'}")
+    engine._remote = _Remote(error)
+    return engine
+
+
+def test_lost_write_is_not_repeated_in_process(tmp_path):
+    engine = _engine(tmp_path, ServiceResponseLostError("timed out"))
+
+    asyncio.run(engine.add_memory("Sparsh likes tea"))
+
+    assert engine._storage is None
+    assert engine._remote is not None
+
+
+def test_lost_read_runs_in_process_and_stays_remote(tmp_path):
+    engine = _engine(tmp_path, ServiceResponseLostError("timed out"))
+
+    assert asyncio.run(engine.search_memories("tea")) == []
+    assert engine._storage is not None
+    assert engine._remote is not None
+
+
+def test_remote_mode_is_left_after_repeated_connect_failures(tmp_path):
+    engine = _engine(tmp_path, ServiceUnavailableError("connection refused"))
+    remote = engine._remote
+
+    for _ in range(engine.config.service.max_connect_failures - 1):
+        assert "remote" not in engine.get_stats()
+        assert engine._remote is remote
+
+    engine.get_stats()
+
+    assert engine._remote is None
+    assert remote.closed
+
+
+def test_daemon_errors_keep_remote_mode(tmp_path):
+    engine = _engine(tmp_path, ServiceError("StorageError: disk full"))
+
+    assert asyncio.run(engine.search_memories("tea")) == []
+    assert engine._storage is None
+    assert engine._remote is not None
+
+
+def test_concurrent_fallbacks_initialize_components_once(tmp_path):
+    engine = MemoryEngine(database=f"sqlite:///{tmp_path / 'memories.db'}")
+    initialized = []
+
+    def initialize_components():
+        initialized.append(True)
+        time.sleep(0.05)
+        engine._storage = object()
+
+    engine._initialize_components = initialize_components
+    threads = [threading.Thread(target=engine._ensure_components) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(initialized) == 1
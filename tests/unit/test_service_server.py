@@ -0,0 +1,102 @@
+"""
+Tests for the memory daemon: store batching, retries and ping.
+"""
+
+import asyncio
+import os
+
+from memorable_ai.service.server import MemoryServer
+from memorable_ai.utils.config import MemorableConfig
+from memorable_ai.utils.helpers import normalize_database_url
+
+
+class _Namespace:
+    """Engine view recording written conversations, failing the first writes."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.writes = []
+
+    async def _store_conversation_batch(self, conversations):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database is locked")
+        self.writes.append(conversations)
+
+
+class _Pool:
+    """MemoryEnginePool stand-in."""
+
+    def __init__(self, **failures):
+        self.config = MemorableConfig()
+        self.views = {}
+        self.failures = failures
+
+    def namespace(self, name):
+        if name not in self.views:
+            self.views[name] = _Namespace(self.failures.get(name, 0))
+        return self.views[name]
+
+
+def _store(namespace, text):
+    return (namespace, [{"role": "user", "content": text}], None)
+
+
+def test_failed_namespace_is_retried_alone():
+    pool = _Pool(b=1)
+    server = MemoryServer(pool, store_retries=2, retry_delay=0)
+
+    asyncio.run(server._write_batch([_store("a", "one"), _store("b", "two"), _store("a", "three")]))
+
+    assert len(pool.views["a"].writes) == 1
+    assert len(pool.views["a"].writes[0]) == 2
+    assert len(pool.views["b"].writes) == 1
+    assert server.retried_batches == 1
+    assert server.batched_stores == 3
+    assert server.dropped_stores == 0
+
+
+def test_stores_are_dropped_after_retries():
+    pool = _Pool(b=5)
+    server = MemoryServer(pool, store_retries=2, retry_delay=0)
+
+    asyncio.run(server._write_batch([_store("a", "one"), _store("b", "two")]))
+
+    assert len(pool.views["a"].writes) == 1
+    assert pool.views["b"].writes == []
+    assert server.retried_batches == 2
+    assert server.dropped_stores == 1
+    assert server.batched_stores == 1
+
+
+def test_queued_stores_are_written_in_one_batch():
+    pool = _Pool()
+    server = MemoryServer(pool, batch_size=8, batch_window=0.05)
+
+    async def run():
+        server._store_queue = asyncio.Queue(maxsize=server.max_queued_stores)
+        server._store_task = asyncio.create_task(server._store_worker())
+        for index in range(5):
+            assert await server._dispatch(
+                "store", {"namespace": "a", "messages": [{"role": "user", "content": str(index)}]}
+            )
+        await server._store_queue.join()
+        server._store_task.cancel()
+
+    asyncio.run(run())
+
+    assert server.store_batches == 1
+    assert [len(write) for write in pool.views["a"].writes] == [5]
+
+
+def test_ping_reports_absolute_sqlite_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pool = _Pool()
+    pool.config.database.connection_string = "sqlite:///memorable.db"
+
+    info = asyncio.run(MemoryServer(pool)._dispatch("ping", {}))
+
+    assert info["database"] == f"sqlite:///{tmp_path / 'memorable.db'}"
+    assert normalize_database_url("sqlite:///memorable.db") == info["database"]
+    assert normalize_database_url(f"sqlite:///{tmp_path}/./memorable.db") == info["database"]
+    assert os.path.isabs(info["database"][len("sqlite:///"):])
@@ -0,0 +1,72 @@
+"""
+Tests for the bounded session cache of conscious and hybrid modes.
+"""
+
+from memorable_ai.core.storage import Storage
+from memorable_ai.modes import session_cache
+from memorable_ai.modes.session_cache import SessionCache
+
+
+def _memories(text, count=1):
+    return [{"id": index, "content": text, "embedding": [0.1] * 8} for index in range(count)]
+
+
+def test_least_recently_used_session_is_evicted():
+    cache = SessionCache(max_entries=2)
+    cache.set("a", _memories("alpha"))
+    cache.set("b", _memories("bravo"))
+    assert cache.get("a") is not None
+
+    cache.set("c", _memories("charlie"))
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_byte_budget_is_enforced():
+    cache = SessionCache(max_entries=100, max_bytes=500)
+    for session in "abcdef":
+        cache.set(session, _memories("x" * 100))
+
+    stats = cache.get_stats()
+    assert stats["bytes"] <= 500
+    assert stats["entries"] < 6
+    assert "f" in cache
+
+
+def test_embeddings_are_not_cached():
+    cache = SessionCache()
+    cache.set("a", _memories("alpha"))
+
+    assert "embedding" not in cache.get("a")[0]
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(session_cache.time, "monotonic", lambda: now[0])
+    cache = SessionCache(ttl=60)
+    cache.set("a", _memories("alpha"))
+
+    now[0] += 61
+
+    assert cache.get("a") is None
+    stats = cache.get_stats()
+    assert stats["expirations"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 0 and stats["bytes"] == 0
+
+
+def test_evicted_sessions_are_spilled_and_reloaded(tmp_path):
+    storage = Storage(f"sqlite:///{tmp_path / 'memories.db'}")
+    cache = SessionCache(max_entries=1, spill_storage=storage)
+    cache.set("a", _memories("alpha"))
+    cache.set("b", _memories("bravo"))
+    assert "a" not in cache
+
+    reloaded = cache.get("a")
+
+    assert [memory["content"] for memory in reloaded] == ["alpha"]
+    stats = cache.get_stats()
+    assert stats["spills"] >= 1
+    assert stats["spill_hits"] == 1
@@ -0,0 +1,96 @@
+"""
+Tests for hot/archive tiering of memories.
+"""
+
+import asyncio
+import sqlite3
+
+from memorable_ai.core.storage import Storage, temporal_links
+
+
+def _storage(tmp_path, name="memories.db"):
+    return Storage(f"sqlite:///{tmp_path / name}")
+
+
+def _store(storage, *contents):
+    memories = [{"content": content, "type": "fact"} for content in contents]
+    asyncio.run(storage.store_memories(memories))
+    return [memory["id"] for memory in memories]
+
+
+def test_deleted_newest_id_is_not_reused_for_archived_memory(tmp_path):
+    storage = _storage(tmp_path)
+    ids = _store(storage, "alpha", "bravo", "charlie", "delta", "echo")
+    assert asyncio.run(storage.archive_memories(hot_size=1)) == 4
+
+    asyncio.run(storage.delete_memory(ids[-1]))
+    (new_id,) = _store(storage, "foxtrot")
+
+    assert new_id > max(ids)
+    assert asyncio.run(storage.promote_memories(ids[:4])) == 4
+    hot = {memory["id"] for memory in asyncio.run(storage.scan_memories())}
+    assert hot == set(ids[:4]) | {new_id}
+
+
+def test_search_archive_after_delete_and_insert(tmp_path):
+    storage = _storage(tmp_path)
+    ids = _store(storage, "alpha", "bravo", "charlie")
+    asyncio.run(storage.archive_memories(hot_size=1))
+    asyncio.run(storage.delete_memory(ids[-1]))
+    _store(storage, "delta")
+
+    results = asyncio.run(storage.search_archive("alpha"))
+
+    assert [memory["id"] for memory in results] == [ids[0]]
+
+
+def test_legacy_table_is_rebuilt_with_autoincrement(tmp_path):
+    path = tmp_path / "legacy.db"
+    storage = _storage(tmp_path, "legacy.db")
+    ids = _store(storage, "alpha", "bravo", "charlie")
+    asyncio.run(storage.archive_memories(hot_size=1))
+    storage.engine.dispose()
+
+    # Recreate the memories table as older releases did (no AUTOINCREMENT)
+    connection = sqlite3.connect(path)
+    schema = connection.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'memories'"
+    ).fetchone()[0]
+    connection.executescript(
+        "ALTER TABLE memories RENAME TO old;"
+        + schema.replace(" AUTOINCREMENT", "")
+        + "; INSERT INTO memories SELECT * FROM old; DROP TABLE old;"
+        + " DELETE FROM sqlite_sequence;"
+    )
+    connection.close()
+
+    storage = _storage(tmp_path, "legacy.db")
+    asyncio.run(storage.delete_memory(ids[-1]))
+    (new_id,) = _store(storage, "delta")
+
+    assert new_id > max(ids)
+    assert asyncio.run(storage.promote_memories(ids[:2])) == 2
+
+
+def test_deleting_archived_memory_bumps_write_version(tmp_path):
+    storage = _storage(tmp_path)
+    ids = _store(storage, "alpha", "bravo")
+    asyncio.run(storage.archive_memories(hot_size=1))
+    version = storage.get_write_version()
+
+    asyncio.run(storage.delete_memory(ids[0]))
+
+    assert storage.get_write_version() > version
+    assert asyncio.run(storage.search_archive("alpha")) == []
+
+
+def test_temporal_sequence_from_archived_memory(tmp_path):
+    storage = _storage(tmp_path)
+    first, second, third = _store(storage, "alpha", "bravo", "charlie")
+    asyncio.run(storage.store_temporal_edges(temporal_links(second, [first], [third])))
+    asyncio.run(storage.archive_memories(hot_size=2))
+
+    sequence = asyncio.run(storage.get_temporal_sequence(first))
+
+    assert [memory["id"] for memory in sequence] == [first, second, third]
+    assert first in {memory["id"] for memory in asyncio.run(storage.scan_memories())}